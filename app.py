@@ -1,10 +1,13 @@
+import os
+
 import gradio as gr
-from src.data_manager import initialize_data
+from src.backup import start_backup_scheduler
+from src.data_manager import initialize_data, start_search_index_warmup
 from src.node_functions import (
-    get_nodes_dataframe,
     add_keyword,
+    suggest_keywords,
+    apply_keyword_suggestion,
     create_node,
-    filter_nodes_multi,
 )
 from src.idea_functions import (
     get_ideas_dataframe,
@@ -19,6 +22,8 @@ from src.ui_handlers import (
     handle_edit_node,
     handle_delete_node,
     filter_ideas,
+    filter_view_nodes,
+    filter_idea_nodes,
     refresh_and_clear_status,
     refresh_idea_nodes,
 )
@@ -26,6 +31,10 @@ from src.about_content import get_about_content
 
 # 앱 시작 시 데이터 초기화
 initialize_data()
+# 전문 검색 색인은 백그라운드에서 미리 생성 (archive 방식의 아이디어 색인은 첫 검색 때)
+start_search_index_warmup()
+# 데이터 디렉토리 증분 백업 예약 (GGGIS_BACKUP_INTERVAL_MINUTES)
+start_backup_scheduler()
 
 # Gradio 인터페이스 구성
 with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
@@ -72,6 +81,12 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
                         scale=1,
                     )
 
+                keyword_suggestions = gr.Radio(
+                    label="추천 키워드 (기존 태그, 사용 노드 수)",
+                    choices=[],
+                    visible=False,
+                )
+
                 tags_display = gr.Textbox(
                     label="추가된 키워드",
                     interactive=False,
@@ -96,6 +111,19 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
                 outputs=[tags_display, keyword_input, keyword_status],
             )
 
+            # 입력 중인 키워드로 기존 태그 추천, 선택하면 입력란을 채움
+            keyword_input.change(
+                suggest_keywords,
+                inputs=[keyword_input],
+                outputs=[keyword_suggestions],
+                show_progress="hidden",
+            )
+            keyword_suggestions.input(
+                apply_keyword_suggestion,
+                inputs=[keyword_suggestions, keyword_input],
+                outputs=[keyword_input],
+            )
+
             create_btn.click(
                 create_node,
                 inputs=[title_input, description_input, tenant_input, tags_display],
@@ -117,8 +145,8 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
             # 필터링 옵션들
             with gr.Row():
                 search_input = gr.Textbox(
-                    label="🔍 노드 이름 검색",
-                    placeholder="검색할 노드 이름을 입력하세요...",
+                    label="🔍 노드 검색 (제목·설명·태그) / 태그 쿼리",
+                    placeholder="검색어 또는 태그 쿼리 (예: (AI OR 데이터) AND NOT 하드웨어 AND tenant:국민대)",
                     scale=2,
                 )
 
@@ -136,8 +164,9 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
                     scale=1,
                 )
 
+            # 초기에는 빈 표 (탭을 누를 때 채움, 샤드 저장 방식에서 시작 시 모든 샤드를
+            # 읽지 않도록)
             nodes_dataframe = gr.Dataframe(
-                value=get_nodes_dataframe(),
                 headers=["생성일자", "노드 이름", "테넌트", "설명", "태그"],
                 interactive=False,
                 wrap=False,
@@ -164,7 +193,7 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
                 )
 
             # 편집/삭제 관련 UI
-            selected_node_index = gr.State(-1)  # 선택된 노드 인덱스
+            selected_node_id = gr.State("")  # 선택된 노드 ID
 
             with gr.Row():
                 edit_node_btn = gr.Button(
@@ -179,23 +208,28 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
             )
 
             # 이벤트 연결 - 모든 필터 변경 시 실시간 필터링
-            for filter_component in [search_input, tenant_filter, tag_filter]:
-                filter_component.change(
-                    filter_nodes_multi,
-                    inputs=[search_input, tenant_filter, tag_filter],
-                    outputs=[nodes_dataframe],
-                )
+            # 세 필터의 변경을 하나의 이벤트로 묶고, 몰려 온 변경은 filter_view_nodes에서
+            # 마지막 값으로 한 번만 계산 (기다리는 이벤트가 서로를 막지 않도록 동시 실행 허용)
+            gr.on(
+                triggers=[search_input.change, tenant_filter.change, tag_filter.change],
+                fn=filter_view_nodes,
+                inputs=[search_input, tenant_filter, tag_filter],
+                outputs=[nodes_dataframe, tenant_filter, tag_filter],
+                trigger_mode="multiple",
+                concurrency_limit=None,
+            )
 
             # 노드 선택 이벤트
             nodes_dataframe.select(
                 fn=handle_node_selection,
+                inputs=[search_input, tenant_filter, tag_filter],
                 outputs=[
                     selected_node_title,
                     selected_node_description,
                     selected_node_tenant,
                     selected_node_tags,
                     selected_node_created_at,
-                    selected_node_index,
+                    selected_node_id,
                     edit_node_btn,
                     delete_node_btn,
                     node_action_status,
@@ -206,7 +240,7 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
             edit_node_btn.click(
                 fn=handle_edit_node,
                 inputs=[
-                    selected_node_index,
+                    selected_node_id,
                     selected_node_title,
                     selected_node_description,
                     selected_node_tenant,
@@ -221,7 +255,7 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
             # 노드 삭제 이벤트
             delete_node_btn.click(
                 fn=handle_delete_node,
-                inputs=[selected_node_index],
+                inputs=[selected_node_id],
                 outputs=[
                     node_action_status,
                     nodes_dataframe,
@@ -265,8 +299,8 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
             # 노드 필터링 옵션들
             with gr.Row():
                 idea_node_search_input = gr.Textbox(
-                    label="🔍 노드 이름 검색",
-                    placeholder="검색할 노드 이름을 입력하세요...",
+                    label="🔍 노드 검색 (제목·설명·태그) / 태그 쿼리",
+                    placeholder="검색어 또는 태그 쿼리 (예: (AI OR 데이터) AND NOT 하드웨어 AND tenant:국민대)",
                     scale=2,
                 )
 
@@ -284,8 +318,8 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
                     scale=1,
                 )
 
+            # 초기에는 빈 표 (탭을 누를 때 채움)
             idea_nodes_dataframe = gr.Dataframe(
-                value=get_nodes_dataframe(),
                 headers=["생성일자", "노드 이름", "테넌트", "설명", "태그"],
                 interactive=False,
                 wrap=False,
@@ -310,20 +344,22 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
             # 이벤트 연결
 
             # 노드 필터링 이벤트들
-            for filter_component in [
-                idea_node_search_input,
-                idea_tenant_filter,
-                idea_tag_filter,
-            ]:
-                filter_component.change(
-                    filter_nodes_multi,
-                    inputs=[
-                        idea_node_search_input,
-                        idea_tenant_filter,
-                        idea_tag_filter,
-                    ],
-                    outputs=[idea_nodes_dataframe],
-                )
+            gr.on(
+                triggers=[
+                    idea_node_search_input.change,
+                    idea_tenant_filter.change,
+                    idea_tag_filter.change,
+                ],
+                fn=filter_idea_nodes,
+                inputs=[
+                    idea_node_search_input,
+                    idea_tenant_filter,
+                    idea_tag_filter,
+                ],
+                outputs=[idea_nodes_dataframe, idea_tenant_filter, idea_tag_filter],
+                trigger_mode="multiple",
+                concurrency_limit=None,
+            )
 
             chatgpt_btn.click(
                 generate_idea_with_chatgpt,
@@ -375,8 +411,8 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
 
             # 검색 필드
             idea_search_input = gr.Textbox(
-                label="🔍 공모전 제목 또는 아이디어 제목 검색",
-                placeholder="검색할 제목을 입력하세요...",
+                label="🔍 아이디어 검색 (제목, 공모전, 개요, 솔루션, 구현방안 등 전체 내용)",
+                placeholder="검색어를 입력하세요 (예: IoT 센서 네트워크, 초성 검색 가능: ㄱㅁㅈ)",
                 scale=2,
             )
 
@@ -433,7 +469,7 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
                 )
 
             # 삭제 관련 UI
-            selected_idea_index = gr.State(-1)  # 선택된 아이디어 인덱스
+            selected_idea_id = gr.State("")  # 선택된 아이디어 ID
 
             with gr.Row():
                 delete_idea_btn = gr.Button(
@@ -450,10 +486,13 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
                 fn=filter_ideas,
                 inputs=[idea_search_input],
                 outputs=[ideas_dataframe],
+                trigger_mode="multiple",
+                concurrency_limit=None,
             )
 
             ideas_dataframe.select(
                 fn=handle_idea_selection,
+                inputs=[idea_search_input],
                 outputs=[
                     selected_title,
                     contest_info_display,
@@ -465,7 +504,7 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
                     used_nodes_display,
                     used_filters_display,
                     rationale_display,
-                    selected_idea_index,
+                    selected_idea_id,
                     delete_idea_btn,
                     delete_status,
                 ],
@@ -473,7 +512,7 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
 
             delete_idea_btn.click(
                 fn=handle_delete_idea,
-                inputs=[selected_idea_index],
+                inputs=[selected_idea_id],
                 outputs=[
                     delete_status,
                     ideas_dataframe,
@@ -548,47 +587,7 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
             selected_node_tenant,
             selected_node_tags,
             selected_node_created_at,
-            selected_node_index,
-            edit_node_btn,
-            delete_node_btn,
-            node_action_status,
-        ],
-    )
-
-    # AI 아이디어 생성 탭 클릭시 상태 초기화 및 노드 필터 초기화
-    idea_generation_tab.select(
-        fn=refresh_idea_nodes,
-        outputs=[
-            idea_nodes_dataframe,
-            idea_node_search_input,
-            idea_tenant_filter,
-            idea_tag_filter,
-            create_status,
-        ],
-    )
-
-    # 노드 입력하기 탭 클릭시 아이디어 생성 상태, 노드 생성 상태만 초기화
-    node_input_tab.select(
-        fn=lambda: ("", ""),
-        outputs=[idea_generation_status, create_status],
-    )
-
-    # 내 노드 확인하기 탭 클릭시 자동 새로고침 및 상태 초기화
-    node_view_tab.select(
-        fn=refresh_and_clear_status,
-        outputs=[
-            nodes_dataframe,
-            search_input,
-            tenant_filter,
-            tag_filter,
-            idea_generation_status,
-            create_status,
-            selected_node_title,
-            selected_node_description,
-            selected_node_tenant,
-            selected_node_tags,
-            selected_node_created_at,
-            selected_node_index,
+            selected_node_id,
             edit_node_btn,
             delete_node_btn,
             node_action_status,
@@ -597,4 +596,10 @@ with gr.Blocks(title="", theme=gr.themes.Soft()) as demo:
 
 # 앱 실행
 if __name__ == "__main__":
-    demo.launch(share=False, debug=True, server_name="0.0.0.0", server_port=7860)
+    # 여러 워커를 띄울 때는 워커마다 GGGIS_PORT를 다르게 지정 (GGGIS_MULTI_WORKER=1)
+    demo.launch(
+        share=False,
+        debug=True,
+        server_name="0.0.0.0",
+        server_port=int(os.getenv("GGGIS_PORT", "7860")),
+    )
@@ -0,0 +1,118 @@
+"""
+증분 백업의 첫 백업 시간/크기와 아이디어 3건 추가 후 백업의 시간/증가량
+
+    python -m benchmarks.backup_increment [아이디어 수] [저장 방식...]
+
+기본값: 아이디어 10,000건 (고정 시드), json/archive/journal/sqlite 방식
+저장 방식마다 새 프로세스에서 실행 (data_manager는 설정을 import 시점에 읽음)
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.common import make_ideas, prose, rng, vocabulary, work_dir
+
+IDEAS = 10_000
+MODES = ("json", "archive", "journal", "sqlite")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def dir_mb(path):
+    return (
+        sum(
+            os.path.getsize(os.path.join(root, name))
+            for root, _, names in os.walk(path)
+            for name in names
+        )
+        / 1e6
+    )
+
+
+def run_mode(mode, ideas):
+    """새 프로세스 안에서 실행: 결과를 JSON 한 줄로 출력"""
+    os.environ["GGGIS_STORAGE_MODE"] = mode
+    os.environ["GGGIS_WRITE_BEHIND_SECONDS"] = "0"
+    os.environ["GGGIS_IDEA_HOT_DAYS"] = "0"
+    work_dir()
+    os.makedirs("data")
+    with open(os.path.join("data", "ideas_data.json"), "w", encoding="utf-8") as f:
+        json.dump(make_ideas(ideas), f, ensure_ascii=False, indent=2)
+
+    import src.backup as backup
+    import src.data_manager as dm
+
+    dm.initialize_data()
+    dm.flush()
+
+    start = time.perf_counter()
+    backup.create_backup()
+    full = time.perf_counter() - start
+    full_mb = dir_mb(dm.BACKUP_DIR)
+
+    # 수정 시각이 같은 초에 머물지 않도록 잠시 기다린 뒤 변경
+    time.sleep(1.1)
+    r = rng(7)
+    words = vocabulary(r)
+    for k in range(3):
+        dm.add_idea(
+            {
+                "title": f"새 아이디어 {k}",
+                "overview": prose(r, words, 40),
+                "solution": prose(r, words, 150),
+                "created_at": "2026-10-17 10:00:00",
+            }
+        )
+    dm.flush()
+    start = time.perf_counter()
+    result = backup.create_backup()
+    increment = time.perf_counter() - start
+    print(
+        json.dumps(
+            {
+                "data_mb": dir_mb(dm.DATA_DIR),
+                "full": full,
+                "full_mb": full_mb,
+                "increment": increment,
+                "grew_kb": (dir_mb(dm.BACKUP_DIR) - full_mb) * 1000,
+                "new_chunks": result["new_chunks"],
+            }
+        )
+    )
+
+
+def main():
+    ideas = int(sys.argv[1]) if len(sys.argv) > 1 else IDEAS
+    modes = sys.argv[2:] or MODES
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    print(f"ideas {ideas:,}")
+    for mode in modes:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.backup_increment",
+                "--run",
+                mode,
+                str(ideas),
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        r = json.loads(output.strip().splitlines()[-1])
+        print(
+            f"  {mode:8} data {r['data_mb']:6.1f}MB: full {r['full']:5.2f}s "
+            f"({r['full_mb']:.1f}MB) -> +3 ideas {r['increment']:5.2f}s, "
+            f"store +{r['grew_kb']:.0f}KB ({r['new_chunks']} new chunks)"
+        )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run_mode(sys.argv[2], int(sys.argv[3]))
+    else:
+        main()
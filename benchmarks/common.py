@@ -0,0 +1,125 @@
+"""
+벤치마크 공통 도우미: 고정 시드의 합성 데이터와 시간/메모리 측정
+
+모든 벤치마크는 저장소 루트에서 `python -m benchmarks.<이름>`으로 실행하며,
+임시 디렉토리에서 data/를 만들어 측정하므로 실제 data/는 건드리지 않음
+"""
+
+import os
+import random
+import resource
+import statistics
+import tempfile
+import time
+
+SEED = 20240101
+CREATED_AT = "2026-10-01 10:00:00"
+
+_JOSA = ["", "을", "를", "이", "가", "의", "에서", "으로", "와", "한"]
+_STEMS = [
+    "데이터",
+    "분석",
+    "웹",
+    "서버",
+    "보안",
+    "앱",
+    "클라우드",
+    "AI",
+    "모델",
+    "플랫폼",
+]
+
+
+def rng(seed=SEED):
+    return random.Random(seed)
+
+
+def vocabulary(r, size=4000):
+    """한글 음절을 이어 만든 단어 목록 (실제 글처럼 길이 1~4 음절)"""
+    syllables = [chr(0xAC00 + i) for i in range(0, 11172, 7)]
+    words = [
+        "".join(r.choice(syllables) for _ in range(r.randint(1, 4)))
+        for _ in range(size)
+    ]
+    return _STEMS + words
+
+
+def prose(r, words, count):
+    """조사가 붙은 단어 count개로 된 문장"""
+    return " ".join(r.choice(words) + r.choice(_JOSA) for _ in range(count))
+
+
+def make_nodes(count, seed=SEED, tenants=15, tags=300):
+    r = rng(seed)
+    words = vocabulary(r)
+    tag_names = [f"태그{i}" for i in range(tags)]
+    return [
+        {
+            "id": f"N{k:08d}",
+            "title": f"{r.choice(_STEMS)} {prose(r, words, 2)}",
+            "description": prose(r, words, r.randint(15, 60)),
+            "tenant": f"T{k % tenants}",
+            "tags": r.sample(tag_names, 4),
+            "created_at": CREATED_AT,
+        }
+        for k in range(count)
+    ]
+
+
+def make_ideas(count, seed=SEED):
+    r = rng(seed + 1)
+    words = vocabulary(r)
+    contests = [f"공모전 {i}" for i in range(50)]
+    return [
+        {
+            "id": f"I{k:08d}",
+            "title": prose(r, words, 4),
+            "overview": prose(r, words, 40),
+            "problem": prose(r, words, 80),
+            "solution": prose(r, words, 150),
+            "implementation": prose(r, words, 80),
+            "expected_effect": prose(r, words, 40),
+            "rationale": prose(r, words, 40),
+            "ai_name": "ChatGPT",
+            "contest_info": {"title": r.choice(contests)},
+            "created_at": CREATED_AT,
+        }
+        for k in range(count)
+    ]
+
+
+def work_dir():
+    """임시 디렉토리로 이동하고 그 경로 반환 (data_manager는 상대 경로 data/를 씀)"""
+    path = tempfile.mkdtemp(prefix="gggis-bench-")
+    os.chdir(path)
+    return path
+
+
+def best_of(func, repeat=3):
+    """repeat번 실행 중 가장 빠른 시간(초)과 마지막 결과"""
+    best, result = None, None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func()
+        elapsed = time.perf_counter() - start
+        best = elapsed if best is None else min(best, elapsed)
+    return best, result
+
+
+def median_ms(func, repeat=20):
+    """repeat번 실행 시간의 중앙값(ms)"""
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def peak_rss_mb():
+    """이 프로세스의 최대 RSS(MB), 메모리 비교는 측정마다 새 프로세스로"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def file_mb(path):
+    return os.path.getsize(path) / 1e6
@@ -0,0 +1,78 @@
+"""
+큰 JSON 데이터 파일을 통째로 읽을 때와 레코드 단위로 스트리밍할 때의 시간/최대 메모리
+
+    python -m benchmarks.json_stream_load [아이디어 수]
+
+기본값: 아이디어 20,000건 (고정 시드), 측정마다 새 프로세스에서 실행해 최대 RSS 비교
+- json.load     : 파일 전체를 한 번에 파싱 (스트리밍 이전 방식)
+- stream        : src.json_stream.load_json_array (JsonBackend.load 경로)
+- archive import: archive 방식 첫 실행 시 ideas_data.json을 본문 아카이브로 옮기기
+"""
+
+import json
+import os
+import subprocess
+import sys
+import time
+
+from benchmarks.common import file_mb, make_ideas, peak_rss_mb, work_dir
+from src.write_behind import atomic_write_json
+
+IDEAS = 20_000
+VARIANTS = ("json.load", "stream", "archive import")
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_variant(variant, path):
+    """새 프로세스 안에서 실행: 불러오기 1번의 시간과 최대 RSS 출력"""
+    start = time.perf_counter()
+    if variant == "json.load":
+        with open(path, "r", encoding="utf-8") as f:
+            count = len(json.load(f))
+    elif variant == "stream":
+        from src.json_stream import iter_json_array
+
+        count = len(list(iter_json_array(path)))
+    else:
+        from src.idea_archive import IdeaArchive
+
+        count = len(IdeaArchive(os.path.dirname(path)).load_index())
+    elapsed = time.perf_counter() - start
+    print(json.dumps({"count": count, "seconds": elapsed, "peak_mb": peak_rss_mb()}))
+
+
+def main():
+    ideas = int(sys.argv[1]) if len(sys.argv) > 1 else IDEAS
+    work_dir()
+    path = os.path.abspath(os.path.join("data", "ideas_data.json"))
+    atomic_write_json(path, make_ideas(ideas), indent=2)
+    print(f"ideas {ideas:,}: {file_mb(path):.1f}MB")
+
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    for variant in VARIANTS:
+        output = subprocess.run(
+            [
+                sys.executable,
+                "-m",
+                "benchmarks.json_stream_load",
+                "--run",
+                variant,
+                path,
+            ],
+            check=True,
+            capture_output=True,
+            text=True,
+            env=env,
+        ).stdout
+        result = json.loads(output.strip().splitlines()[-1])
+        assert result["count"] == ideas
+        print(
+            f"  {variant:14} {result['seconds']:6.2f}s  peak RSS {result['peak_mb']:7.0f}MB"
+        )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:2] == ["--run"]:
+        run_variant(sys.argv[2], sys.argv[3])
+    else:
+        main()
@@ -0,0 +1,80 @@
+"""
+노드 전문 검색 색인(src.node_search) 생성 시간과 검색 지연 시간
+
+    python -m benchmarks.node_search [노드 수]
+
+기본값: 노드 20,000건 (고정 시드), 검색어별 20번 실행 시간의 중앙값을
+모든 노드의 제목/태그/설명을 훑는 단순 검색과 비교
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+import time
+import unicodedata
+
+from benchmarks.common import make_nodes, median_ms, rng, work_dir
+
+NODES = 20_000
+
+
+def _normalize(text):
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def scan(nodes, search_text):
+    """색인 없이 모든 노드를 훑는 검색 (비교 기준)"""
+    words = _normalize(search_text).split()
+    matched = []
+    for node in nodes:
+        haystack = _normalize(
+            f"{node['title']}\n{' '.join(node['tags'])}\n{node['description']}"
+        )
+        if all(word in haystack for word in words):
+            matched.append(node["id"])
+    return matched
+
+
+def queries(nodes):
+    """노드 설명에서 뽑은 한 단어/두 단어 검색어와 태그, 없는 단어"""
+    r = rng(7)
+    picked = []
+    for words in (1, 1, 2, 2, 3):
+        text = r.choice(nodes)["description"].split()
+        start = r.randrange(len(text) - words)
+        picked.append(" ".join(text[start : start + words]))
+    return picked + ["데이터", "태그12", "없는검색어"]
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else NODES
+    nodes = make_nodes(count)
+    work_dir()
+    os.makedirs("data")
+    with open(os.path.join("data", "nodes_data.json"), "w", encoding="utf-8") as f:
+        json.dump(nodes, f, ensure_ascii=False, indent=2)
+
+    import src.data_manager as dm
+
+    with contextlib.redirect_stdout(io.StringIO()):  # 불러오기 진행률 출력 생략
+        dm.initialize_data()
+    start = time.perf_counter()
+    dm.search_nodes("데이터")
+    print(
+        f"nodes {count:,}: index build (first search) {time.perf_counter() - start:.2f}s"
+    )
+
+    for search_text in queries(nodes):
+        hits = len(dm.search_nodes(search_text))
+        indexed = median_ms(lambda: dm.search_nodes(search_text))
+        scanned = median_ms(lambda: scan(nodes, search_text), repeat=5)
+        print(
+            f"  {search_text!r:24} {hits:6,} hits: "
+            f"index {indexed:7.2f}ms | scan {scanned:7.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
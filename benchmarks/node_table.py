@@ -0,0 +1,64 @@
+"""
+노드 목록 표(DataFrame) 만들기 시간: 열 지향 표(src.node_frame) vs 행마다 dict 만들기
+
+    python -m benchmarks.node_table [노드 수]
+
+기본값: 노드 20,000건 (고정 시드), 필터 조건별 10번 실행 시간의 중앙값
+(검색창 한 글자마다 표를 다시 만드는 비용)
+"""
+
+import contextlib
+import io
+import json
+import os
+import sys
+
+import pandas as pd
+
+from benchmarks.common import make_nodes, median_ms, work_dir
+from src.node_frame import NODE_COLUMNS, node_row
+
+NODES = 20_000
+CASES = [
+    ("", None, None),
+    ("", ["T1"], None),
+    ("", None, ["태그7", "태그8"]),
+    ("데이터", ["T2", "T3"], None),
+    ("(태그1 OR 태그2) AND NOT tenant:T1", None, None),
+    ("", None, None, 20, 40),
+]
+
+
+def dict_rows(dm, *args):
+    """query_nodes 결과 노드마다 행 dict를 만들어 DataFrame 생성 (비교 기준)"""
+    rows = [dict(zip(NODE_COLUMNS, node_row(node))) for node in dm.query_nodes(*args)]
+    return pd.DataFrame(rows) if rows else pd.DataFrame(columns=NODE_COLUMNS)
+
+
+def main():
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else NODES
+    work_dir()
+    os.makedirs("data")
+    with open(os.path.join("data", "nodes_data.json"), "w", encoding="utf-8") as f:
+        json.dump(make_nodes(count), f, ensure_ascii=False, indent=2)
+
+    import src.data_manager as dm
+
+    with contextlib.redirect_stdout(io.StringIO()):  # 불러오기 진행률 출력 생략
+        dm.initialize_data()
+    dm.nodes_table("데이터")  # 검색 색인 생성은 측정에서 제외
+
+    print(f"nodes {count:,}: per table (dict rows -> column frame)")
+    for args in CASES:
+        table = dm.nodes_table(*args)
+        assert table.equals(dict_rows(dm, *args)) or table.empty
+        before = median_ms(lambda: dict_rows(dm, *args), repeat=10)
+        after = median_ms(lambda: dm.nodes_table(*args), repeat=10)
+        print(
+            f"  {str(args):44} {len(table):6,} rows: "
+            f"{before:7.1f}ms -> {after:6.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
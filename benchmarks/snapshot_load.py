@@ -0,0 +1,49 @@
+"""
+JSON 데이터 파일과 바이너리 스냅샷(.bin) 불러오기 시간 비교 (GGGIS_BINARY_SNAPSHOT)
+
+    python -m benchmarks.snapshot_load [노드 수] [아이디어 수]
+
+기본값: 노드 10,000건, 아이디어 100,000건 (고정 시드), 3번 중 가장 빠른 시간
+"""
+
+import os
+import sys
+
+from benchmarks.common import best_of, file_mb, make_ideas, make_nodes, work_dir
+from src.binary_snapshot import read_snapshot, snapshot_path, write_snapshot
+from src.json_stream import iter_json_array
+from src.write_behind import atomic_write_json
+
+NODES = 10_000
+IDEAS = 100_000
+
+
+def compare(name, records):
+    json_path = os.path.join("data", f"{name}_data.json")
+    bin_path = snapshot_path(json_path)
+    # JsonBackend와 같은 형식으로 기록 (JSON은 JsonBackend.load와 같은 스트리밍 파서로 읽음)
+    atomic_write_json(json_path, records, indent=2)
+    write_snapshot(bin_path, records)
+
+    json_time, from_json = best_of(lambda: list(iter_json_array(json_path)))
+    bin_time, from_bin = best_of(lambda: read_snapshot(bin_path))
+    assert from_json == from_bin == records
+
+    print(
+        f"{name} {len(records):,}: "
+        f"json {file_mb(json_path):6.1f}MB {json_time:.3f}s | "
+        f"bin {file_mb(bin_path):6.1f}MB {bin_time:.3f}s "
+        f"({json_time / bin_time:.1f}x)"
+    )
+
+
+def main():
+    nodes = int(sys.argv[1]) if len(sys.argv) > 1 else NODES
+    ideas = int(sys.argv[2]) if len(sys.argv) > 2 else IDEAS
+    work_dir()
+    compare("nodes", make_nodes(nodes))
+    compare("ideas", make_ideas(ideas))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+import threading
+import time
+import zlib
+from contextlib import nullcontext
+from datetime import datetime
+
+import src.data_manager as dm
+from src.process_lock import ProcessLock
+from src.write_behind import atomic_write_json
+
+# 청크 크기 범위: 줄 경계에서만 자르고, 내용으로 정한 경계가 없으면 최대 크기에서 자름
+MIN_CHUNK_BYTES = 64 * 1024
+MAX_CHUNK_BYTES = 1024 * 1024
+# 줄 해시의 하위 비트가 모두 0인 줄 뒤에서 자름 (평균 약 2048줄마다)
+BOUNDARY_MASK = 0x7FF
+# 백업하지 않는 파일 (쓰기 도중의 임시 파일, SQLite가 열 때 다시 만드는 공유 메모리)
+SKIP_SUFFIXES = (".tmp", "-shm")
+# 직전 백업의 파일 확인 시각과 이 시간 안쪽으로 수정된 파일은 크기/수정 시각이 같아도
+# 다시 읽음 (파일 시각은 커널 틱 단위로 기록되어, 확인 직후 같은 크기로 다시 쓴 파일이
+# 같은 수정 시각을 가질 수 있음)
+RACY_NS = 1_000_000_000
+
+
+class BackupStore:
+    """
+    데이터 디렉토리의 증분 백업 (내용 주소 청크 저장소)
+
+    - backups/chunks/<해시 앞 2자리>/<sha256>: 파일 조각 (zlib 압축, 같은 내용은 한 번만)
+    - backups/manifests/<백업 ID>.json: 백업 시점의 파일별 크기/수정 시각/청크 목록
+    - 청크 경계는 위치가 아니라 줄 내용으로 정하므로, 파일 중간에 레코드가 추가되어도
+      뒤쪽 청크는 그대로 재사용됨
+    - 크기와 수정 시각이 직전 백업과 같은 파일은 다시 읽지 않음
+    - 바뀐 파일은 잠금 안에서 임시 디렉토리로 복사만 하고, 청크 분할/해시/압축은
+      잠금을 푼 뒤 복사본으로 처리 (백업 중에도 앱의 쓰기가 오래 막히지 않음)
+    - 백업 생성/정리는 backups/.backup.lock으로 프로세스 사이에서도 한 번에 하나만
+      실행 (여러 워커나 CLI가 같은 저장소를 써도 매니페스트 ID가 겹치거나, 정리가
+      다른 프로세스가 막 저장한 청크를 지우지 않음)
+    """
+
+    def __init__(self, backup_dir, data_dir):
+        self.backup_dir = backup_dir
+        self.data_dir = data_dir
+        self.chunk_dir = os.path.join(backup_dir, "chunks")
+        self.manifest_dir = os.path.join(backup_dir, "manifests")
+        try:
+            self._lock = ProcessLock(os.path.join(backup_dir, ".backup.lock"))
+        except RuntimeError:  # Windows: 프로세스 안에서만 직렬화
+            self._lock = None
+            self._thread_lock = threading.RLock()
+
+    def _hold(self):
+        """백업 저장소를 바꾸는 작업의 잠금 (프로세스 간, 불가능하면 스레드 간)"""
+        return self._lock.hold() if self._lock else self._thread_lock
+
+    # ------------------------------------------------------------------
+    # 백업
+    # ------------------------------------------------------------------
+    def create(self, hold=nullcontext):
+        """
+        새 백업을 만들고 {"id", "files", "new_chunks", "new_bytes"} 반환
+
+        hold는 데이터 파일이 바뀌지 않게 잡아 두는 컨텍스트 (잡고 있는 동안 파일 목록을
+        확인하고 바뀐 파일을 복사함), 직전 백업과 내용이 같으면 매니페스트를 만들지 않고
+        id가 None
+        """
+        with self._hold():
+            previous = self.latest()
+            previous_files = previous["files"] if previous else {}
+            racy_after = (previous or {}).get("scanned_ns", 0) - RACY_NS
+            stats = {"new_chunks": 0, "new_bytes": 0}
+
+            os.makedirs(self.backup_dir, exist_ok=True)
+            staging_dir = tempfile.mkdtemp(prefix="staging-", dir=self.backup_dir)
+            try:
+                with hold():
+                    scanned_ns = time.time_ns()
+                    files, staged = self._stage_changed(
+                        previous_files, racy_after, staging_dir
+                    )
+                for rel_path, staged_path in staged.items():
+                    files[rel_path]["chunks"] = self._store_file(staged_path, stats)
+            finally:
+                shutil.rmtree(staging_dir, ignore_errors=True)
+
+            if previous and files == previous_files:
+                return {"id": None, "files": len(files), **stats}
+
+            backup_id = self._new_id()
+            manifest = {
+                "id": backup_id,
+                "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                "scanned_ns": scanned_ns,
+                "files": files,
+            }
+            atomic_write_json(
+                os.path.join(self.manifest_dir, f"{backup_id}.json"), manifest
+            )
+            return {"id": backup_id, "files": len(files), **stats}
+
+    def _stage_changed(self, previous_files, racy_after, staging_dir):
+        """
+        파일별 매니페스트 항목과 {상대 경로: 복사본 경로} 반환
+
+        직전 백업과 크기/수정 시각이 같고 수정 시각이 racy_after 이전인 파일은 이전 항목을
+        그대로 쓰고, 나머지는 staging_dir에 복사 (청크 목록은 호출한 쪽에서 채움)
+        """
+        files = {}
+        staged = {}
+        for rel_path in self._data_files():
+            path = os.path.join(self.data_dir, rel_path)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue  # 목록을 만든 뒤 삭제된 파일
+            old = previous_files.get(rel_path)
+            if (
+                old
+                and old["size"] == st.st_size
+                and old["mtime_ns"] == st.st_mtime_ns
+                and st.st_mtime_ns < racy_after
+            ):
+                files[rel_path] = old
+                continue
+            staged_path = os.path.join(staging_dir, str(len(staged)))
+            try:
+                shutil.copyfile(path, staged_path)
+            except FileNotFoundError:
+                continue
+            files[rel_path] = {"size": st.st_size, "mtime_ns": st.st_mtime_ns}
+            staged[rel_path] = staged_path
+        return files, staged
+
+    def _data_files(self):
+        """데이터 디렉토리 안의 파일 상대 경로 목록 (백업 디렉토리는 제외)"""
+        backup_root = os.path.abspath(self.backup_dir)
+        rel_paths = []
+        for root, dirs, names in os.walk(self.data_dir):
+            dirs[:] = sorted(
+                d for d in dirs if os.path.abspath(os.path.join(root, d)) != backup_root
+            )
+            for name in sorted(names):
+                if name.endswith(SKIP_SUFFIXES):
+                    continue
+                path = os.path.join(root, name)
+                rel_paths.append(os.path.relpath(path, self.data_dir))
+        return rel_paths
+
+    def _store_file(self, path, stats):
+        """파일을 청크로 나눠 저장하고 청크 해시 목록 반환"""
+        hashes = []
+        with open(path, "rb") as f:
+            for chunk in iter_chunks(f):
+                digest = hashlib.sha256(chunk).hexdigest()
+                if self._store_chunk(digest, chunk):
+                    stats["new_chunks"] += 1
+                    stats["new_bytes"] += len(chunk)
+                hashes.append(digest)
+        return hashes
+
+    def _store_chunk(self, digest, chunk):
+        """아직 없는 청크만 기록, 새로 기록했으면 True"""
+        path = self._chunk_path(digest)
+        if os.path.exists(path):
+            return False
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=f"{digest}.", suffix=".tmp", dir=os.path.dirname(path)
+        )
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(zlib.compress(chunk, 6))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        return True
+
+    def _chunk_path(self, digest):
+        return os.path.join(self.chunk_dir, digest[:2], digest)
+
+    def _new_id(self):
+        """
+        가장 최근 백업보다 뒤에 오는 새 백업 ID (<날짜-시각>, 같은 초이면 -2, -3 …)
+
+        정리로 앞선 백업이 지워져도 지워진 ID를 다시 쓰지 않음 (백업 잠금 안에서 호출)
+        """
+        backup_id = datetime.now().strftime("%Y%m%d-%H%M%S")
+        backup_ids = self.list()
+        if not backup_ids or _id_key(backup_ids[-1]) < _id_key(backup_id):
+            return backup_id
+        stamp, seq = _id_key(backup_ids[-1])
+        return f"{stamp}-{seq + 1}"
+
+    # ------------------------------------------------------------------
+    # 조회 / 복원 / 정리
+    # ------------------------------------------------------------------
+    def list(self):
+        """백업 ID 목록 (오래된 순)"""
+        if not os.path.isdir(self.manifest_dir):
+            return []
+        return sorted(
+            (
+                name[: -len(".json")]
+                for name in os.listdir(self.manifest_dir)
+                if name.endswith(".json")
+            ),
+            key=_id_key,
+        )
+
+    def load_manifest(self, backup_id):
+        with open(
+            os.path.join(self.manifest_dir, f"{backup_id}.json"), "r", encoding="utf-8"
+        ) as f:
+            return json.load(f)
+
+    def latest(self):
+        backup_ids = self.list()
+        return self.load_manifest(backup_ids[-1]) if backup_ids else None
+
+    def restore(self, backup_id, target_dir=None):
+        """
+        백업 시점의 파일로 target_dir(기본: 데이터 디렉토리)을 되돌림
+
+        임시 디렉토리에 모두 복원하고 청크 해시를 확인한 뒤 교체하며, 기존 디렉토리는
+        <디렉토리>.before-restore-<시각>으로 남김 (앱을 멈춘 상태에서 실행)
+        """
+        target_dir = target_dir or self.data_dir
+        manifest = self.load_manifest(backup_id)
+        tmp_dir = target_dir.rstrip(os.sep) + ".restore-tmp"
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir)
+
+        for rel_path, entry in manifest["files"].items():
+            path = os.path.join(tmp_dir, rel_path)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                for digest in entry["chunks"]:
+                    f.write(self._read_chunk(digest))
+                f.flush()
+                os.fsync(f.fileno())
+            os.utime(path, ns=(entry["mtime_ns"], entry["mtime_ns"]))
+
+        previous_dir = None
+        if os.path.exists(target_dir):
+            stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+            previous_dir = f"{target_dir.rstrip(os.sep)}.before-restore-{stamp}"
+            os.replace(target_dir, previous_dir)
+        os.replace(tmp_dir, target_dir)
+        return previous_dir
+
+    def _read_chunk(self, digest):
+        with open(self._chunk_path(digest), "rb") as f:
+            chunk = zlib.decompress(f.read())
+        if hashlib.sha256(chunk).hexdigest() != digest:
+            raise ValueError(f"백업 청크가 손상되었습니다: {digest}")
+        return chunk
+
+    def prune(self, keep):
+        """최근 keep개만 남기고 오래된 백업과 어디에서도 쓰이지 않는 청크 삭제"""
+        with self._hold():
+            backup_ids = self.list()
+            for backup_id in backup_ids[: max(len(backup_ids) - keep, 0)]:
+                os.remove(os.path.join(self.manifest_dir, f"{backup_id}.json"))
+
+            used = set()
+            for backup_id in self.list():
+                for entry in self.load_manifest(backup_id)["files"].values():
+                    used.update(entry["chunks"])
+
+            removed = 0
+            if os.path.isdir(self.chunk_dir):
+                for root, _, names in os.walk(self.chunk_dir):
+                    for name in names:
+                        if name not in used:
+                            os.remove(os.path.join(root, name))
+                            removed += 1
+            return removed
+
+
+def _id_key(backup_id):
+    """백업 ID 정렬 키 (<날짜-시각>, 순번): "-10"이 "-9"보다 뒤에 오도록 순번은 숫자로"""
+    stamp, _, seq = backup_id.rpartition("-")
+    if len(stamp) == len("YYYYmmdd-HHMMSS"):
+        return stamp, int(seq)
+    return backup_id, 1
+
+
+def iter_chunks(f):
+    """
+    파일을 줄 경계에서 내용 기반으로 나눈 청크를 차례로 반환
+
+    직전 줄과 현재 줄의 해시로 경계를 정하므로 "  }," 같은 흔한 줄만으로
+    경계가 몰리지 않고, 줄바꿈이 없는 바이너리는 최대 크기에서 자름
+    """
+    parts = []
+    size = 0
+    previous = b""
+    while True:
+        line = f.readline(MAX_CHUNK_BYTES)
+        if not line:
+            break
+        parts.append(line)
+        size += len(line)
+        boundary = zlib.crc32(line, zlib.crc32(previous)) & BOUNDARY_MASK == 0
+        previous = line
+        if size >= MAX_CHUNK_BYTES or (size >= MIN_CHUNK_BYTES and boundary):
+            yield b"".join(parts)
+            parts, size = [], 0
+    if parts:
+        yield b"".join(parts)
+
+
+_store = None
+_scheduler = None
+_scheduler_lock = None
+
+
+def get_backup_store():
+    """백업 저장소 반환 (최초 호출 시 생성)"""
+    global _store
+    if _store is None:
+        _store = BackupStore(dm.BACKUP_DIR, dm.DATA_DIR)
+    return _store
+
+
+def create_backup():
+    """대기 중인 저장을 기록하고, 변경이 없는 상태에서 백업 생성"""
+    try:
+        result = get_backup_store().create(dm.files_held)
+    except Exception as e:
+        print(f"[ERROR] 백업 실패: {e}")
+        raise e
+
+    if result["id"]:
+        print(
+            f"[INFO] 백업 {result['id']} 생성: 파일 {result['files']}개, "
+            f"새 청크 {result['new_chunks']}개 ({result['new_bytes']:,}B)"
+        )
+    return result
+
+
+def _is_scheduler_owner():
+    """
+    여러 워커 모드에서 이 프로세스가 예약 백업 담당인지 여부
+
+    backups/.scheduler.lock을 먼저 잡은 워커 하나만 담당하고, 담당 워커가 종료되면
+    다음 주기에 다른 워커가 잠금을 이어받음
+    """
+    global _scheduler_lock
+    if not dm.MULTI_WORKER:
+        return True
+    if _scheduler_lock is None:
+        _scheduler_lock = ProcessLock(os.path.join(dm.BACKUP_DIR, ".scheduler.lock"))
+    return _scheduler_lock.claim()
+
+
+def start_backup_scheduler(interval_minutes=None, keep=None):
+    """
+    interval_minutes마다 백업 후 오래된 백업 정리 (0 이하이면 실행하지 않음)
+
+    여러 워커 모드에서는 모든 워커가 예약을 걸어 두지만 실제 백업은 담당 워커 하나만 실행
+    """
+    global _scheduler
+    interval_minutes = (
+        dm.BACKUP_INTERVAL_MINUTES if interval_minutes is None else interval_minutes
+    )
+    keep = dm.BACKUP_KEEP if keep is None else keep
+    if interval_minutes <= 0 or _scheduler is not None:
+        return
+
+    stop = threading.Event()
+
+    def run():
+        while not stop.wait(interval_minutes * 60):
+            try:
+                if not _is_scheduler_owner():
+                    continue
+                create_backup()
+                get_backup_store().prune(keep)
+            except Exception as e:
+                # 다음 주기에 다시 시도
+                print(f"[WARN] 예약 백업을 건너뜁니다: {e}")
+
+    _scheduler = threading.Thread(target=run, daemon=True)
+    _scheduler.start()
+    return stop
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GGGIS 데이터 백업/복원")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("create", help="증분 백업 생성")
+    commands.add_parser("list", help="백업 목록")
+    restore_parser = commands.add_parser("restore", help="백업 시점으로 복원")
+    restore_parser.add_argument("backup_id", help="복원할 백업 ID (latest: 최신)")
+    prune_parser = commands.add_parser("prune", help="오래된 백업 정리")
+    prune_parser.add_argument("--keep", type=int, default=dm.BACKUP_KEEP)
+    args = parser.parse_args(argv)
+
+    store = get_backup_store()
+    if args.command == "create":
+        result = create_backup()
+        if not result["id"]:
+            print("[INFO] 마지막 백업 이후 변경이 없습니다.")
+    elif args.command == "list":
+        for backup_id in store.list():
+            manifest = store.load_manifest(backup_id)
+            size = sum(entry["size"] for entry in manifest["files"].values())
+            print(f"{backup_id}  {manifest['created_at']}  {size:,}B")
+    elif args.command == "restore":
+        backup_id = args.backup_id
+        if backup_id == "latest":
+            if not store.list():
+                print("[ERROR] 복원할 백업이 없습니다.")
+                return
+            backup_id = store.list()[-1]
+        previous_dir = store.restore(backup_id)
+        print(
+            f"[INFO] 백업 {backup_id}으로 복원했습니다. (이전 데이터: {previous_dir})"
+        )
+    elif args.command == "prune":
+        removed = store.prune(args.keep)
+        print(f"[INFO] 사용하지 않는 청크 {removed}개를 삭제했습니다.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+import gc
+import marshal
+import os
+import struct
+import sys
+
+MAGIC = b"GGGISNAP"
+FORMAT_VERSION = 1
+# magic, 포맷 버전, marshal 버전, 파이썬 버전(major, minor), 레코드 수, 본문 길이
+_HEADER = struct.Struct("<8sHHBBIQ")
+# 이보다 긴 문자열(설명, 본문 등)은 대부분 고유하므로 모으지 않음
+INTERN_MAX_LENGTH = 64
+
+
+def snapshot_path(json_path):
+    """JSON 파일 옆에 두는 바이너리 스냅샷 경로 (data/nodes_data.json → .bin)"""
+    return os.path.splitext(json_path)[0] + ".bin"
+
+
+def write_snapshot(path, records):
+    """
+    레코드 목록을 바이너리 스냅샷으로 저장
+
+    본문은 필드별 컬럼 목록을 marshal로 직렬화한 것으로, 같은 문자열(테넌트,
+    태그, 공모전 제목 등)은 한 객체로 모아 한 번만 기록됨
+    """
+    payload = marshal.dumps(_to_columns(records), marshal.version)
+    header = _HEADER.pack(
+        MAGIC,
+        FORMAT_VERSION,
+        marshal.version,
+        sys.version_info.major,
+        sys.version_info.minor,
+        len(records),
+        len(payload),
+    )
+
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(payload)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+def read_snapshot(path):
+    """스냅샷 불러오기, 형식/버전이 다르거나 손상되었으면 None (JSON으로 대체)"""
+    try:
+        with open(path, "rb") as f:
+            header = f.read(_HEADER.size)
+            if len(header) < _HEADER.size:
+                return None
+            magic, version, marshal_version, major, minor, count, length = (
+                _HEADER.unpack(header)
+            )
+            # marshal 형식은 파이썬 버전마다 달라질 수 있으므로 같은 환경에서만 사용
+            if (
+                magic != MAGIC
+                or version != FORMAT_VERSION
+                or marshal_version != marshal.version
+                or (major, minor) != sys.version_info[:2]
+            ):
+                return None
+            payload = f.read(length)
+    except OSError:
+        return None
+    if len(payload) != length:
+        return None
+
+    # 수십만 개의 dict를 한 번에 만드는 동안 순환 GC가 반복 실행되지 않도록 잠시 끔
+    gc_was_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        records = _from_columns(marshal.loads(payload))
+    except (EOFError, ValueError, TypeError):
+        return None
+    finally:
+        if gc_was_enabled:
+            gc.enable()
+
+    return records if len(records) == count else None
+
+
+def _to_columns(records):
+    """레코드 목록 → (키 목록, 키별 값 컬럼, 키별 값이 없는 레코드 위치)"""
+    keys = {}
+    for record in records:
+        for key in record:
+            keys.setdefault(key, len(keys))
+
+    interned = {}
+    columns = []
+    missing = []
+    for key in keys:
+        column = []
+        absent = []
+        for position, record in enumerate(records):
+            if key in record:
+                column.append(_intern(record[key], interned))
+            else:
+                column.append(None)
+                absent.append(position)
+        columns.append(column)
+        missing.append(absent)
+    return list(keys), columns, missing
+
+
+def _from_columns(data):
+    keys, columns, missing = data
+    records = [dict(zip(keys, row)) for row in zip(*columns)]
+    for key, absent in zip(keys, missing):
+        for position in absent:
+            del records[position][key]
+    return records
+
+
+def _intern(value, interned):
+    """같은 내용의 문자열을 한 객체로 모음 (marshal이 참조로 한 번만 기록)"""
+    if isinstance(value, str):
+        if len(value) > INTERN_MAX_LENGTH:
+            return value
+        return interned.setdefault(value, value)
+    if isinstance(value, list):
+        return [_intern(v, interned) for v in value]
+    if isinstance(value, dict):
+        return {k: _intern(v, interned) for k, v in value.items()}
+    return value
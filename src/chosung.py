@@ -0,0 +1,205 @@
+import re
+import threading
+import unicodedata
+
+import numpy as np
+
+# 한글 음절(가~힣)의 초성 (호환 자모), 음절 코드 = 0xAC00 + (초성 * 21 + 중성) * 28 + 종성
+CHOSUNG = "ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ"
+SYLLABLE_FIRST = 0xAC00
+SYLLABLE_LAST = 0xD7A3
+SYLLABLES_PER_CHOSUNG = 21 * 28
+# 첫가끝 초성 자모(U+1100~U+1112)는 같은 순서의 호환 자모로 취급
+CONJOINING_FIRST = 0x1100
+
+_CHOSUNG_SET = frozenset(CHOSUNG)
+# 레코드 사이 구분자 (검색어에 나올 수 없는 문자)
+_SEPARATOR = "\x00"
+
+
+def normalize(text):
+    """NFC 정규화 + 대소문자 통일 (NFKC는 호환 자모를 첫가끝 자모로 바꾸므로 사용하지 않음)"""
+    return unicodedata.normalize("NFC", text).casefold()
+
+
+def _initial(char):
+    code = ord(char)
+    if SYLLABLE_FIRST <= code <= SYLLABLE_LAST:
+        return CHOSUNG[(code - SYLLABLE_FIRST) // SYLLABLES_PER_CHOSUNG]
+    if CONJOINING_FIRST <= code < CONJOINING_FIRST + len(CHOSUNG):
+        return CHOSUNG[code - CONJOINING_FIRST]
+    return char
+
+
+def chosung(text):
+    """음절을 초성으로 바꾼 문자열 (그 밖의 문자는 그대로, 길이 유지), 예: "파이썬 AI" → "ㅍㅇㅆ AI" """
+    return "".join(_initial(char) for char in text)
+
+
+def has_chosung(text):
+    """검색어에 초성(자음만 입력한 글자)이 있는지"""
+    return any(
+        _initial(char) in _CHOSUNG_SET and not _is_syllable(char) for char in text
+    )
+
+
+def _is_syllable(char):
+    return SYLLABLE_FIRST <= ord(char) <= SYLLABLE_LAST
+
+
+def _has_syllable(text):
+    return any(_is_syllable(char) for char in text)
+
+
+class ChosungIndex:
+    """
+    레코드 텍스트의 초성 투영을 미리 계산해 두는 검색 색인
+
+    - 레코드별 (정규화 원문, 초성 투영)을 추가/수정/삭제 때만 계산 (검색 때 다시 계산하지 않음)
+    - 검색은 모든 투영을 구분자로 이어 붙인 문자열에서 정규식으로 찾고, 찾은 위치를
+      레코드 시작 위치 배열(numpy searchsorted)로 레코드에 대응
+      (이어 붙인 문자열은 변경 후 첫 검색 때 갱신)
+    - 투영은 길이를 유지하므로 "파ㅇㅆ"처럼 음절과 초성이 섞인 단어는 같은 위치의 원문과
+      글자별로 다시 확인
+    - 결과는 텍스트 시작 일치 → 단어 시작 일치 → 중간 일치 순, 같은 순위는 등록 순서
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}  # key → (정규화 원문, 초성 투영)
+        self._corpus = None  # (이어 붙인 투영, 시작 위치 목록, key 목록)
+
+    def rebuild(self, items):
+        """[(key, 텍스트)]로 전체 다시 만들기"""
+        entries = {}
+        for key, text in items:
+            text = normalize(text)
+            entries[key] = (text, chosung(text))
+        with self._lock:
+            self._entries = entries
+            self._corpus = None
+
+    def set(self, key, text):
+        text = normalize(text)
+        entry = (text, chosung(text))
+        with self._lock:
+            if self._entries.get(key) != entry:
+                self._entries[key] = entry
+                self._corpus = None
+
+    def remove(self, key):
+        with self._lock:
+            if self._entries.pop(key, None) is not None:
+                self._corpus = None
+
+    def search(self, query):
+        """검색어의 모든 단어(공백 구분)와 맞는 레코드 key 목록 (순위 순)"""
+        words = [(word, chosung(word)) for word in normalize(query).split()]
+        if not words:
+            return []
+        with self._lock:
+            corpus, starts, keys = self._get_corpus()
+            # 단어별로 이어 붙인 문자열 전체에서 찾은 레코드 번호의 교집합
+            slots = ranks = None
+            verify = []
+            for word, projected in words:
+                word_slots, word_ranks = _find_slots(corpus, starts, projected)
+                if _has_syllable(word):
+                    # 음절이 섞인 단어는 원문과 글자별 확인 후 순위를 다시 계산
+                    verify.append((word, projected))
+                    word_ranks[:] = 0
+                if slots is None:
+                    slots, ranks = word_slots, word_ranks
+                else:
+                    slots, mine, theirs = np.intersect1d(
+                        slots, word_slots, assume_unique=True, return_indices=True
+                    )
+                    ranks = ranks[mine] + word_ranks[theirs]
+                if not len(slots):
+                    return []
+
+            if verify:
+                entries = self._entries
+                kept = []
+                for i, slot in enumerate(slots.tolist()):
+                    text, projection = entries[keys[slot]]
+                    for word, projected in verify:
+                        word_rank = _match_rank(word, projected, text, projection)
+                        if word_rank is None:
+                            break
+                        ranks[i] += word_rank
+                    else:
+                        kept.append(i)
+                slots, ranks = slots[kept], ranks[kept]
+
+            order = np.lexsort((slots, ranks))
+            return [keys[slot] for slot in slots[order].tolist()]
+
+    def _get_corpus(self):
+        if self._corpus is None:
+            keys = list(self._entries)
+            projections = [self._entries[key][1] for key in keys]
+            lengths = np.fromiter(
+                (len(projection) + 1 for projection in projections),
+                dtype=np.int64,
+                count=len(projections),
+            )
+            starts = np.zeros(len(keys), dtype=np.int64)
+            np.cumsum(lengths[:-1], out=starts[1:])
+            self._corpus = (_SEPARATOR.join(projections), starts, keys)
+        return self._corpus
+
+
+def _find_slots(corpus, starts, probe):
+    """
+    probe가 나오는 레코드 번호와 레코드별 가장 좋은 위치의 순위
+    (0: 텍스트 시작, 1: 단어 시작, 2: 중간), 레코드 번호 오름차순
+    """
+    positions = np.fromiter(
+        (match.start() for match in re.finditer(re.escape(probe), corpus)),
+        dtype=np.int64,
+    )
+    if not len(positions):
+        return positions, positions.copy()
+    slots = np.searchsorted(starts, positions, side="right") - 1
+    ranks = np.where(positions == starts[slots], 0, 2)
+    inside = np.flatnonzero(ranks)
+    # 앞 글자가 \w가 아니면 단어 시작 (투영은 음절/초성 외의 문자를 그대로 두므로 원문과 같음)
+    word_start = [
+        not (corpus[position - 1].isalnum() or corpus[position - 1] == "_")
+        for position in positions[inside].tolist()
+    ]
+    ranks[inside[np.array(word_start, dtype=bool)]] = 1
+
+    # 레코드별 가장 좋은 순위만 남김
+    order = np.lexsort((ranks, slots))
+    slots, ranks = slots[order], ranks[order]
+    first = np.ones(len(slots), dtype=bool)
+    first[1:] = slots[1:] != slots[:-1]
+    return slots[first], ranks[first]
+
+
+def _match_rank(word, projected, text, projection):
+    """
+    단어가 텍스트와 맞는 가장 좋은 위치의 순위 (0: 텍스트 시작, 1: 단어 시작, 2: 중간),
+    맞지 않으면 None
+    """
+    check_syllables = _has_syllable(word)
+    best = None
+    position = projection.find(projected)
+    while position != -1:
+        if not check_syllables or _same_syllables(
+            word, text[position : position + len(word)]
+        ):
+            if position == 0:
+                return 0
+            previous = text[position - 1]
+            rank = 2 if previous.isalnum() or previous == "_" else 1
+            best = rank if best is None else min(best, rank)
+        position = projection.find(projected, position + 1)
+    return best
+
+
+def _same_syllables(word, text):
+    """초성 투영이 같은 두 문자열에서 검색어의 음절이 원문과 일치하는지"""
+    return all(q == t for q, t in zip(word, text) if _is_syllable(q))
@@ -1,69 +1,1029 @@
 import json
 import os
+import threading
+from collections import deque
+from contextlib import contextmanager, nullcontext
+
+from src.chosung import ChosungIndex, has_chosung
+from src.idea_archive import INDEX_FIELDS
+from src.idea_search import IdeaTextIndex, snippet
+from src.ids import id_from_created_at, new_id
+from src.node_history import NodeHistoryStore
+from src.node_frame import NodeFrame
+from src.node_index import NodeFacetIndex, intersect
+from src.node_search import NodeTextIndex
+from src.node_snapshots import NodeSnapshotStore
+from src.process_lock import ProcessLock
+from src.rwlock import RWLock
+from src.storage import create_backend, idea_list_row, paginate
+from src.tag_query import compile_query, is_tag_query
+from src.tag_trie import SUGGEST_LIMIT, TagTrie
+
+DATA_DIR = "data"
+
+# 저장 방식
+# - "json": 변경마다 data/*_data.json 전체 재작성 (소규모 설치용 기본값)
+# - "journal": 추가 전용 저널 + 주기적 스냅샷
+# - "sqlite": data/gggis.sqlite3 (WAL), 변경마다 해당 행만 기록, 테넌트/태그/생성일 필터와
+#   정렬/페이지네이션을 SQL로 처리 (전문 검색/태그 쿼리는 메모리 색인)
+# - "archive": 노드는 json, 아이디어는 본문 아카이브(mmap) + 상주 목록 인덱스
+# - "sharded": 노드를 테넌트별 샤드 파일로 저장, 필터에 필요한 샤드만 불러옴
+#   (노드 수/facet 수/태그 추천은 manifest로 답하고, 전체 노드 표를 열면 모두 불러옴)
+STORAGE_MODE = os.getenv("GGGIS_STORAGE_MODE", "json")
+# 저널이 이 크기(바이트)를 넘으면 백그라운드에서 스냅샷으로 압축
+JOURNAL_COMPACT_BYTES = int(os.getenv("GGGIS_JOURNAL_COMPACT_BYTES", 4 * 1024 * 1024))
+# json 방식에서 변경을 모아 백그라운드로 기록할 대기 시간(초), 0이면 즉시 기록
+WRITE_BEHIND_SECONDS = float(os.getenv("GGGIS_WRITE_BEHIND_SECONDS", "0.5"))
+# json 계열 방식에서 JSON 옆에 바이너리 스냅샷(.bin)도 기록해 시작 시 빠르게 불러옴
+BINARY_SNAPSHOT = os.getenv("GGGIS_BINARY_SNAPSHOT", "0") == "1"
+# archive 방식에서 이 일수보다 오래된 달의 아이디어 본문을 월별 압축 세그먼트로
+# 옮김 (0이면 옮기지 않음), 압축 방식은 "lzma"(기본, 작음) 또는 "zlib"(빠름)
+IDEA_HOT_DAYS = int(os.getenv("GGGIS_IDEA_HOT_DAYS", "30"))
+COLD_CODEC = os.getenv("GGGIS_COLD_CODEC", "lzma")
+# 여러 워커 프로세스가 같은 data 디렉토리를 공유하는 모드 (모든 저장 방식)
+# 변경은 프로세스 간 잠금(data/.store.lock) 안에서 다른 워커의 변경을 반영한 뒤 즉시
+# 기록하고 (저널 압축도 잠금 안에서 바로 처리), 읽기 전에는 파일 지문(stat)으로 다른
+# 워커의 변경을 확인
+MULTI_WORKER = os.getenv("GGGIS_MULTI_WORKER", "0") == "1"
+# 증분 백업 디렉토리, 예약 백업 주기(분, 0이면 끔)와 보관할 백업 수 (src/backup.py)
+BACKUP_DIR = os.getenv("GGGIS_BACKUP_DIR", "backups")
+BACKUP_INTERVAL_MINUTES = float(os.getenv("GGGIS_BACKUP_INTERVAL_MINUTES", "60"))
+BACKUP_KEEP = int(os.getenv("GGGIS_BACKUP_KEEP", "48"))
+# 필터/표 조회 결과 캐시에 보관할 결과 수 (src/result_cache.py, 0이면 캐시하지 않음)
+RESULT_CACHE_SIZE = int(os.getenv("GGGIS_RESULT_CACHE_SIZE", "64"))
+# 필터 변경 이벤트를 합칠 대기 시간 (src/event_coalescer.py, 계산 중이거나 계산이 끝난 뒤
+# 이 시간 안에 들어온 변경은 마지막 값만 계산, 단독 변경은 바로 계산)
+FILTER_COALESCE_SECONDS = float(os.getenv("GGGIS_FILTER_COALESCE_SECONDS", "0.15"))
+# 변경 피드에 보관할 최근 변경 수 (이보다 오래된 버전은 전체 다시 계산 필요)
+CHANGE_FEED_SIZE = 10000
 
 # 전역 변수
 nodes_data = []
 ideas_data = []
 
+# nodes_data/ideas_data 보호용 잠금
+# Gradio 핸들러는 스레드 풀에서 실행되므로 목록을 읽을 때는 read(),
+# 바꿀 때는 write()를 잡아야 함 (아래 함수들은 내부에서 처리)
+store_lock = RWLock()
 
-def save_nodes():
-    """노드 데이터를 JSON 파일로 저장"""
+# 컬렉션별 {id: 레코드} (nodes_data/ideas_data 안의 같은 객체를 가리킴)
+_records_by_id = {"nodes": {}, "ideas": {}}
+# 컬렉션별 {id: 목록 위치}, _positions_valid 앞의 위치만 맞음
+# (추가된 레코드는 조회할 때 이어서 채우고, 삭제하면 삭제 위치부터 다시 채움)
+_positions = {"nodes": {}, "ideas": {}}
+_positions_valid = {"nodes": 0, "ideas": 0}
+
+# 컬렉션별 데이터 버전 (변경마다 1씩 증가)과 변경 피드
+# - 피드 항목: (버전, "added"/"updated"/"removed", 레코드 ID)
+# - _feed_start 이전 버전부터의 변경은 피드로 답할 수 없음 (전체 다시 읽기/피드 넘침)
+_versions = {"nodes": 0, "ideas": 0}
+_change_feed = {
+    "nodes": deque(maxlen=CHANGE_FEED_SIZE),
+    "ideas": deque(maxlen=CHANGE_FEED_SIZE),
+}
+_feed_start = {"nodes": 0, "ideas": 0}
+_subscribers = []
+# 메모리에 있는 노드의 태그/테넌트 역색인 (_record_change에서 변경된 노드만 갱신)
+_node_index = NodeFacetIndex()
+# 노드 목록 표 (열 지향, 행 번호는 _node_index의 저장 순번, 변경된 노드 행만 갱신)
+_node_frame = NodeFrame()
+# 노드 제목/설명/태그 전문 검색 색인 (첫 검색 때 만들고 이후 변경된 노드만 갱신)
+_node_text_index = NodeTextIndex()
+# 노드 제목/태그, 아이디어 제목/공모전 제목의 초성 색인 (ㅍㅇㅆ → 파이썬)
+_node_chosung_index = ChosungIndex()
+_idea_chosung_index = ChosungIndex()
+# 아이디어 제목/공모전 제목/개요/본문 섹션 전문 검색 색인 (첫 검색 때 만들고 이후
+# 생성/삭제된 아이디어만 갱신, 본문은 검색 결과 후보만 그때 읽음)
+_idea_text_index = IdeaTextIndex(
+    lambda idea_id: get_backend().read("ideas", _records_by_id["ideas"][idea_id])
+)
+# 키워드 자동 완성용 태그 사전 (태그별 사용 노드 수, 노드 태그가 바뀔 때 해당 태그만 갱신)
+_tag_trie = TagTrie()
+# 샤드 백엔드에서 아직 불러오지 않은 샤드가 있을 때 쓰는 태그 사전
+# (manifest의 태그별 노드 수로 만듦, 노드 버전이 바뀌면 다시 만듦): (노드 버전, TagTrie)
+_manifest_tag_trie = (None, None)
+
+_backend = None
+_node_snapshots = None
+_node_history = None
+_process_lock = None
+_init_lock = threading.Lock()
+
+
+def get_backend():
+    """현재 저장소 백엔드 반환 (최초 호출 시 생성)"""
+    global _backend
+    with _init_lock:
+        if _backend is None:
+            _backend = create_backend(
+                STORAGE_MODE,
+                DATA_DIR,
+                _get_records,
+                JOURNAL_COMPACT_BYTES,
+                # 다른 워커가 곧바로 읽을 수 있도록 지연 없이 기록
+                0 if MULTI_WORKER else WRITE_BEHIND_SECONDS,
+                BINARY_SNAPSHOT,
+                IDEA_HOT_DAYS,
+                COLD_CODEC,
+                store_lock,
+                # 저널 순번은 잠금 안에서 다른 워커의 저널을 재생해 이어 가므로,
+                # 압축도 잠금 밖의 백그라운드 스레드가 아닌 잠금 안에서 처리
+                journal_background_compaction=not MULTI_WORKER,
+            )
+    return _backend
+
+
+def get_node_snapshots():
+    """노드 스냅샷 저장소 반환 (최초 호출 시 생성)"""
+    global _node_snapshots
+    with _init_lock:
+        if _node_snapshots is None:
+            _node_snapshots = NodeSnapshotStore(DATA_DIR)
+    return _node_snapshots
+
+
+def get_node_history():
+    """노드 리비전 이력 저장소 반환 (최초 호출 시 생성)"""
+    global _node_history
+    with _init_lock:
+        if _node_history is None:
+            _node_history = NodeHistoryStore(DATA_DIR)
+    return _node_history
+
+
+def _process_guard():
+    """여러 워커 모드에서는 프로세스 간 잠금, 아니면 아무것도 하지 않는 컨텍스트"""
+    global _process_lock
+    if not MULTI_WORKER:
+        return nullcontext()
+    with _init_lock:
+        if _process_lock is None:
+            _process_lock = ProcessLock(os.path.join(DATA_DIR, ".store.lock"))
+    return _process_lock.hold()
+
+
+@contextmanager
+def _exclusive():
+    """
+    데이터를 바꾸는 함수용 쓰기 잠금
+
+    여러 워커 모드에서는 프로세스 간 잠금을 먼저 잡고 다른 워커의 변경을 반영한 뒤
+    진행하므로, 마지막에 저장한 워커가 다른 워커의 변경을 덮어쓰지 않음
+    (잠금 순서: 프로세스 간 잠금 → store_lock)
+    """
+    with _process_guard():
+        if MULTI_WORKER:
+            reload_if_changed("nodes")
+            reload_if_changed("ideas")
+        with store_lock.write():
+            yield
+
+
+def _sync_from_disk():
+    """여러 워커 모드: 읽기 전에 다른 워커가 바꾼 컬렉션을 다시 불러옴"""
+    # 이미 잠금을 보유한 스레드는 진입 시 반영했거나 쓰기 잠금으로 올릴 수 없음
+    if not MULTI_WORKER or store_lock.held():
+        return
+    reload_if_changed("nodes")
+    reload_if_changed("ideas")
+
+
+def _get_records(name):
+    """컬렉션 이름으로 현재 메모리 목록 반환"""
+    return nodes_data if name == "nodes" else ideas_data
+
+
+def _persist(name, method, *args):
+    """변경 1건을 백엔드에 기록"""
     try:
-        # data 디렉토리 생성
-        os.makedirs("data", exist_ok=True)
+        getattr(get_backend(), method)(name, *args)
+    except Exception as e:
+        print(f"[ERROR] {name} {method} 저장 실패: {e}")
+        raise e
 
-        with open("data/nodes_data.json", "w", encoding="utf-8") as f:
-            json.dump(nodes_data, f, ensure_ascii=False, indent=2)
 
+def _record_history(method, *args):
+    """노드 변경 1건을 리비전 이력에 기록"""
+    try:
+        getattr(get_node_history(), method)(*args)
     except Exception as e:
-        print(f"[ERROR] save_nodes 실패: {e}")
+        print(f"[ERROR] 노드 이력 {method} 기록 실패: {e}")
         raise e
 
 
-def save_ideas():
-    """아이디어 데이터를 JSON 파일로 저장"""
+def save_nodes():
+    """노드 데이터 전체 저장"""
     try:
-        # data 디렉토리 생성
-        os.makedirs("data", exist_ok=True)
+        with _exclusive():
+            _ensure_nodes_loaded()
+            get_backend().save("nodes")
+    except Exception as e:
+        print(f"[ERROR] save_nodes 실패: {e}")
+        raise e
 
-        with open("data/ideas_data.json", "w", encoding="utf-8") as f:
-            json.dump(ideas_data, f, ensure_ascii=False, indent=2)
 
+def save_ideas():
+    """아이디어 데이터 전체 저장"""
+    try:
+        with _exclusive():
+            get_backend().save("ideas")
     except Exception as e:
         print(f"[ERROR] save_ideas 실패: {e}")
         raise e
 
 
+def flush():
+    """대기 중인 저장을 모두 디스크에 기록 (종료 전/테스트에서 사용)"""
+    get_backend().flush()
+
+
+@contextmanager
+def files_held():
+    """
+    데이터 파일이 바뀌지 않는 구간 (대기 중인 저장을 기록한 뒤 읽기 잠금 유지, 백업용)
+
+    여러 워커 모드에서는 다른 워커의 쓰기도 막도록 프로세스 간 잠금을 먼저 잡음
+    """
+    with _process_guard():
+        with store_lock.read():
+            flush()
+            yield
+
+
 def load_nodes():
     """저장된 노드 데이터 불러오기"""
     global nodes_data
-    if os.path.exists("data/nodes_data.json"):
-        try:
-            with open("data/nodes_data.json", "r", encoding="utf-8") as f:
-                nodes_data = json.load(f)
-        except (json.JSONDecodeError, ValueError):
-            nodes_data = []
-    else:
-        nodes_data = []
+    with store_lock.write():
+        records = get_backend().load("nodes")
+        if records == nodes_data:
+            # 디스크 내용이 메모리와 같으면 버전을 올리지 않음 (캐시 유지)
+            return
+        nodes_data = records
+        _records_by_id["nodes"] = {}
+        _forget_positions("nodes")
+        _register_records("nodes", nodes_data)
+        _record_change("nodes", "reset")
 
 
 def load_ideas():
     """저장된 아이디어 데이터 불러오기"""
     global ideas_data
-    if os.path.exists("data/ideas_data.json"):
+    with store_lock.write():
+        records = get_backend().load("ideas")
+        if records == ideas_data:
+            return
+        ideas_data = records
+        _records_by_id["ideas"] = {}
+        _forget_positions("ideas")
+        _register_records("ideas", ideas_data)
+        _record_change("ideas", "reset")
+
+
+def reload_if_changed(name):
+    """
+    마지막으로 읽거나 쓴 뒤 디스크의 컬렉션이 바뀌었을 때만 다시 불러옴
+
+    (mtime_ns, 크기, inode)가 그대로면 파싱을 건너뛰므로 탭 전환 등 새로고침이
+    데이터 크기와 무관하게 끝남, 다시 불러왔으면 True
+    """
+    with store_lock.read():
+        changed = get_backend().changed_on_disk(name)
+    if not changed:
+        return False
+    with _process_guard():
+        if name == "nodes":
+            load_nodes()
+        else:
+            load_ideas()
+    return True
+
+
+def _register_records(name, records):
+    """레코드를 ID 맵에 등록 (ID가 없거나 중복된 레코드는 새 ID를 부여해 저장)"""
+    by_id = _records_by_id[name]
+    assigned = []
+    for record in records:
+        record_id = record.get("id")
+        if not record_id or record_id in by_id:
+            record_id = id_from_created_at(record.get("created_at"))
+            record["id"] = record_id
+            assigned.append(record)
+        by_id[record_id] = record
+
+    if assigned:
+        _persist(name, "mark_changed", assigned)
+        print(f"[INFO] {name} {len(assigned)}건에 ID를 부여했습니다.")
+
+
+def _position(name, record_id):
+    """레코드의 현재 목록 위치 (백엔드 변경 훅은 위치 기준으로 동작)"""
+    position = _positions[name].get(record_id)
+    if position is not None and position < _positions_valid[name]:
+        return position
+    records = _get_records(name)
+    positions = _positions[name]
+    for position in range(_positions_valid[name], len(records)):
+        positions[records[position]["id"]] = position
+    _positions_valid[name] = len(records)
+    return positions[record_id]
+
+
+def _remove_position(name, record_id, position):
+    """position의 레코드가 목록에서 빠짐 (뒤쪽 위치는 다음 조회 때 다시 채움)"""
+    _positions[name].pop(record_id, None)
+    _positions_valid[name] = min(_positions_valid[name], position)
+
+
+def _forget_positions(name):
+    _positions[name] = {}
+    _positions_valid[name] = 0
+
+
+def _record_change(name, op, record_ids=()):
+    """
+    컬렉션 버전을 올리고 변경 피드에 기록 후 구독자에게 알림 (쓰기 잠금 안에서 호출)
+
+    op가 "reset"이면 컬렉션 전체가 바뀐 것 (불러오기/전체 삭제)
+    """
+    _versions[name] += 1
+    version = _versions[name]
+    feed = _change_feed[name]
+    if op == "reset":
+        feed.clear()
+        _feed_start[name] = version
+    else:
+        for record_id in record_ids:
+            if len(feed) == feed.maxlen:
+                # 가장 오래된 항목이 밀려나면 그 버전부터는 피드로 답할 수 없음
+                _feed_start[name] = max(_feed_start[name], feed[0][0])
+            feed.append((version, op, record_id))
+    if name == "nodes":
+        _update_node_index(op, record_ids)
+    else:
+        _update_idea_index(op, record_ids)
+
+    for callback in list(_subscribers):
         try:
-            with open("data/ideas_data.json", "r", encoding="utf-8") as f:
-                ideas_data = json.load(f)
-        except (json.JSONDecodeError, ValueError):
-            ideas_data = []
+            callback(name, version, op, list(record_ids))
+        except Exception as e:
+            # 변경은 이미 저장되었으므로 구독자 오류로 변경 자체를 실패시키지 않음
+            print(f"[ERROR] 변경 구독자 호출 실패: {e}")
+
+
+def _update_node_index(op, record_ids):
+    if op == "reset":
+        _node_index.rebuild(nodes_data)
+        _node_frame.rebuild(nodes_data)
+        _tag_trie.rebuild(node.get("tags", []) for node in nodes_data)
+        _node_text_index.invalidate()
+        _node_chosung_index.rebuild(
+            (node["id"], _node_chosung_text(node)) for node in nodes_data
+        )
+    elif op == "removed":
+        for record_id in record_ids:
+            _tag_trie.remove(_node_index.tags_of(record_id))
+            _node_frame.remove(_node_index.position(record_id))
+            _node_index.remove(record_id)
+            _node_text_index.remove(record_id)
+            _node_chosung_index.remove(record_id)
     else:
-        ideas_data = []
+        for record_id in record_ids:
+            node = _records_by_id["nodes"][record_id]
+            _tag_trie.remove(_node_index.tags_of(record_id))
+            _node_index.update(node)
+            _node_frame.set(_node_index.position(record_id), node)
+            _tag_trie.add(_node_index.tags_of(record_id))
+            _node_text_index.add(node)
+            _node_chosung_index.set(record_id, _node_chosung_text(node))
+
+
+def _update_idea_index(op, record_ids):
+    if op == "reset":
+        _idea_chosung_index.rebuild(
+            (idea["id"], _idea_chosung_text(idea)) for idea in ideas_data
+        )
+        _idea_text_index.invalidate()
+    elif op == "removed":
+        for record_id in record_ids:
+            _idea_chosung_index.remove(record_id)
+            _idea_text_index.remove(record_id)
+    else:
+        for record_id in record_ids:
+            idea = _records_by_id["ideas"][record_id]
+            _idea_chosung_index.set(record_id, _idea_chosung_text(idea))
+            if _idea_text_index.built:
+                # 본문을 따로 두는 백엔드(archive)는 색인을 만든 뒤에만 본문을 읽음
+                _idea_text_index.add(get_backend().read("ideas", idea))
+
+
+def _node_chosung_text(node):
+    return f"{node.get('title', '')}\n{' '.join(node.get('tags', []))}"
+
+
+def _idea_chosung_text(idea):
+    row = _idea_row(idea)
+    return f"{row.get('title') or ''}\n{row.get('contest_title') or ''}"
+
+
+def _idea_row(idea):
+    """메모리의 아이디어 레코드로 목록 행 만들기"""
+    if "contest_title" in idea:
+        # archive 방식의 아이디어는 목록 컬럼만 가진 인덱스 엔트리
+        return {field: idea.get(field) for field in INDEX_FIELDS}
+    return idea_list_row(idea)
+
+
+def get_version(name):
+    """컬렉션("nodes"/"ideas")의 현재 데이터 버전"""
+    _sync_from_disk()
+    with store_lock.read():
+        return _versions[name]
+
+
+def changes_since(name, version):
+    """
+    version 이후의 변경 요약 {"version", "added", "updated", "removed"} (ID 목록)
+
+    그 사이 전체 다시 읽기가 있었거나 피드에서 밀려난 경우 None (전체 다시 계산)
+    """
+    _sync_from_disk()
+    with store_lock.read():
+        current = _versions[name]
+        if version < _feed_start[name] or version > current:
+            return None
+
+        added, updated, removed = {}, {}, {}
+        for entry_version, op, record_id in _change_feed[name]:
+            if entry_version <= version:
+                continue
+            if op == "added":
+                added[record_id] = None
+            elif op == "updated":
+                if record_id not in added:
+                    updated[record_id] = None
+            elif record_id in added:
+                # 구간 안에서 추가 후 삭제된 레코드는 변경 없음
+                del added[record_id]
+            else:
+                updated.pop(record_id, None)
+                removed[record_id] = None
+
+        return {
+            "version": current,
+            "added": list(added),
+            "updated": list(updated),
+            "removed": list(removed),
+        }
+
+
+def subscribe(callback):
+    """
+    변경 구독: 변경마다 callback(name, version, op, record_ids) 호출, 구독 해제 함수 반환
+
+    콜백은 쓰기 잠금을 보유한 채 호출되므로 가볍게 처리해야 함
+    (데이터 조회는 가능하지만 다른 스레드를 기다리는 작업은 금지)
+    """
+    _subscribers.append(callback)
+
+    def unsubscribe():
+        if callback in _subscribers:
+            _subscribers.remove(callback)
+
+    return unsubscribe
 
 
 def initialize_data():
     """앱 시작 시 데이터 초기화"""
-    load_nodes()
-    load_ideas()
+    # 기존 파일 변환(최초 실행)이 여러 워커에서 동시에 일어나지 않도록 함
+    with _process_guard():
+        load_nodes()
+        load_ideas()
+
+        snapshots = get_node_snapshots()
+        first_run = not snapshots.exists()
+        snapshots.load()
+        if first_run:
+            # 스냅샷 저장소가 생기기 전의 아이디어는 노드 사본을 내장하고 있음
+            migrate_embedded_nodes()
+
+
+def add_node(node):
+    """노드에 새 ID를 부여해 추가 후 저장, 부여한 ID 반환"""
+    with _exclusive():
+        _ensure_nodes_loaded([node.get("tenant", "미지정")])
+        node["id"] = new_id()
+        nodes_data.append(node)
+        _persist("nodes", "append", node)
+        _record_history("record_created", node)
+        _records_by_id["nodes"][node["id"]] = node
+        _record_change("nodes", "added", [node["id"]])
+        return node["id"]
+
+
+def edit_node(node_id, fields):
+    """ID에 해당하는 노드 필드 갱신 후 저장, 해당 노드가 없으면 False"""
+    with _exclusive():
+        node = _find_node(node_id)
+        if node is None:
+            return False
+        if "tenant" in fields:
+            # 옮겨 갈 테넌트의 노드도 메모리에 있어야 함께 저장됨 (샤드 백엔드)
+            _ensure_nodes_loaded([fields["tenant"]])
+        previous = dict(node)
+        node.update(fields)
+        _persist("nodes", "update", _position("nodes", node_id), fields, previous)
+        _record_history("record_updated", previous, node)
+        _record_change("nodes", "updated", [node_id])
+        return True
+
+
+def remove_node(node_id):
+    """ID에 해당하는 노드 삭제 후 저장, 삭제된 노드 반환 (없으면 None)"""
+    with _exclusive():
+        node = _find_node(node_id)
+        if node is None:
+            return None
+        del _records_by_id["nodes"][node_id]
+        index = _position("nodes", node_id)
+        del nodes_data[index]
+        _remove_position("nodes", node_id, index)
+        _persist("nodes", "delete", index, node)
+        _record_history("record_deleted", node)
+        _record_change("nodes", "removed", [node_id])
+        return node
+
+
+def get_node(node_id):
+    """ID에 해당하는 노드 사본 반환 (없으면 None)"""
+    _sync_from_disk()
+    if node_id not in _records_by_id["nodes"]:
+        # 아직 불러오지 않은 샤드에 있을 수 있음 (샤드 백엔드)
+        _ensure_nodes_loaded()
+    with store_lock.read():
+        node = _records_by_id["nodes"].get(node_id)
+        return dict(node) if node is not None else None
+
+
+def _find_node(node_id):
+    """ID로 노드 찾기 (아직 불러오지 않은 샤드에 있을 수 있으면 모두 불러온 뒤 다시 찾음)"""
+    node = _records_by_id["nodes"].get(node_id)
+    if node is None and get_backend().has_unloaded("nodes"):
+        _ensure_nodes_loaded()
+        node = _records_by_id["nodes"].get(node_id)
+    return node
+
+
+def node_revisions(node_id):
+    """노드의 리비전 목록 [{"rev", "at", "op", "fields"}] (오래된 순)"""
+    return get_node_history().revisions(node_id)
+
+
+def node_at_revision(node_id, rev):
+    """rev 리비전 시점의 노드 (없거나 삭제된 리비전이면 None)"""
+    return get_node_history().node_at_revision(node_id, rev)
+
+
+def node_as_of(node_id, when):
+    """
+    when 시점의 노드 (그때 없었거나 삭제된 상태면 None)
+
+    아이디어의 created_at을 넘기면 아이디어 생성에 쓰인 시점의 노드를 얻을 수 있음
+    """
+    return get_node_history().node_as_of(node_id, when)
+
+
+def diff_node_revisions(node_id, rev_a, rev_b):
+    """두 리비전 사이에 바뀐 필드 {필드: (rev_a 값, rev_b 값)}"""
+    return get_node_history().diff(node_id, rev_a, rev_b)
+
+
+def add_idea(idea):
+    """아이디어에 새 ID를 부여해 추가 후 저장, 부여한 ID 반환"""
+    with _exclusive():
+        idea["id"] = new_id()
+        ideas_data.append(idea)
+        _persist("ideas", "append", idea)
+        # 백엔드가 목록의 레코드를 교체할 수 있으므로 (archive) 목록 쪽 객체를 등록
+        _records_by_id["ideas"][idea["id"]] = ideas_data[-1]
+        _record_change("ideas", "added", [idea["id"]])
+        return idea["id"]
+
+
+def remove_idea(idea_id):
+    """ID에 해당하는 아이디어 삭제 후 저장, 삭제된 아이디어 반환 (없으면 None)"""
+    with _exclusive():
+        idea = _records_by_id["ideas"].pop(idea_id, None)
+        if idea is None:
+            return None
+        index = _position("ideas", idea_id)
+        del ideas_data[index]
+        _remove_position("ideas", idea_id, index)
+        _persist("ideas", "delete", index, idea)
+        _record_change("ideas", "removed", [idea_id])
+        return idea
+
+
+def get_idea(idea_id):
+    """ID에 해당하는 아이디어 전체(본문 포함) 반환 (없으면 None)"""
+    _sync_from_disk()
+    with store_lock.read():
+        idea = _records_by_id["ideas"].get(idea_id)
+        if idea is None:
+            return None
+        return get_backend().read("ideas", idea)
+
+
+def clear_all_ideas():
+    """모든 아이디어 삭제 후 저장"""
+    global ideas_data
+    with _exclusive():
+        ideas_data = []
+        _records_by_id["ideas"] = {}
+        _forget_positions("ideas")
+        _persist("ideas", "clear")
+        _record_change("ideas", "reset")
+
+
+def store_node_snapshots(nodes):
+    """노드 스냅샷을 저장하고 아이디어에 넣을 해시 목록 반환"""
+    return get_node_snapshots().put_many(nodes)
+
+
+def resolve_used_nodes(idea):
+    """아이디어가 참조하는 노드 목록 반환 (해시 참조 또는 기존 내장 사본)"""
+    if "used_node_hashes" in idea:
+        return get_node_snapshots().resolve(idea["used_node_hashes"])
+    return idea.get("used_nodes", [])
+
+
+def migrate_embedded_nodes():
+    """used_nodes 사본을 내장한 기존 아이디어를 해시 참조로 변환 (1회성)"""
+    disk_before = _data_dir_size()
+    replacements = {}
+    embedded_bytes = 0
+
+    with _exclusive():
+        for index, record in enumerate(ideas_data):
+            idea = get_backend().read("ideas", record)
+            if "used_nodes" not in idea:
+                continue
+            used_nodes = idea.pop("used_nodes")
+            embedded_bytes += len(json.dumps(used_nodes, ensure_ascii=False).encode())
+            idea["used_node_hashes"] = store_node_snapshots(used_nodes)
+            replacements[index] = idea
+
+        # 변환할 아이디어가 없어도 스냅샷 파일을 만들어 다음 시작 때 다시 돌지 않게 함
+        store_node_snapshots([])
+        if replacements:
+            get_backend().replace_records("ideas", replacements)
+            for index in replacements:
+                _records_by_id["ideas"][ideas_data[index]["id"]] = ideas_data[index]
+            _record_change(
+                "ideas",
+                "updated",
+                [ideas_data[index]["id"] for index in replacements],
+            )
+    flush()
+
+    snapshot_bytes = len(
+        json.dumps(get_node_snapshots().snapshots, ensure_ascii=False).encode()
+    )
+    report = {
+        "migrated_ideas": len(replacements),
+        "embedded_node_bytes": embedded_bytes,
+        "snapshot_bytes": snapshot_bytes,
+        "disk_bytes_before": disk_before,
+        "disk_bytes_after": _data_dir_size(),
+    }
+    if replacements:
+        print(
+            f"[INFO] 아이디어 {report['migrated_ideas']}건의 노드 사본을 해시 참조로 변환: "
+            f"메모리 {embedded_bytes:,}B → {snapshot_bytes:,}B, "
+            f"디스크 {report['disk_bytes_before']:,}B → {report['disk_bytes_after']:,}B"
+        )
+    return report
+
+
+def _data_dir_size():
+    """data 디렉토리 전체 파일 크기(바이트)"""
+    if not os.path.isdir(DATA_DIR):
+        return 0
+    return sum(
+        entry.stat().st_size for entry in os.scandir(DATA_DIR) if entry.is_file()
+    )
+
+
+def _ensure_nodes_loaded(selected_tenants=None):
+    """필터에 필요한 노드가 아직 메모리에 없으면 불러옴 (샤드 백엔드)"""
+    backend = get_backend()
+    if not backend.has_unloaded("nodes", selected_tenants):
+        return
+    with store_lock.write():
+        more = backend.load_more("nodes", selected_tenants)
+        if not more:
+            return
+        nodes_data.extend(more)
+        _register_records("nodes", more)
+        _record_change("nodes", "added", [node["id"] for node in more])
+
+
+def count_nodes():
+    """저장된 전체 노드 수"""
+    _sync_from_disk()
+    with store_lock.read():
+        return get_backend().count("nodes")
+
+
+def all_tenants():
+    """모든 노드의 테넌트 목록"""
+    return _facet_values("tenants")
+
+
+def all_tags():
+    """모든 노드의 태그 목록"""
+    return _facet_values("tags")
+
+
+def _facet_values(kind):
+    _sync_from_disk()
+    with store_lock.read():
+        backend = get_backend()
+        if backend.has_unloaded("nodes"):
+            # 샤드 백엔드: 아직 불러오지 않은 노드까지 포함하려면 manifest 기준
+            return getattr(backend, kind)()
+        return getattr(_node_index, kind)()
+
+
+def suggest_tags(text, limit=SUGGEST_LIMIT):
+    """
+    입력 중인 키워드로 시작하는 기존 태그 추천 [(태그, 사용 노드 수)]
+
+    오타를 허용하며 (입력 길이에 따라 편집 거리 1~2), 가까운 것부터 많이 쓰인 순
+    """
+    _sync_from_disk()
+    with store_lock.read():
+        trie = _suggestion_trie()
+        return [(tag, count) for tag, count, _ in trie.suggest(text, limit)]
+
+
+def canonical_tag(tag):
+    """대소문자/공백만 다른 기존 태그가 있으면 가장 많이 쓰인 그 표기, 없으면 tag 그대로"""
+    _sync_from_disk()
+    with store_lock.read():
+        return _suggestion_trie().canonical(tag) or tag
+
+
+def _suggestion_trie():
+    """
+    태그 추천/표기 통일에 쓸 태그 사전 (읽기 잠금 안에서 호출)
+
+    아직 불러오지 않은 샤드가 있으면 (샤드 백엔드) 샤드를 읽는 대신 manifest의
+    태그별 노드 수로 만든 사전
+    """
+    global _manifest_tag_trie
+    backend = get_backend()
+    if not backend.has_unloaded("nodes"):
+        return _tag_trie
+    version, trie = _manifest_tag_trie
+    if version != _versions["nodes"]:
+        trie = TagTrie()
+        for tag, count in backend.tag_counts().items():
+            trie.add_count(tag, count)
+        _manifest_tag_trie = (_versions["nodes"], trie)
+    return trie
+
+
+def node_facet_counts(search_text="", selected_tenants=None, selected_tags=None):
+    """
+    현재 필터에서의 {"tenants": {테넌트: 노드 수}, "tags": {태그: 노드 수}}
+
+    드롭다운에 "파이썬 (42)"처럼 표시하기 위한 값으로, 각 수는 해당 항목을 추가로
+    선택했을 때 (다른 쪽 필터와 검색어/태그 쿼리를 유지한 채) 보이게 될 노드 수
+    """
+    query = _tag_query(search_text)
+    _sync_from_disk()
+    if not search_text and not selected_tags:
+        # 테넌트별/태그별 노드 수만 있으면 되므로 샤드 manifest로 답함 (샤드를 읽지 않음)
+        with store_lock.read():
+            backend = get_backend()
+            if backend.has_unloaded("nodes"):
+                return _backend_facet_counts(backend, selected_tenants)
+    # 다른 테넌트를 고를 때의 수도 필요하므로 모든 노드가 메모리에 있어야 함
+    _ensure_nodes_loaded()
+    with store_lock.read():
+        within = None
+        if query is not None:
+            within = query.evaluate(_node_index)
+        elif search_text:
+            within = _node_index.bits_from_ids(_ranked_search(search_text))
+        return _node_index.facet_counts(selected_tenants, selected_tags, within)
+
+
+def _backend_facet_counts(backend, selected_tenants):
+    """검색어/태그 필터가 없을 때의 facet 수를 백엔드의 테넌트/태그별 수로 계산"""
+    all_tags = backend.tag_counts()
+    selected = backend.tag_counts(selected_tenants) if selected_tenants else all_tags
+    return {
+        "tenants": {
+            tenant: n for tenant, n in sorted(backend.tenant_counts().items()) if tenant
+        },
+        "tags": {tag: selected.get(tag, 0) for tag in sorted(all_tags)},
+    }
+
+
+def query_nodes(
+    search_text="",
+    selected_tenants=None,
+    selected_tags=None,
+    limit=None,
+    offset=0,
+    created_from=None,
+    created_to=None,
+):
+    """
+    필터 조건에 맞는 노드 목록 (백엔드에서 페이지네이션 처리)
+
+    - search_text는 제목/설명/태그 전문 검색 (결과는 BM25 관련도 순)
+    - 초성이 섞인 search_text(예: "AI ㅁㄷ")는 제목/태그 초성 검색 (시작 일치 우선)
+    - search_text가 태그 쿼리(src.tag_query)이면 쿼리 조건을 적용 (저장 순서),
+      쿼리로 해석되지 않는 검색어는 전문 검색
+    - created_from/created_to("%Y-%m-%d %H:%M:%S")는 생성일 범위 (양 끝 포함)
+    - 검색어가 없고 백엔드가 자체 인덱스로 필터를 처리하면 (sqlite) 필터/페이지네이션을
+      모두 백엔드에 맡김
+    """
+    query = _tag_query(search_text)
+    _sync_from_disk()
+    backend = get_backend()
+    if not search_text and backend.filters_in_storage:
+        with store_lock.read():
+            return backend.query_nodes(
+                "",
+                selected_tenants,
+                selected_tags,
+                limit,
+                offset,
+                created_from=created_from,
+                created_to=created_to,
+            )
+    # 쿼리의 NOT/tenant: 조건은 모든 테넌트의 노드를 봐야 함
+    _ensure_nodes_loaded(None if query else selected_tenants)
+    with store_lock.read():
+        candidates = None
+        matched = _node_index.match(selected_tenants, selected_tags)
+        if query is not None:
+            matched = intersect(matched, query.evaluate(_node_index))
+        by_id = _records_by_id["nodes"]
+        if search_text and query is None:
+            within = _node_index.ordered(matched) if matched is not None else None
+            ranked = _ranked_search(search_text, within)
+            if within is not None:
+                allowed = set(within)
+                ranked = [node_id for node_id in ranked if node_id in allowed]
+            candidates = [by_id[node_id] for node_id in ranked]
+        elif matched is not None:
+            # 테넌트/태그 필터와 쿼리는 역색인 비트맵으로 처리
+            candidates = [by_id[node_id] for node_id in _node_index.ordered(matched)]
+        if candidates is not None:
+            search_text = ""
+        return backend.query_nodes(
+            search_text,
+            selected_tenants,
+            selected_tags,
+            limit,
+            offset,
+            candidates,
+            created_from,
+            created_to,
+        )
+
+
+def nodes_table(
+    search_text="", selected_tenants=None, selected_tags=None, limit=None, offset=0
+):
+    """
+    query_nodes와 같은 조건/순서의 노드 목록 표 (DataFrame, 컬럼은 NODE_COLUMNS)
+
+    노드마다 dict를 만들지 않고, 필터를 행 번호 배열/불리언 마스크로 계산한 뒤
+    열 지향 표(_node_frame)에서 해당 행만 골라냄
+    """
+    query = _tag_query(search_text)
+    _sync_from_disk()
+    _ensure_nodes_loaded(None if query else selected_tenants)
+    with store_lock.read():
+        matched = _node_index.match(selected_tenants, selected_tags)
+        if query is not None:
+            matched = intersect(matched, query.evaluate(_node_index))
+        if search_text and query is None:
+            within = _node_index.ordered(matched) if matched is not None else None
+            ranked = _node_index.positions(_ranked_search(search_text, within))
+            positions = _node_frame.keep(ranked, matched)
+        else:
+            positions = _node_frame.positions(matched)
+        return _node_frame.rows(paginate(positions, limit, offset))
+
+
+def search_nodes(search_text):
+    """전문 검색 결과 [(노드 ID, BM25 점수)] (점수 내림차순)"""
+    _sync_from_disk()
+    _ensure_nodes_loaded()
+    with store_lock.read():
+        _node_text_index.ensure_built(nodes_data)
+        return _node_text_index.search(search_text)
+
+
+def start_search_index_warmup():
+    """
+    노드/아이디어 전문 검색 색인을 백그라운드 스레드에서 미리 만듦
+    (첫 검색이 색인 생성을 기다리지 않게)
+
+    만드는 동안 읽기 잠금을 잡으므로 그 사이의 변경은 색인 생성이 끝날 때까지 대기
+    archive 방식은 아이디어 색인을 만들려면 모든 본문을 읽고 압축 세그먼트를 풀어야
+    하므로 미리 만들지 않음 (첫 아이디어 검색 때 만듦)
+    """
+
+    def run():
+        try:
+            _sync_from_disk()
+            with store_lock.read():
+                _node_text_index.ensure_built(nodes_data)
+            if STORAGE_MODE != "archive":
+                with store_lock.read():
+                    _ensure_idea_text_index()
+        except Exception as e:
+            print(f"[ERROR] 전문 검색 색인 생성 실패: {e}")
+
+    threading.Thread(target=run, daemon=True).start()
+
+
+def _ranked_search(search_text, within=None):
+    """
+    검색어에 맞는 노드 ID 목록 (순위 순, 읽기 잠금 안에서 호출)
+
+    within(노드 ID 목록)은 테넌트/태그 필터로 좁힌 후보 (전문 검색은 그 안에서만
+    점수를 계산하며, 초성 검색 결과는 호출한 쪽에서 거름)
+    """
+    if has_chosung(search_text):
+        return _node_chosung_index.search(search_text)
+    return _text_search(search_text, within)
+
+
+def _text_search(search_text, within=None):
+    """전문 검색에 맞는 노드 ID 목록 (관련도 순, 읽기 잠금 안에서 호출)"""
+    _node_text_index.ensure_built(nodes_data)
+    return _node_text_index.search_ids(search_text, within)
+
+
+def normalized_tag_query(search_text):
+    """검색어가 태그 쿼리이면 정규화한 쿼리 문자열, 아니면 빈 문자열"""
+    query = _tag_query(search_text)
+    return query.text if query is not None else ""
+
+
+def _tag_query(search_text):
+    if not is_tag_query(search_text):
+        return None
+    return compile_query(search_text.strip())
+
+
+def query_ideas(search_text="", limit=None, offset=0):
+    """
+    검색어에 맞는 아이디어 목록 행
+
+    - 검색어가 없으면 최신순 전체 (백엔드에서 처리)
+    - 검색어는 제목/공모전 제목/개요/본문 섹션 전문 검색 (BM25 관련도 순)이며,
+      행의 "snippet"에 검색어가 가장 많이 나온 섹션의 발췌 (예: "[솔루션] …【센서】…")
+    - 초성이 섞인 검색어는 제목/공모전 제목 초성 색인으로 찾음 (최신순)
+    """
+    _sync_from_disk()
+    with store_lock.read():
+        backend = get_backend()
+        if search_text and has_chosung(search_text):
+            matched = set(_idea_chosung_index.search(search_text))
+            rows = [row for row in backend.query_ideas() if row["id"] in matched]
+            return paginate(rows, limit, offset)
+        if not search_text or not search_text.strip():
+            return backend.query_ideas("", limit, offset)
+
+        by_id = _records_by_id["ideas"]
+        _ensure_idea_text_index()
+        ranked = _idea_text_index.search(search_text, limit, offset)
+        rows = []
+        for idea_id, _ in ranked:
+            idea = by_id[idea_id]
+            row = _idea_row(idea)
+            # 발췌는 화면에 보일 행만 만듦 (archive는 이때 본문을 읽음)
+            row["snippet"] = snippet(backend.read("ideas", idea), search_text)
+            rows.append(row)
+        return rows
+
+
+def _ensure_idea_text_index():
+    """아이디어 전문 검색 색인이 없으면 전체 본문으로 만듦 (읽기 잠금 안에서 호출)"""
+    if not _idea_text_index.built:
+        backend = get_backend()
+        _idea_text_index.ensure_built(
+            backend.read("ideas", idea) for idea in ideas_data
+        )
 
 
 def get_ideas_data():
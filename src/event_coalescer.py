@@ -0,0 +1,101 @@
+import itertools
+import threading
+import time
+
+import src.data_manager as dm
+
+
+class EventCoalescer:
+    """
+    짧은 시간에 몰린 같은 묶음의 이벤트를 마지막 값 한 번의 계산으로 합치는 장치
+
+    - 묶음 키(예: (세션, "노드 필터"))마다 가장 최근 호출 번호, 계산 중 여부, 다음 계산
+      가능 시각(직전 계산이 끝나고 window초 뒤)을 기억
+    - 계산 중이 아니고 직전 계산 후 window초가 지났으면 기다리지 않고 바로 계산
+      (단독 이벤트는 지연 없음)
+    - 계산 중이거나 계산이 끝난 뒤 window초 안에 들어온 호출은 다음 계산 가능 시각까지
+      기다렸다가, 그사이 더 새 호출이 들어왔으면 계산하지 않고 superseded 반환
+      (묶음의 마지막 값만 한 번 계산)
+    - 계산하는 동안 더 새 호출이 들어왔으면 결과를 버리고 superseded 반환
+      (늦게 끝난 이전 값의 결과가 최신 화면을 덮어쓰지 않음)
+    - 호출이 없고 다음 계산 가능 시각도 지난 키는 다음 호출 때 정리 (세션별 키가 쌓이지 않게)
+    - 합친 수/버린 수를 stats()로 제공
+    """
+
+    def __init__(self, window):
+        self.window = window
+        self._cond = threading.Condition()
+        self._tickets = itertools.count(1)
+        # 묶음 키 → {"latest": 최근 호출 번호, "callers": 진행 중인 호출 수,
+        # "running": 계산 중, "ready_at": 다음 계산 가능 시각}
+        self._keys = {}
+        self._next_sweep = 0.0
+        self._counters = {"computed": 0, "coalesced": 0, "dropped": 0}
+
+    def run(self, key, compute, superseded=None):
+        """key 묶음의 최신 호출이면 compute() 결과, 더 새 호출에 밀렸으면 superseded"""
+        with self._cond:
+            self._sweep()
+            ticket = next(self._tickets)
+            state = self._keys.setdefault(
+                key, {"latest": 0, "callers": 0, "running": False, "ready_at": 0.0}
+            )
+            state["latest"] = ticket
+            state["callers"] += 1
+            self._cond.notify_all()
+            computing = False
+            try:
+                while True:
+                    if state["latest"] != ticket:
+                        self._counters["coalesced"] += 1
+                        return superseded
+                    if state["running"]:
+                        self._cond.wait()
+                        continue
+                    remaining = state["ready_at"] - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+                state["running"] = computing = True
+            finally:
+                if not computing:
+                    state["callers"] -= 1
+
+        try:
+            result = compute()
+        finally:
+            with self._cond:
+                state["running"] = False
+                state["callers"] -= 1
+                # 키는 남겨 두어 window 안에 이어지는 호출도 합침
+                state["ready_at"] = time.monotonic() + self.window
+                latest = state["latest"] == ticket
+                self._cond.notify_all()
+        with self._cond:
+            if not latest:
+                self._counters["dropped"] += 1
+                return superseded
+            self._counters["computed"] += 1
+        return result
+
+    def _sweep(self):
+        """호출이 없고 window가 지난 키 정리 (잠금 안에서 호출, window마다 한 번)"""
+        now = time.monotonic()
+        if now < self._next_sweep:
+            return
+        self._next_sweep = now + self.window
+        for key in [
+            key
+            for key, state in self._keys.items()
+            if not state["callers"] and state["ready_at"] <= now
+        ]:
+            del self._keys[key]
+
+    def stats(self):
+        """{"computed", "coalesced", "dropped", "pending"} (pending: 호출이 진행 중인 묶음 수)"""
+        with self._cond:
+            pending = sum(1 for state in self._keys.values() if state["callers"])
+            return dict(self._counters, pending=pending)
+
+
+filters = EventCoalescer(dm.FILTER_COALESCE_SECONDS)
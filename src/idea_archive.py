@@ -0,0 +1,358 @@
+import json
+import mmap
+import os
+import threading
+from datetime import datetime, timedelta
+
+from src.idea_segments import ColdSegments
+from src.json_stream import stream_json_array
+from src.storage import (
+    DEFAULT_CREATED_AT,
+    JsonBackend,
+    idea_list_row,
+    idea_row_matches,
+    paginate,
+)
+
+# 메모리에 상주하는 목록 컬럼 (나머지 본문은 아카이브에서 필요할 때만 읽음)
+INDEX_FIELDS = ("id", "created_at", "contest_title", "title", "overview", "ai_name")
+
+
+class IdeaArchive:
+    """
+    아이디어 본문 아카이브 + 상주 인덱스
+
+    - data/ideas_archive.jsonl: 아이디어 본문을 한 줄씩 추가 (추가 전용)
+    - data/ideas_index.jsonl: 목록 컬럼 + 본문의 바이트 위치(offset, length)
+    - 본문은 mmap으로 필요한 구간만 읽으므로 상주 메모리는 인덱스 크기에 비례
+    - hot_days가 지난 달의 본문은 data/ideas_cold/의 압축 세그먼트로 옮김
+      (엔트리에 "segment"가 있으면 해당 세그먼트 안의 위치)
+    """
+
+    def __init__(self, data_dir, hot_days=0, cold_codec="lzma"):
+        self.data_dir = data_dir
+        self.archive_path = os.path.join(data_dir, "ideas_archive.jsonl")
+        self.index_path = os.path.join(data_dir, "ideas_index.jsonl")
+        self.legacy_path = os.path.join(data_dir, "ideas_data.json")
+        self.hot_days = hot_days
+        self.cold = ColdSegments(os.path.join(data_dir, "ideas_cold"), cold_codec)
+
+        self._lock = threading.Lock()
+        self._file = None
+        self._mmap = None
+
+    # ------------------------------------------------------------------
+    # 불러오기
+    # ------------------------------------------------------------------
+    def load_index(self):
+        """인덱스 엔트리 목록 불러오기 (없으면 아카이브/레거시 JSON에서 생성)"""
+        with self._lock:
+            self._close_mmap()
+            self.cold.clear_cache()
+            if os.path.exists(self.index_path):
+                entries = self._read_index()
+            else:
+                if os.path.exists(self.archive_path) or self.cold.names():
+                    entries = self._rebuild_index()
+                else:
+                    entries = self._import_legacy_json()
+                self._write_index(entries)
+            self._roll_cold(entries)
+            return entries
+
+    def _read_index(self):
+        entries = []
+        with open(self.index_path, "r", encoding="utf-8") as f:
+            for line_no, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                try:
+                    entries.append(json.loads(line))
+                except (json.JSONDecodeError, ValueError):
+                    # 크래시로 잘린 줄: 해당 엔트리만 건너뜀
+                    print(
+                        f"[WARN] ideas_index.jsonl {line_no}번째 줄 손상, 건너뜁니다."
+                    )
+        return entries
+
+    def _rebuild_index(self):
+        """세그먼트와 아카이브 전체를 훑어 인덱스 재생성 (인덱스 파일이 없을 때만)"""
+        entries = []
+        for name in self.cold.names():
+            offset = 0
+            for raw in self.cold.decompress(name).splitlines(keepends=True):
+                length = len(raw.rstrip(b"\n"))
+                try:
+                    entry = make_index_entry(json.loads(raw), offset, length)
+                    entry["segment"] = name
+                    entries.append(entry)
+                except (json.JSONDecodeError, ValueError):
+                    pass
+                offset += len(raw)
+
+        if not os.path.exists(self.archive_path):
+            return entries
+        offset = 0
+        with open(self.archive_path, "rb") as f:
+            for raw in f:
+                length = len(raw.rstrip(b"\n"))
+                try:
+                    idea = json.loads(raw)
+                except (json.JSONDecodeError, ValueError):
+                    offset += len(raw)
+                    continue
+                entries.append(make_index_entry(idea, offset, length))
+                offset += len(raw)
+        return entries
+
+    def _import_legacy_json(self):
+        """기존 data/ideas_data.json을 아카이브로 옮김 (레코드 단위로 읽으며 인덱스 생성)"""
+        if not os.path.exists(self.legacy_path):
+            return []
+
+        entries = []
+        os.makedirs(self.data_dir, exist_ok=True)
+        with open(self.archive_path, "ab") as f:
+            for idea in stream_json_array(
+                self.legacy_path,
+                os.path.join(self.data_dir, "ideas_quarantine.jsonl"),
+            ):
+                data = json.dumps(idea, ensure_ascii=False).encode("utf-8")
+                entries.append(make_index_entry(idea, f.tell(), len(data)))
+                f.write(data + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        print(f"[INFO] 아이디어 {len(entries)}건을 아카이브로 옮겼습니다.")
+        return entries
+
+    # ------------------------------------------------------------------
+    # 본문 읽기 / 쓰기
+    # ------------------------------------------------------------------
+    def read(self, entry):
+        """인덱스 엔트리가 가리키는 아이디어 본문 전체를 읽음"""
+        if entry.get("segment"):
+            return self.cold.read(entry)
+        offset, length = entry["offset"], entry["length"]
+        with self._lock:
+            if self._mmap is None or offset + length > len(self._mmap):
+                self._open_mmap()
+            return json.loads(self._mmap[offset : offset + length])
+
+    def append(self, idea):
+        """본문을 아카이브 끝에 추가하고 인덱스 엔트리 반환"""
+        with self._lock:
+            entry = self._append_body(idea)
+            with open(self.index_path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            return entry
+
+    def _append_body(self, idea):
+        os.makedirs(self.data_dir, exist_ok=True)
+        data = json.dumps(idea, ensure_ascii=False).encode("utf-8")
+        with open(self.archive_path, "ab") as f:
+            offset = f.tell()
+            f.write(data + b"\n")
+            f.flush()
+            os.fsync(f.fileno())
+        return make_index_entry(idea, offset, len(data))
+
+    def save_index(self, entries):
+        """삭제 등으로 인덱스가 바뀌었을 때 인덱스 파일 재작성"""
+        with self._lock:
+            self._write_index(entries)
+            if not self._roll_cold(entries):
+                self._maybe_compact(entries)
+            self.cold.remove_unused({e["segment"] for e in entries if e.get("segment")})
+
+    def _write_index(self, entries):
+        os.makedirs(self.data_dir, exist_ok=True)
+        tmp_path = self.index_path + ".tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, self.index_path)
+
+    def _roll_cold(self, entries):
+        """
+        hot_days보다 오래된 달의 본문을 월별 압축 세그먼트로 옮김, 옮겼으면 True
+
+        달 단위로만 옮기므로 같은 달이 여러 번 나뉘어 작은 세그먼트가 생기지 않음
+        (옮긴 뒤 수정되어 아카이브에 다시 추가된 본문은 다음 번에 새 세그먼트로 감)
+        """
+        if not self.hot_days:
+            return False
+        cutoff = (datetime.now() - timedelta(days=self.hot_days)).strftime("%Y-%m")
+        by_month = {}
+        for entry in entries:
+            month = (entry.get("created_at") or "")[:7]
+            if not entry.get("segment") and month and month < cutoff:
+                by_month.setdefault(month, []).append(entry)
+        if not by_month:
+            return False
+
+        self._open_mmap()
+        for month, month_entries in sorted(by_month.items()):
+            bodies = [
+                self._mmap[e["offset"] : e["offset"] + e["length"]]
+                for e in month_entries
+            ]
+            locations = self.cold.write(month, bodies)
+            for entry, (name, offset, length) in zip(month_entries, locations):
+                entry["segment"] = name
+                entry["offset"] = offset
+                entry["length"] = length
+        self._close_mmap()
+
+        # 인덱스가 세그먼트를 가리키게 한 뒤에 아카이브에서 뺌 (중간에 죽어도 본문 보존)
+        self._write_index(entries)
+        self._maybe_compact(entries)
+        moved = sum(len(e) for e in by_month.values())
+        print(f"[INFO] 아이디어 {moved}건을 압축 세그먼트로 옮겼습니다.")
+        return True
+
+    def _maybe_compact(self, entries):
+        """삭제된 본문이 절반 이상이면 살아 있는 본문만 모아 아카이브 재작성"""
+        if not os.path.exists(self.archive_path):
+            return
+        hot_entries = [entry for entry in entries if not entry.get("segment")]
+        live_bytes = sum(entry["length"] + 1 for entry in hot_entries)
+        if os.path.getsize(self.archive_path) <= 2 * live_bytes + 1024 * 1024:
+            return
+
+        self._open_mmap()
+        tmp_path = self.archive_path + ".tmp"
+        offset = 0
+        with open(tmp_path, "wb") as f:
+            for entry in hot_entries:
+                start, length = entry["offset"], entry["length"]
+                f.write(self._mmap[start : start + length] + b"\n")
+                entry["offset"] = offset
+                offset += length + 1
+            f.flush()
+            os.fsync(f.fileno())
+        self._close_mmap()
+        os.replace(tmp_path, self.archive_path)
+        self._write_index(entries)
+
+    def _open_mmap(self):
+        self._close_mmap()
+        if not os.path.exists(self.archive_path):
+            raise FileNotFoundError(self.archive_path)
+        self._file = open(self.archive_path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def _close_mmap(self):
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+        self._mmap = None
+        self._file = None
+
+    def close(self):
+        with self._lock:
+            self._close_mmap()
+            self.cold.clear_cache()
+
+
+class ArchiveBackend(JsonBackend):
+    """
+    노드는 JSON 파일, 아이디어는 IdeaArchive에 저장하는 백엔드
+
+    메모리의 ideas_data에는 인덱스 엔트리만 두고 본문은 read()로 읽음
+    """
+
+    def __init__(
+        self,
+        data_dir,
+        get_records,
+        write_behind_delay=0,
+        binary_snapshot=False,
+        idea_hot_days=0,
+        cold_codec="lzma",
+        records_lock=None,
+    ):
+        super().__init__(
+            data_dir, get_records, write_behind_delay, binary_snapshot, records_lock
+        )
+        self.archive = IdeaArchive(data_dir, idea_hot_days, cold_codec)
+
+    def load(self, name):
+        if name == "ideas":
+            entries = self.archive.load_index()
+            self.remember_files(name)
+            return entries
+        return super().load(name)
+
+    def data_files(self, name):
+        if name == "ideas":
+            return [self.archive.index_path, self.archive.archive_path]
+        return super().data_files(name)
+
+    def read(self, name, record):
+        if name != "ideas":
+            return super().read(name, record)
+        idea = self.archive.read(record)
+        # 불러온 뒤 부여된 ID는 인덱스 엔트리에만 있으므로 엔트리 쪽을 따름
+        idea["id"] = record.get("id")
+        return idea
+
+    def save(self, name):
+        if name == "ideas":
+            self.archive.save_index(self.get_records(name))
+            self.remember_files(name)
+        else:
+            super().save(name)
+
+    def append(self, name, record):
+        if name != "ideas":
+            return super().append(name, record)
+        # data_manager가 목록 끝에 넣은 전체 레코드를 인덱스 엔트리로 교체
+        entry = self.archive.append(record)
+        self.remember_files(name)
+        records = self.get_records(name)
+        if records and records[-1] is record:
+            records[-1] = entry
+
+    def update(self, name, index, fields, previous=None):
+        if name != "ideas":
+            return super().update(name, index, fields, previous)
+        records = self.get_records(name)
+        idea = self.read(name, records[index])
+        idea.update(fields)
+        records[index] = self.archive.append(idea)
+        self.save(name)
+
+    def replace_records(self, name, replacements):
+        if name != "ideas":
+            return super().replace_records(name, replacements)
+        records = self.get_records(name)
+        for index, record in replacements.items():
+            records[index] = self.archive.append(record)
+        self.save(name)
+
+    def query_ideas(self, search_text="", limit=None, offset=0):
+        entries = sorted(
+            self.get_records("ideas"),
+            key=lambda x: x.get("created_at") or DEFAULT_CREATED_AT,
+            reverse=True,
+        )
+        rows = []
+        for entry in entries:
+            row = {field: entry.get(field) for field in INDEX_FIELDS}
+            if search_text and not idea_row_matches(row, search_text):
+                continue
+            rows.append(row)
+        return paginate(rows, limit, offset)
+
+    def close(self):
+        self.archive.close()
+
+
+def make_index_entry(idea, offset, length):
+    """아이디어 본문에서 상주 인덱스 엔트리 생성"""
+    entry = idea_list_row(idea)
+    entry["offset"] = offset
+    entry["length"] = length
+    return entry
@@ -2,6 +2,7 @@ import pandas as pd
 import src.data_manager as dm
 from src.openai_client import create_openai_client
 from src.node_functions import get_nodes_dataframe
+from src.result_cache import cached
 from datetime import datetime
 import pytz
 import gradio as gr
@@ -32,6 +33,9 @@ def generate_idea_with_chatgpt(
             contest_context,  # 입력된 값 유지
         )
 
+    # 노드 검색창의 태그 쿼리 (쿼리가 아닌 검색어는 "")
+    tag_query = dm.normalized_tag_query(search_text)
+
     try:
         # OpenAI 클라이언트 생성 (.env에서 API 키 자동 로드)
         client = create_openai_client()
@@ -67,31 +71,26 @@ def generate_idea_with_chatgpt(
                 "",  # contest_context 비우기
             )
 
-        # 사용된 노드와 필터 정보 추가
-        generated_idea["used_nodes"] = filtered_nodes
+        # 사용된 노드(스냅샷 해시 참조)와 필터 정보 추가
+        generated_idea["used_node_hashes"] = dm.store_node_snapshots(filtered_nodes)
         generated_idea["used_filters"] = {
             "search_text": search_text or "",
+            "tag_query": tag_query,
             "selected_tenants": selected_tenants or [],
             "selected_tags": selected_tags or [],
-            "total_nodes_available": len(dm.nodes_data),
+            "total_nodes_available": dm.count_nodes(),
             "filtered_nodes_count": len(filtered_nodes),
         }
 
-        # 생성일자 및 고유 ID 추가 (한국 시간)
+        # 생성일자 추가 (한국 시간), 고유 ID는 저장 시 dm.add_idea에서 부여
         kst = pytz.timezone("Asia/Seoul")
         current_time = datetime.now(kst)
-        generated_idea["id"] = current_time.strftime("%Y%m%d%H%M%S") + str(
-            len(dm.ideas_data)
-        )
-
         generated_idea["created_at"] = current_time.strftime("%Y-%m-%d %H:%M:%S")
         generated_idea["created_date"] = current_time.strftime("%Y-%m-%d")
         generated_idea["created_time"] = current_time.strftime("%H:%M:%S")
 
-        dm.ideas_data.append(generated_idea)
-
         try:
-            dm.save_ideas()
+            dm.add_idea(generated_idea)
         except Exception as save_error:
             return (
                 f"아이디어 생성은 완료되었지만 저장 중 오류가 발생했습니다: {save_error}",
@@ -119,8 +118,13 @@ def generate_idea_with_chatgpt(
         )
 
 
-def get_ideas_dataframe(search_text=""):
-    """생성된 아이디어들을 데이터프레임으로 변환 (최신순 정렬, 검색 지원)"""
+@cached("ideas")
+def get_ideas_dataframe(search_text="", limit=None, offset=0):
+    """생성된 아이디어들을 데이터프레임으로 변환 (최신순 정렬, 검색 지원, 버전별 캐시)"""
+    return _build_ideas_dataframe(search_text, limit, offset)
+
+
+def _build_ideas_dataframe(search_text="", limit=None, offset=0):
     columns = [
         "생성일시",
         "공모전 제목",
@@ -128,58 +132,38 @@ def get_ideas_dataframe(search_text=""):
         "아이디어 개요",
         "AI 이름",
     ]
+    # 전문 검색 결과는 검색어가 나온 섹션의 발췌를 마지막 열에 표시
+    # (선택한 행은 앞쪽 열 위치로 찾으므로 끝에 추가)
+    show_snippet = bool(search_text and search_text.strip())
+    if show_snippet:
+        columns.append("검색 일치")
 
     if not dm.ideas_data:
         return pd.DataFrame(columns=columns)
 
-    # 생성일시 기준으로 내림차순 정렬 (최신 아이디어가 위로)
-    sorted_ideas = sorted(
-        dm.ideas_data,
-        key=lambda x: x.get("created_at", "1900-01-01 00:00:00"),
-        reverse=True,
-    )
-
+    # 정렬(최신순 또는 검색 관련도 순)과 검색 필터는 data_manager에서 처리
     df_data = []
-    for idx, idea in enumerate(sorted_ideas):
-        # 원본 배열에서의 실제 인덱스 찾기
-        original_index = dm.ideas_data.index(idea)
-        # 공모전 제목 추출 (contest_info 딕셔너리에서)
-        contest_title = "N/A"
-        if idea.get("contest_info") and isinstance(idea.get("contest_info"), dict):
-            contest_title = idea.get("contest_info", {}).get("title", "N/A")
-
-        # 검색 필터 적용 (공모전 제목 또는 아이디어 제목에서 검색)
-        if search_text:
-            idea_title = idea.get("title", "").lower()
-            contest_title_search = contest_title.lower()
-            search_lower = search_text.lower()
-
-            # 공모전 제목이나 아이디어 제목 중 하나라도 검색어를 포함하지 않으면 제외
-            if not (search_lower in idea_title or search_lower in contest_title_search):
-                continue
-
-        df_data.append(
-            {
-                "생성일시": idea.get("created_at", "N/A"),
-                "공모전 제목": contest_title,
-                "아이디어 제목": idea.get("title", "제목 없음"),
-                "아이디어 개요": idea.get("overview", "개요 없음"),
-                "AI 이름": idea.get("ai_name", "Unknown"),
-                "_original_index": original_index,  # 숨겨진 원본 인덱스
-            }
-        )
+    for row in dm.query_ideas(search_text, limit, offset):
+        record = {
+            "생성일시": row["created_at"] or "N/A",
+            "공모전 제목": row["contest_title"],
+            "아이디어 제목": row["title"],
+            "아이디어 개요": row["overview"],
+            "AI 이름": row["ai_name"],
+        }
+        if show_snippet:
+            record["검색 일치"] = row.get("snippet", "")
+        df_data.append(record)
 
     # 필터링 결과가 없어도 컬럼명이 유지되도록 빈 DataFrame 반환
     if not df_data:
         return pd.DataFrame(columns=columns)
 
-    df = pd.DataFrame(df_data)
-    # _original_index 컬럼은 UI에서 보이지 않도록 처리
-    return df[["생성일시", "공모전 제목", "아이디어 제목", "아이디어 개요", "AI 이름"]]
+    return pd.DataFrame(df_data, columns=columns)
 
 
 def filter_ideas(search_text):
-    """아이디어 검색 (공모전 제목 또는 아이디어 제목에서 검색)"""
+    """아이디어 검색 (제목/공모전 제목/개요/본문 섹션 전문 검색 또는 초성 검색)"""
     df = get_ideas_dataframe(search_text)
     return gr.update(value=df)
 
@@ -230,11 +214,14 @@ def get_idea_details(selection_data):
     except Exception as e:
         return "아이디어 선택 중 오류가 발생했습니다.", "", "", "", "", "", ""
 
-    if selected_index >= len(dm.ideas_data):
+    # 화면 행 번호를 목록(최신순)의 아이디어 ID로 변환
+    rows = dm.query_ideas()
+    idea = None
+    if 0 <= selected_index < len(rows):
+        idea = dm.get_idea(rows[selected_index]["id"])
+    if idea is None:
         return "선택된 아이디어를 찾을 수 없습니다.", "", "", "", "", "", ""
 
-    idea = dm.ideas_data[selected_index]
-
     title = idea.get("title", "제목 없음")
     problem = idea.get("problem", "문제의식 정보가 없습니다.")
     solution = idea.get("solution", "솔루션 정보가 없습니다.")
@@ -260,17 +247,16 @@ def get_idea_details(selection_data):
     )
 
 
-def get_idea_details_by_index(selected_index):
-    """인덱스를 직접 받아서 아이디어 상세 정보 반환"""
+def get_idea_details_by_id(idea_id):
+    """ID를 직접 받아서 아이디어 상세 정보 반환"""
     try:
-        if selected_index is None or selected_index < 0:
-            return "올바르지 않은 인덱스입니다.", "", "", "", "", "", ""
+        if not idea_id:
+            return "올바르지 않은 ID입니다.", "", "", "", "", "", ""
 
-        if selected_index >= len(dm.ideas_data):
+        idea = dm.get_idea(idea_id)
+        if idea is None:
             return "선택된 아이디어를 찾을 수 없습니다.", "", "", "", "", "", ""
 
-        idea = dm.ideas_data[selected_index]
-
         title = idea.get("title", "제목 없음")
         problem = idea.get("problem", "문제의식 정보가 없습니다.")
         solution = idea.get("solution", "솔루션 정보가 없습니다.")
@@ -286,7 +272,7 @@ def get_idea_details_by_index(selected_index):
 맥락: {contest_info.get('context', 'N/A')}"""
 
         # 사용된 노드 정보 포맷팅
-        used_nodes = idea.get("used_nodes", [])
+        used_nodes = dm.resolve_used_nodes(idea)
         nodes_info = ""
         if used_nodes:
             nodes_list = []
@@ -301,6 +287,7 @@ def get_idea_details_by_index(selected_index):
         # 사용된 필터 정보 포맷팅
         used_filters = idea.get("used_filters", {})
         filters_info = f"""검색어: {used_filters.get('search_text', '없음')}
+태그 쿼리: {used_filters.get('tag_query') or '없음'}
 선택된 테넌트: {', '.join(used_filters.get('selected_tenants', [])) or '없음'}
 선택된 태그: {', '.join(used_filters.get('selected_tags', [])) or '없음'}
 전체 노드 수: {used_filters.get('total_nodes_available', 0)}
@@ -325,7 +312,7 @@ def get_idea_details_by_index(selected_index):
         )
 
     except Exception as e:
-        print(f"[ERROR] get_idea_details_by_index 에러: {e}")
+        print(f"[ERROR] get_idea_details_by_id 에러: {e}")
         return (
             "아이디어 정보 로드 중 오류가 발생했습니다.",
             "",
@@ -342,25 +329,24 @@ def get_idea_details_by_index(selected_index):
 
 def refresh_ideas():
     """아이디어 목록 새로고침"""
-    dm.load_ideas()
+    dm.reload_if_changed("ideas")
     return get_ideas_dataframe()
 
 
 def clear_ideas():
     """모든 아이디어 삭제"""
-    dm.ideas_data = []
-    dm.save_ideas()
+    dm.clear_all_ideas()
     return get_ideas_dataframe()
 
 
-def delete_idea(selected_index):
+def delete_idea(idea_id):
     """선택된 아이디어 삭제"""
-    if selected_index is None or selected_index >= len(dm.ideas_data):
+    deleted_idea = None
+    if idea_id:
+        deleted_idea = dm.remove_idea(idea_id)
+    if deleted_idea is None:
         return "삭제할 아이디어를 선택해주세요.", get_ideas_dataframe()
 
-    deleted_idea = dm.ideas_data.pop(selected_index)
-    dm.save_ideas()
-
     return (
         f"아이디어 '{deleted_idea.get('title', '제목 없음')}'가 삭제되었습니다.",
         get_ideas_dataframe(),
@@ -391,27 +377,9 @@ def generate_idea_with_gemini(
     )
 
 
-def get_filtered_nodes(search_text="", selected_tenants=None, selected_tags=None):
-    """필터링 조건에 맞는 노드들을 반환"""
-    if not dm.nodes_data:
-        return []
-
-    filtered_nodes = []
-    for node in dm.nodes_data:
-        # 텍스트 검색 필터 (노드 이름에서 검색)
-        if search_text and search_text.lower() not in node["title"].lower():
-            continue
-
-        # 테넌트 필터
-        if selected_tenants and node.get("tenant", "미지정") not in selected_tenants:
-            continue
-
-        # 태그 필터 (선택된 태그 중 하나라도 포함되어야 함)
-        if selected_tags:
-            node_tags = node.get("tags", [])
-            if not any(tag in node_tags for tag in selected_tags):
-                continue
-
-        filtered_nodes.append(node)
-
-    return filtered_nodes
+@cached("nodes", copy=list)
+def get_filtered_nodes(
+    search_text="", selected_tenants=None, selected_tags=None, limit=None, offset=0
+):
+    """필터링 조건에 맞는 노드들을 반환 (노드 데이터 버전별 캐시)"""
+    return dm.query_nodes(search_text, selected_tenants, selected_tags, limit, offset)
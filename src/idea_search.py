@@ -0,0 +1,100 @@
+import re
+
+from src.node_search import TextIndex, normalize
+
+# 아이디어 전문 검색 필드 (키, 화면 이름, 가중치), 순서는 화면의 상세 보기 순서
+# - 목록에 보이는 제목/공모전 제목/개요는 본문 섹션보다 높게 평가
+IDEA_FIELDS = (
+    ("title", "제목", 3),
+    ("contest_title", "공모전", 2),
+    ("overview", "개요", 2),
+    ("problem", "문제의식", 1),
+    ("solution", "솔루션", 1),
+    ("implementation", "구현방안", 1),
+    ("expected_effect", "기대효과", 1),
+    ("rationale", "근거", 1),
+)
+SNIPPET_WIDTH = 80
+HIGHLIGHT = ("【", "】")
+
+
+class IdeaTextIndex(TextIndex):
+    """
+    아이디어 제목/공모전 제목/개요/본문 섹션 전문 검색 색인 (src.node_search.TextIndex)
+
+    본문 텍스트는 메모리에 두지 않고 게시 목록만 유지하며, 검색어가 이어져 포함되는지는
+    read_idea(아이디어 ID → 본문을 포함한 전체 아이디어)로 결과 페이지의 후보만 읽어 확인
+    """
+
+    def __init__(self, read_idea):
+        super().__init__(
+            (weight for _, _, weight in IDEA_FIELDS),
+            read_fields=lambda idea_id: idea_fields(read_idea(idea_id)),
+        )
+
+    def ensure_built(self, ideas):
+        """ideas: 본문을 포함한 전체 아이디어"""
+        super().ensure_built((idea["id"], idea_fields(idea)) for idea in ideas)
+
+    def add(self, idea):
+        super().add(idea["id"], idea_fields(idea))
+
+
+def idea_fields(idea):
+    """IDEA_FIELDS 순서의 필드 텍스트 목록"""
+    contest_info = idea.get("contest_info")
+    fields = []
+    for key, _, _ in IDEA_FIELDS:
+        if key == "contest_title":
+            value = contest_info.get("title") if isinstance(contest_info, dict) else ""
+        else:
+            value = idea.get(key)
+        fields.append(value if isinstance(value, str) else "")
+    return fields
+
+
+def snippet(idea, search_text, width=SNIPPET_WIDTH):
+    """
+    검색어가 가장 많이 나온 섹션의 일치 부분 발췌, 예: "[솔루션] …IoT 【센서】 네트워크…"
+
+    검색어 단어가 가장 많이 (서로 다른 단어 기준) 나온 섹션을 고르고 (같으면 앞선 섹션),
+    첫 일치 위치 주변 width 글자를 잘라 일치한 단어를 HIGHLIGHT로 감쌈
+    일치한 섹션이 없으면 ""
+    """
+    words = sorted(set(normalize(search_text).split()), key=len, reverse=True)
+    if not words:
+        return ""
+    # 긴 단어를 먼저 두어 "데이터"와 "데이터분석"이 겹치면 긴 쪽으로 강조
+    pattern = re.compile("|".join(re.escape(word) for word in words), re.IGNORECASE)
+
+    best = None
+    for (_, label, _), text in zip(IDEA_FIELDS, idea_fields(idea)):
+        matches = list(pattern.finditer(text))
+        if not matches:
+            continue
+        found = len({match.group().casefold() for match in matches})
+        if best is None or found > best[0]:
+            best = (found, label, text, matches)
+    if best is None:
+        return ""
+
+    _, label, text, matches = best
+    start = max(0, matches[0].start() - width // 4)
+    end = min(len(text), start + width)
+    start = max(0, min(start, end - width))
+
+    parts = ["…" if start else ""]
+    cursor = start
+    for match in matches:
+        if match.start() < cursor:
+            continue
+        if match.end() > end:
+            break
+        parts.append(text[cursor : match.start()])
+        parts.append(f"{HIGHLIGHT[0]}{match.group()}{HIGHLIGHT[1]}")
+        cursor = match.end()
+    parts.append(text[cursor:end])
+    if end < len(text):
+        parts.append("…")
+    # 표의 한 칸에 표시하므로 줄바꿈은 공백으로
+    return f"[{label}] " + " ".join("".join(parts).split())
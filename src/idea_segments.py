@@ -0,0 +1,135 @@
+import json
+import lzma
+import os
+import threading
+import zlib
+from collections import OrderedDict
+
+# 압축 방식별 세그먼트 파일 확장자
+CODECS = {"lzma": ".jsonl.xz", "zlib": ".jsonl.zz"}
+# 세그먼트 하나에 담을 최대 원본 크기 (한 달 분량이 이보다 크면 나눔)
+SEGMENT_MAX_BYTES = 4 * 1024 * 1024
+# 압축을 풀어 메모리에 두는 세그먼트 수
+CACHE_SEGMENTS = 4
+
+
+class ColdSegments:
+    """
+    오래된 아이디어 본문을 월별로 묶어 압축한 읽기 전용 세그먼트 모음
+
+    - data/ideas_cold/<YYYY-MM>-<순번>.jsonl.xz: 본문을 한 줄씩 모아 통째로 압축
+    - 한 번 기록한 세그먼트는 바뀌지 않음 (수정된 아이디어는 hot 아카이브에 새로 추가)
+    - 인덱스 엔트리의 offset/length는 압축을 푼 세그먼트 안의 위치
+    - 최근에 읽은 세그먼트 몇 개만 압축을 푼 채로 보관 (LRU)
+    """
+
+    def __init__(self, segment_dir, codec="lzma", cache_segments=CACHE_SEGMENTS):
+        if codec not in CODECS:
+            raise ValueError(f"알 수 없는 압축 방식입니다: {codec}")
+        self.segment_dir = segment_dir
+        self.codec = codec
+        self.cache_segments = cache_segments
+
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+
+    def names(self):
+        """디스크에 있는 세그먼트 파일 이름 (월, 순번 순)"""
+        if not os.path.isdir(self.segment_dir):
+            return []
+        suffixes = tuple(CODECS.values())
+        return sorted(n for n in os.listdir(self.segment_dir) if n.endswith(suffixes))
+
+    def write(self, month, bodies):
+        """
+        본문(bytes) 목록을 month의 새 세그먼트로 기록
+
+        크기 제한을 넘으면 여러 세그먼트로 나누며, 본문별 (세그먼트 이름, offset,
+        length) 목록을 같은 순서로 반환
+        """
+        os.makedirs(self.segment_dir, exist_ok=True)
+        locations = []
+        chunk, size = [], 0
+        for body in bodies:
+            if chunk and size + len(body) + 1 > SEGMENT_MAX_BYTES:
+                locations.extend(self._write_segment(month, chunk))
+                chunk, size = [], 0
+            chunk.append(body)
+            size += len(body) + 1
+        if chunk:
+            locations.extend(self._write_segment(month, chunk))
+        return locations
+
+    def _write_segment(self, month, bodies):
+        name = self._next_name(month)
+        locations = []
+        offset = 0
+        for body in bodies:
+            locations.append((name, offset, len(body)))
+            offset += len(body) + 1
+        data = _compress(self.codec, b"\n".join(bodies) + b"\n")
+
+        path = os.path.join(self.segment_dir, name)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+        return locations
+
+    def _next_name(self, month):
+        existing = {n.split(".")[0] for n in self.names() if n.startswith(month)}
+        seq = 1
+        while f"{month}-{seq:03d}" in existing:
+            seq += 1
+        return f"{month}-{seq:03d}{CODECS[self.codec]}"
+
+    def read(self, entry):
+        """인덱스 엔트리가 가리키는 본문을 읽음 (세그먼트는 필요할 때 압축 해제)"""
+        offset, length = entry["offset"], entry["length"]
+        data = self._segment(entry["segment"])
+        return json.loads(data[offset : offset + length])
+
+    def _segment(self, name):
+        with self._lock:
+            if name in self._cache:
+                self._cache.move_to_end(name)
+                return self._cache[name]
+
+            data = self.decompress(name)
+            self._cache[name] = data
+            while len(self._cache) > self.cache_segments:
+                self._cache.popitem(last=False)
+            return data
+
+    def decompress(self, name):
+        """세그먼트 전체의 압축을 풀어 반환 (캐시를 거치지 않음)"""
+        with open(os.path.join(self.segment_dir, name), "rb") as f:
+            data = f.read()
+        return _decompress(name, data)
+
+    def remove_unused(self, used_names):
+        """어느 엔트리도 가리키지 않는 세그먼트 삭제 (모든 아이디어가 삭제된 경우 등)"""
+        for name in self.names():
+            if name in used_names:
+                continue
+            os.remove(os.path.join(self.segment_dir, name))
+            with self._lock:
+                self._cache.pop(name, None)
+
+    def clear_cache(self):
+        with self._lock:
+            self._cache.clear()
+
+
+def _compress(codec, data):
+    if codec == "lzma":
+        return lzma.compress(data, preset=6)
+    return zlib.compress(data, 9)
+
+
+def _decompress(name, data):
+    if name.endswith(CODECS["lzma"]):
+        return lzma.decompress(data)
+    return zlib.decompress(data)
@@ -0,0 +1,56 @@
+import os
+import threading
+import time
+from datetime import datetime
+
+# Crockford Base32 (ULID 표준 문자 집합)
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_RANDOM_BITS = 80
+
+_lock = threading.Lock()
+_last_ms = -1
+_last_random = 0
+
+
+def new_id(timestamp=None):
+    """
+    ULID 형식의 고유 ID (26자, 생성 시각 순으로 정렬됨)
+
+    timestamp(초)를 주면 해당 시각으로 생성 (기존 레코드 ID 보충용)
+    """
+    global _last_ms, _last_random
+
+    if timestamp is not None:
+        ms = int(timestamp * 1000)
+        random_part = int.from_bytes(os.urandom(10), "big")
+        return _encode(ms, random_part)
+
+    with _lock:
+        ms = int(time.time() * 1000)
+        if ms <= _last_ms:
+            # 같은 밀리초(또는 시계 역행) 안에서는 난수부를 1 증가시켜 단조 증가 보장
+            ms = _last_ms
+            random_part = (_last_random + 1) & ((1 << _RANDOM_BITS) - 1)
+        else:
+            random_part = int.from_bytes(os.urandom(10), "big")
+        _last_ms, _last_random = ms, random_part
+
+    return _encode(ms, random_part)
+
+
+def id_from_created_at(created_at):
+    """created_at("%Y-%m-%d %H:%M:%S") 시각 기준의 ID (파싱 실패 시 현재 시각)"""
+    try:
+        parsed = datetime.strptime(created_at, "%Y-%m-%d %H:%M:%S")
+        return new_id(parsed.timestamp())
+    except (TypeError, ValueError):
+        return new_id()
+
+
+def _encode(ms, random_part):
+    value = (ms << _RANDOM_BITS) | random_part
+    chars = []
+    for _ in range(26):
+        chars.append(_ALPHABET[value & 31])
+        value >>= 5
+    return "".join(reversed(chars))
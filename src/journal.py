@@ -0,0 +1,286 @@
+import json
+import os
+import threading
+
+from src.json_stream import QuarantineLog, load_json_array
+from src.write_behind import atomic_write_json
+
+
+class Journal:
+    """
+    컬렉션 하나(노드 또는 아이디어)에 대한 추가 전용 JSONL 저널
+
+    - 변경 1건 = 저널 한 줄 ({"seq", "op", ...})
+    - 수정/삭제는 레코드 ID로 대상을 찾음 (index는 빠른 확인용, 중간 줄이 손상되어
+      앞선 추가/삭제가 빠져도 이후 변경이 다른 레코드에 적용되지 않음)
+    - 스냅샷({name}_snapshot.json)에는 마지막으로 반영된 seq가 함께 저장되어
+      재생 시 이미 반영된 레코드는 건너뜀
+    - 저널이 임계 크기를 넘으면 백그라운드에서 새 스냅샷을 쓰고 저널을 비움
+      (background_compaction이 거짓이면 추가한 스레드에서 바로 압축, 여러 워커 모드에서
+      다른 프로세스가 압축 도중의 파일을 정리하며 겹쳐 쓰지 않도록 프로세스 간 잠금 안에서 처리)
+    """
+
+    def __init__(
+        self, name, data_dir, get_records, compact_threshold, background_compaction=True
+    ):
+        self.name = name
+        self.data_dir = data_dir
+        self.get_records = get_records
+        self.compact_threshold = compact_threshold
+        self.background_compaction = background_compaction
+
+        self.log_path = os.path.join(data_dir, f"{name}_journal.jsonl")
+        self.compacting_path = self.log_path + ".compacting"
+        self.snapshot_path = os.path.join(data_dir, f"{name}_snapshot.json")
+        # 저널 모드 이전의 전체 JSON 파일 (스냅샷이 없을 때 초기 데이터로 사용)
+        self.legacy_path = os.path.join(data_dir, f"{name}_data.json")
+        self.quarantine_path = os.path.join(data_dir, f"{name}_quarantine.jsonl")
+
+        self.seq = 0
+        self._lock = threading.Lock()
+        self._compaction_thread = None
+        # 파일을 쓴 뒤 호출할 콜백 (백엔드가 파일 지문 갱신에 사용)
+        self.on_write = None
+
+    # ------------------------------------------------------------------
+    # 불러오기 / 재생
+    # ------------------------------------------------------------------
+    def load(self):
+        """스냅샷을 읽고 저널을 재생하여 메모리 상태 복원"""
+        with self._lock:
+            records, snapshot_seq = self._read_snapshot()
+            self.seq = snapshot_seq
+
+            leftover = os.path.exists(self.compacting_path)
+            stopped = False
+            if leftover:
+                # 이전 압축이 끝나지 못한 경우: 회전된 저널부터 재생
+                stopped = self._replay(self.compacting_path, records, snapshot_seq)
+            if not stopped:
+                stopped = self._replay(self.log_path, records, snapshot_seq)
+            elif os.path.exists(self.log_path):
+                self._quarantine_rest(self.log_path, 0, [])
+
+            if leftover or stopped:
+                # 남은 저널(또는 재생을 멈춘 저널)을 즉시 스냅샷으로 정리하여
+                # 다음 압축/재생이 꼬이지 않도록 함
+                self._write_snapshot(records, self.seq)
+                if os.path.exists(self.compacting_path):
+                    os.remove(self.compacting_path)
+                open(self.log_path, "w", encoding="utf-8").close()
+
+            return records
+
+    def _read_snapshot(self):
+        """스냅샷(또는 레거시 JSON)에서 레코드 목록과 seq 읽기"""
+        if os.path.exists(self.snapshot_path):
+            with open(self.snapshot_path, "r", encoding="utf-8") as f:
+                snapshot = json.load(f)
+            return snapshot.get("records", []), snapshot.get("seq", 0)
+
+        if os.path.exists(self.legacy_path):
+            return load_json_array(self.legacy_path, self.quarantine_path), 0
+
+        return [], 0
+
+    def _replay(self, path, records, snapshot_seq):
+        """
+        저널 파일을 한 줄씩 적용 (잘린 마지막 줄은 감지 후 건너뜀)
+
+        중간 줄이 손상되면 그 줄을 격리하고 계속 재생하되, 이후에 ID 없이 위치로만
+        대상을 가리키는 예전 형식의 수정/삭제가 나오면 그 줄부터 나머지를 모두 격리하고
+        재생을 멈춤 (빠진 줄 때문에 위치가 어긋나 다른 레코드를 바꾸게 되므로)
+        멈췄으면 True 반환 (호출한 쪽이 현재 상태로 스냅샷을 새로 써야 함)
+        """
+        if not os.path.exists(path):
+            return False
+
+        with open(path, "rb") as f:
+            lines = f.read().split(b"\n")
+
+        quarantine = QuarantineLog(self.quarantine_path, path)
+        good_bytes = 0
+        for line_no, raw in enumerate(lines):
+            is_last = line_no == len(lines) - 1
+            if not raw.strip():
+                if not is_last:
+                    good_bytes += len(raw) + 1
+                continue
+
+            try:
+                entry = json.loads(raw.decode("utf-8"))
+                if not isinstance(entry, dict):
+                    raise ValueError("객체가 아닙니다.")
+            except (json.JSONDecodeError, UnicodeDecodeError, ValueError) as e:
+                if is_last:
+                    # 크래시로 잘린 마지막 줄: 버리고 파일을 마지막 정상 위치로 자름
+                    print(
+                        f"[WARN] {os.path.basename(path)}: 잘린 마지막 레코드를 건너뜁니다."
+                    )
+                    with open(path, "r+b") as f:
+                        f.truncate(good_bytes)
+                    break
+                print(
+                    f"[ERROR] {os.path.basename(path)} {line_no + 1}번째 줄 손상, 격리 후 건너뜁니다."
+                )
+                quarantine(good_bytes, raw.decode("utf-8", "replace"), str(e))
+                good_bytes += len(raw) + 1
+                continue
+
+            if (
+                quarantine.count
+                and entry.get("op") in ("update", "delete")
+                and "id" not in entry
+            ):
+                print(
+                    f"[ERROR] {os.path.basename(path)} {line_no + 1}번째 줄부터 "
+                    "손상 이후 위치 기반 변경이라 재생을 멈추고 나머지를 격리합니다."
+                )
+                self._quarantine_rest(path, good_bytes, lines[line_no:], quarantine)
+                return True
+
+            # 줄바꿈 없이 끝난 마지막 줄은 정상 레코드라도 줄바꿈을 보충
+            if is_last:
+                with open(path, "ab") as f:
+                    f.write(b"\n")
+            good_bytes += len(raw) + 1
+
+            seq = entry.get("seq", 0)
+            if seq <= snapshot_seq:
+                continue
+            apply_entry(records, entry)
+            self.seq = max(self.seq, seq)
+        return False
+
+    def _quarantine_rest(self, path, offset, lines, quarantine=None):
+        """재생하지 않은 저널 줄을 격리 파일로 옮김 (lines가 비면 파일 전체)"""
+        quarantine = quarantine or QuarantineLog(self.quarantine_path, path)
+        if not lines:
+            with open(path, "rb") as f:
+                lines = f.read().split(b"\n")
+        for raw in lines:
+            if raw.strip():
+                quarantine(offset, raw.decode("utf-8", "replace"), "재생 중단 이후")
+            offset += len(raw) + 1
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def append(self, op, **payload):
+        """변경 1건을 저널 끝에 추가"""
+        with self._lock:
+            os.makedirs(self.data_dir, exist_ok=True)
+            self.seq += 1
+            entry = {"seq": self.seq, "op": op, **payload}
+            line = json.dumps(entry, ensure_ascii=False) + "\n"
+
+            with open(self.log_path, "a", encoding="utf-8") as f:
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+
+            if os.path.getsize(self.log_path) >= self.compact_threshold:
+                if self.background_compaction:
+                    self._start_compaction()
+                else:
+                    self._compact(*self._rotate())
+            self._notify_write()
+
+    # ------------------------------------------------------------------
+    # 압축
+    # ------------------------------------------------------------------
+    def _start_compaction(self):
+        """저널을 회전시키고 백그라운드에서 스냅샷 작성 (lock 보유 상태에서 호출)"""
+        if self._compaction_thread and self._compaction_thread.is_alive():
+            return
+
+        records, seq = self._rotate()
+        self._compaction_thread = threading.Thread(
+            target=self._compact, args=(records, seq), daemon=True
+        )
+        self._compaction_thread.start()
+
+    def compact_now(self):
+        """저널을 즉시(동기) 스냅샷으로 압축"""
+        self.wait_for_compaction()
+        with self._lock:
+            records, seq = self._rotate()
+        self._compact(records, seq)
+
+    def _rotate(self):
+        """현재 상태를 복사하고 저널을 회전: 이후 변경은 새 저널에 기록됨"""
+        records = [dict(r) for r in self.get_records()]
+        seq = self.seq
+        if not os.path.exists(self.log_path):
+            return records, seq
+
+        if os.path.exists(self.compacting_path):
+            # 이전 압축이 실패해 남아 있으면 뒤에 이어 붙임
+            with open(self.log_path, "rb") as src, open(
+                self.compacting_path, "ab"
+            ) as dst:
+                dst.write(src.read())
+            os.remove(self.log_path)
+        else:
+            os.replace(self.log_path, self.compacting_path)
+        return records, seq
+
+    def _compact(self, records, seq):
+        """새 스냅샷을 쓰고 회전된 저널 삭제"""
+        try:
+            self._write_snapshot(records, seq)
+            if os.path.exists(self.compacting_path):
+                os.remove(self.compacting_path)
+            self._notify_write()
+        except Exception as e:
+            print(f"[ERROR] {self.name} 저널 압축 실패: {e}")
+
+    def _notify_write(self):
+        if self.on_write:
+            self.on_write()
+
+    def wait_for_compaction(self):
+        """진행 중인 압축이 끝날 때까지 대기"""
+        thread = self._compaction_thread
+        if thread:
+            thread.join()
+
+    def _write_snapshot(self, records, seq):
+        """스냅샷을 임시 파일에 쓴 뒤 원자적으로 교체"""
+        atomic_write_json(self.snapshot_path, {"seq": seq, "records": records})
+
+
+def apply_entry(records, entry):
+    """저널 레코드 1건을 레코드 목록에 적용"""
+    op = entry.get("op")
+    if op == "append":
+        records.append(entry["record"])
+    elif op == "update":
+        index = _entry_index(records, entry)
+        if index is not None:
+            records[index].update(entry["fields"])
+    elif op == "delete":
+        index = _entry_index(records, entry)
+        if index is not None:
+            records.pop(index)
+    elif op == "clear":
+        records.clear()
+    else:
+        print(f"[WARN] 알 수 없는 저널 연산: {op}")
+
+
+def _entry_index(records, entry):
+    """수정/삭제 대상의 현재 위치 (ID가 있으면 ID 기준, 못 찾으면 None)"""
+    index = entry.get("index")
+    if "id" not in entry:
+        # ID가 없는 예전 형식의 저널
+        return index if isinstance(index, int) and 0 <= index < len(records) else None
+    record_id = entry["id"]
+    if isinstance(index, int) and 0 <= index < len(records):
+        if records[index].get("id") == record_id:
+            return index
+    for i, record in enumerate(records):
+        if record.get("id") == record_id:
+            return i
+    print(f"[WARN] 저널 {entry.get('op')} 대상 레코드({record_id})가 없어 건너뜁니다.")
+    return None
@@ -0,0 +1,217 @@
+import codecs
+import json
+import os
+import re
+import shutil
+from datetime import datetime
+
+CHUNK_SIZE = 1024 * 1024
+# 레코드 하나가 이보다 길면 손상으로 보고 다음 레코드 위치에서 다시 시작
+MAX_RECORD_CHARS = 16 * 1024 * 1024
+# 이보다 큰 파일만 진행률 출력
+PROGRESS_MIN_BYTES = 8 * 1024 * 1024
+
+_WHITESPACE = re.compile(r"\s*")
+# 문자열 안의 괄호를 무시하고 괄호 깊이를 세기 위한 토큰
+# (닫히지 않은 문자열은 따옴표 하나로만 일치)
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|"|[{}\[\]]')
+# indent=2로 기록된 파일에서 최상위 배열 원소(레코드)가 시작하는 위치
+_ITEM_START = re.compile(r"\n  \{")
+
+
+def iter_json_array(path, quarantine=None, progress=None, chunk_size=CHUNK_SIZE):
+    """
+    JSON 배열 파일을 레코드 단위로 읽어 하나씩 반환 (파일 전체를 메모리에 올리지 않음)
+
+    - 손상된 레코드는 quarantine(offset, raw, error)으로 넘기고 다음 레코드부터 계속
+    - progress(읽은 바이트, 전체 바이트, 레코드 수)는 청크를 읽을 때마다 호출
+    """
+    decoder = json.JSONDecoder()
+    quarantine = quarantine or (lambda offset, raw, error: None)
+
+    with open(path, "rb") as f:
+        buf = _ChunkBuffer(f, os.fstat(f.fileno()).st_size, chunk_size, progress)
+
+        if not buf.skip_whitespace():
+            return
+        if buf.text[buf.pos] != "[":
+            # 배열이 아닌 파일: 전체를 격리
+            buf.read_all()
+            quarantine(buf.offset(), buf.text[buf.pos :], "JSON 배열이 아닙니다.")
+            return
+
+        buf.pos += 1
+        while buf.skip_whitespace():
+            char = buf.text[buf.pos]
+            if char == "]":
+                return
+            if char == ",":
+                buf.pos += 1
+                continue
+
+            start = buf.pos
+            try:
+                record, end = decoder.raw_decode(buf.text, start)
+            except json.JSONDecodeError as e:
+                end = _value_end(buf.text, start)
+                if end is None and buf.can_grow(start):
+                    # 레코드가 청크 경계에 걸친 경우: 더 읽고 다시 시도
+                    buf.fill()
+                    continue
+                if end is None:
+                    end = _next_item(buf.text, start)
+                quarantine(buf.offset(start), buf.text[start:end], str(e))
+                buf.pos = end
+                continue
+
+            if end >= len(buf.text) and buf.fill():
+                # 숫자 등은 버퍼 끝에서 잘려도 해석되므로 뒤를 확인한 뒤 다시 시도
+                continue
+            buf.pos = end
+            if not isinstance(record, dict):
+                quarantine(buf.offset(start), buf.text[start:end], "객체가 아닙니다.")
+                continue
+            buf.records += 1
+            yield record
+
+
+def stream_json_array(path, quarantine_path=None, label=None):
+    """
+    iter_json_array에 진행률 출력과 손상 레코드 격리를 붙여 레코드를 하나씩 반환
+
+    손상된 레코드는 quarantine_path(jsonl)에 기록하고 원본 파일은 .corrupt-<시각>으로
+    보존하므로, 이후 저장으로 남은 레코드만 기록되어도 원본 내용은 잃지 않음
+    """
+    label = label or os.path.basename(path)
+    log = QuarantineLog(quarantine_path, path) if quarantine_path else None
+    yield from iter_json_array(path, quarantine=log, progress=ProgressPrinter(label))
+    if log and log.count:
+        print(
+            f"[WARN] {label}: 손상된 레코드 {log.count}건을 {log.path}로 격리했습니다. "
+            f"(원본 보존: {log.backup_path})"
+        )
+
+
+def load_json_array(path, quarantine_path=None, label=None):
+    """stream_json_array로 전체 레코드 목록 만들기"""
+    return list(stream_json_array(path, quarantine_path, label))
+
+
+class QuarantineLog:
+    """손상된 레코드를 jsonl 파일에 모으고, 첫 손상 발견 시 원본 파일을 복사해 둠"""
+
+    def __init__(self, path, source_path):
+        self.path = path
+        self.source_path = source_path
+        self.backup_path = None
+        self.count = 0
+
+    def __call__(self, offset, raw, error):
+        if self.backup_path is None:
+            stamp = datetime.now().strftime("%Y%m%d%H%M%S")
+            self.backup_path = f"{self.source_path}.corrupt-{stamp}"
+            shutil.copy2(self.source_path, self.backup_path)
+
+        entry = {
+            "source": os.path.basename(self.source_path),
+            "offset": offset,
+            "error": error,
+            "raw": raw,
+        }
+        with open(self.path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        self.count += 1
+
+
+class ProgressPrinter:
+    """큰 파일을 읽을 때 10% 단위로 진행률 출력"""
+
+    def __init__(self, label):
+        self.label = label
+        self.next_percent = 10
+
+    def __call__(self, done, total, records):
+        if total < PROGRESS_MIN_BYTES:
+            return
+        percent = done * 100 // total
+        if percent >= self.next_percent:
+            print(f"[INFO] {self.label} 불러오는 중... {percent}% ({records:,}건)")
+            self.next_percent = percent // 10 * 10 + 10
+
+
+class _ChunkBuffer:
+    """파일을 청크 단위로 디코딩해 두는 버퍼 (이미 해석한 앞부분은 버림)"""
+
+    def __init__(self, f, total, chunk_size, progress):
+        self.f = f
+        self.total = total
+        self.chunk_size = chunk_size
+        self.progress = progress
+        self.decoder = codecs.getincrementaldecoder("utf-8")()
+        self.text = ""
+        self.pos = 0
+        self.base = 0  # text[0]의 파일 내 문자 위치
+        self.bytes_read = 0
+        self.records = 0
+        self.eof = False
+
+    def offset(self, pos=None):
+        return self.base + (self.pos if pos is None else pos)
+
+    def fill(self):
+        """청크 하나를 더 읽음, 파일 끝이면 False"""
+        if self.eof:
+            return False
+        chunk = self.f.read(self.chunk_size)
+        self.bytes_read += len(chunk)
+        if not chunk:
+            self.eof = True
+            self.text = self.text[self.pos :] + self.decoder.decode(b"", final=True)
+        else:
+            self.text = self.text[self.pos :] + self.decoder.decode(chunk)
+        self.base += self.pos
+        self.pos = 0
+        if self.progress:
+            self.progress(self.bytes_read, self.total, self.records)
+        return True
+
+    def read_all(self):
+        while self.fill():
+            pass
+
+    def skip_whitespace(self):
+        """공백을 건너뛰고 다음 문자가 있으면 True"""
+        while True:
+            self.pos = _WHITESPACE.match(self.text, self.pos).end()
+            if self.pos < len(self.text):
+                return True
+            if not self.fill():
+                return False
+
+    def can_grow(self, start):
+        return not self.eof and len(self.text) - start < MAX_RECORD_CHARS
+
+
+def _value_end(text, start):
+    """start의 객체/배열이 끝나는 위치 (버퍼 안에서 닫히지 않으면 None)"""
+    if text[start] not in "{[":
+        return None
+    depth = 0
+    for match in _TOKEN.finditer(text, start):
+        token = match.group()
+        if token == '"':
+            # 버퍼 끝까지 닫히지 않은 문자열: 이후 괄호는 문자열 내용일 수 있음
+            return None
+        if token in "{[":
+            depth += 1
+        elif token in "}]":
+            depth -= 1
+            if depth == 0:
+                return match.end()
+    return None
+
+
+def _next_item(text, start):
+    """손상 구간 다음 레코드의 시작 위치 (없으면 버퍼 끝)"""
+    match = _ITEM_START.search(text, start + 1)
+    return match.start() if match else len(text)
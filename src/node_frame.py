@@ -0,0 +1,105 @@
+import numpy as np
+import pandas as pd
+
+# 노드 목록 표의 컬럼 (화면 순서)
+NODE_COLUMNS = ("생성일자", "노드 이름", "테넌트", "설명", "태그")
+DESCRIPTION_PREVIEW = 100
+_INITIAL_CAPACITY = 1024
+
+
+class NodeFrame:
+    """
+    노드 목록 표를 열별 numpy object 배열로 유지하는 열 지향 표
+
+    - 행 번호는 NodeFacetIndex의 저장 순번 (삭제된 자리는 살아 있음 표시만 끔)
+    - 노드가 바뀌면 해당 행만 제자리에서 고치고, 추가는 용량을 두 배씩 늘려 가며 뒤에 씀
+      (설명 줄임/태그 잇기 같은 표시용 변환도 이때 한 번만)
+    - 필터 결과는 행 번호 배열로 받아 열마다 한 번에 골라 DataFrame을 만듦
+    """
+
+    def __init__(self):
+        self.rebuild([])
+
+    def rebuild(self, nodes):
+        """저장 순서의 노드 목록으로 전체 다시 만들기 (순번 = 목록 위치)"""
+        capacity = max(_INITIAL_CAPACITY, len(nodes))
+        self._columns = [np.empty(capacity, dtype=object) for _ in NODE_COLUMNS]
+        self._alive = np.zeros(capacity, dtype=bool)
+        self._size = 0
+        for position, node in enumerate(nodes):
+            self.set(position, node)
+
+    def set(self, position, node):
+        """저장 순번 position의 행을 노드 내용으로 채움 (추가/수정)"""
+        if position >= len(self._alive):
+            self._grow(position + 1)
+        for column, value in zip(self._columns, node_row(node)):
+            column[position] = value
+        self._alive[position] = True
+        self._size = max(self._size, position + 1)
+
+    def remove(self, position):
+        if position is None or position >= self._size:
+            return
+        self._alive[position] = False
+        for column in self._columns:
+            column[position] = None
+
+    def _grow(self, size):
+        capacity = len(self._alive)
+        while capacity < size:
+            capacity *= 2
+        for i, column in enumerate(self._columns):
+            grown = np.empty(capacity, dtype=object)
+            grown[: len(column)] = column
+            self._columns[i] = grown
+        alive = np.zeros(capacity, dtype=bool)
+        alive[: len(self._alive)] = self._alive
+        self._alive = alive
+
+    def mask(self, bits=None):
+        """살아 있는 행 마스크, bits(노드 비트맵)가 있으면 그 비트가 켜진 행만"""
+        mask = self._alive[: self._size]
+        if bits is None:
+            return mask
+        return mask & bits_mask(bits, self._size)
+
+    def positions(self, bits=None):
+        """마스크에 해당하는 행 번호 (저장 순서)"""
+        return np.flatnonzero(self.mask(bits))
+
+    def keep(self, positions, bits=None):
+        """행 번호 배열의 순서를 유지한 채 마스크에 해당하는 행만 남김"""
+        positions = np.asarray(positions, dtype=np.int64)
+        return positions[self.mask(bits)[positions]]
+
+    def rows(self, positions):
+        """행 번호 배열 순서의 DataFrame (결과가 없어도 컬럼명 유지)"""
+        return pd.DataFrame(
+            {
+                name: column[positions]
+                for name, column in zip(NODE_COLUMNS, self._columns)
+            },
+            columns=list(NODE_COLUMNS),
+        )
+
+
+def node_row(node):
+    """노드 → 표의 한 행 값 (NODE_COLUMNS 순서)"""
+    description = node.get("description", "")
+    if len(description) > DESCRIPTION_PREVIEW:
+        description = description[:DESCRIPTION_PREVIEW] + "..."
+    return (
+        node.get("created_at", "미상"),
+        node["title"],
+        node.get("tenant", "미지정"),
+        description,
+        ", ".join(node.get("tags", [])),
+    )
+
+
+def bits_mask(bits, size):
+    """노드 비트맵(정수, 비트 i = 순번 i) → 길이 size의 불리언 배열"""
+    length = max(size, bits.bit_length(), 1)
+    raw = np.frombuffer(bits.to_bytes((length + 7) // 8, "little"), dtype=np.uint8)
+    return np.unpackbits(raw, count=size, bitorder="little").astype(bool)
@@ -1,7 +1,8 @@
-import pandas as pd
 import gradio as gr
 import src.data_manager as dm
+from src.result_cache import cached
 from datetime import datetime
+import pytz
 
 
 def add_keyword(keyword, current_tags):
@@ -16,7 +17,10 @@ def add_keyword(keyword, current_tags):
         tags_list = []
 
     # 입력된 키워드를 콤마로 분할하여 처리
-    new_keywords = [kw.strip() for kw in keyword.split(",") if kw.strip()]
+    # (대소문자/공백만 다른 기존 태그가 있으면 그 표기로 통일, 예: python → Python)
+    new_keywords = [
+        dm.canonical_tag(kw.strip()) for kw in keyword.split(",") if kw.strip()
+    ]
 
     # 중복 키워드 체크
     duplicate_keywords = []
@@ -51,6 +55,29 @@ def add_keyword(keyword, current_tags):
     return updated_tags, "", f"✅ 키워드가 추가되었습니다: {added_list}"
 
 
+def suggest_keywords(keyword):
+    """
+    입력 중인 키워드(콤마 뒤 마지막 항목)로 시작하는 기존 태그 추천 (오타 허용)
+
+    선택지는 사용 노드 수를 붙여 표시, 예: ("파이썬 (42)", "파이썬")
+    """
+    typed = (keyword or "").rsplit(",", 1)[-1].strip()
+    suggestions = dm.suggest_tags(typed) if typed else []
+    return gr.update(
+        choices=[(f"{tag} ({count})", tag) for tag, count in suggestions],
+        value=None,
+        visible=bool(suggestions),
+    )
+
+
+def apply_keyword_suggestion(suggestion, keyword):
+    """선택한 추천 태그로 입력 중인 마지막 키워드를 바꿈"""
+    if not suggestion:
+        return gr.update()
+    head, comma, _ = (keyword or "").rpartition(",")
+    return f"{head}, {suggestion}" if comma else suggestion
+
+
 def create_node(title, description, tenant, tags):
     """사용자 입력으로 새 노드 생성"""
     if not title or not description:
@@ -96,97 +123,75 @@ def create_node(title, description, tenant, tags):
         "description": description,
         "tenant": tenant.strip(),
         "tags": tags_list,
-        "created_at": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        # 아이디어와 같은 한국 시간 (노드 이력의 리비전 시각과 비교됨)
+        "created_at": datetime.now(pytz.timezone("Asia/Seoul")).strftime(
+            "%Y-%m-%d %H:%M:%S"
+        ),
     }
 
-    dm.nodes_data.append(new_node)
-
-    dm.save_nodes()
+    dm.add_node(new_node)
 
     # 성공시 모든 필드 초기화
     return "✅ 새 노드가 성공적으로 생성되었습니다!", "", "", "", "", "", ""
 
 
-def get_nodes_dataframe(search_text="", selected_tenants=None, selected_tags=None):
-    """저장된 노드들을 데이터프레임으로 변환 (다중 필터 지원)"""
-    # 컬럼명 정의
-    columns = ["생성일자", "노드 이름", "테넌트", "설명", "태그"]
-
-    if not dm.nodes_data:
-        return pd.DataFrame(columns=columns)
-
-    # 필터링된 노드들
-    filtered_nodes = []
-    for node in dm.nodes_data:
-        # 텍스트 검색 필터 (노드 이름에서 검색)
-        if search_text and search_text.lower() not in node["title"].lower():
-            continue
-
-        # 테넌트 필터
-        if selected_tenants and node.get("tenant", "미지정") not in selected_tenants:
-            continue
-
-        # 태그 필터 (선택된 태그 중 하나라도 포함되어야 함)
-        if selected_tags:
-            node_tags = node.get("tags", [])
-            if not any(tag in node_tags for tag in selected_tags):
-                continue
-
-        filtered_nodes.append(
-            {
-                "생성일자": node.get("created_at", "미상"),
-                "노드 이름": node["title"],
-                "테넌트": node.get("tenant", "미지정"),
-                "설명": (
-                    node["description"][:100] + "..."
-                    if len(node["description"]) > 100
-                    else node["description"]
-                ),
-                "태그": ", ".join(node.get("tags", [])),
-            }
-        )
-
-    # 필터링 결과가 없어도 컬럼명이 유지되도록 빈 DataFrame 반환
-    if not filtered_nodes:
-        return pd.DataFrame(columns=columns)
-
-    return pd.DataFrame(filtered_nodes)
+@cached("nodes")
+def get_nodes_dataframe(
+    search_text="", selected_tenants=None, selected_tags=None, limit=None, offset=0
+):
+    """저장된 노드들을 데이터프레임으로 변환 (다중 필터 지원, 버전별 캐시)"""
+    # 필터/페이지네이션은 data_manager가 유지하는 열 지향 노드 표에서 행만 골라 처리
+    return dm.nodes_table(search_text, selected_tenants, selected_tags, limit, offset)
 
 
 def filter_nodes_multi(search_text, selected_tenants, selected_tags):
-    """다중 필터로 노드 필터링"""
+    """
+    다중 필터로 노드 필터링 (테넌트/태그 드롭다운의 노드 수도 갱신)
+
+    검색어는 제목/설명/태그 전문 검색 또는 태그 쿼리 (예: (AI OR 데이터) AND NOT 하드웨어 AND tenant:국민대)
+    검색어가 쿼리로 해석되지 않으면 (입력 중인 "(AI OR" 등) 전문 검색으로 처리
+    """
     df = get_nodes_dataframe(search_text, selected_tenants, selected_tags)
-    return gr.update(value=df)
+    tenant_choices, tag_choices = get_filter_choices(
+        search_text, selected_tenants, selected_tags
+    )
+    return (
+        gr.update(value=df),
+        gr.update(choices=tenant_choices),
+        gr.update(choices=tag_choices),
+    )
+
+
+def get_filter_choices(search_text="", selected_tenants=None, selected_tags=None):
+    """현재 필터 기준 노드 수를 붙인 (테넌트 선택지, 태그 선택지), 예: ("파이썬 (42)", "파이썬")"""
+    counts = dm.node_facet_counts(search_text, selected_tenants, selected_tags)
+    return (
+        [(f"{tenant} ({n})", tenant) for tenant, n in counts["tenants"].items()],
+        [(f"{tag} ({n})", tag) for tag, n in counts["tags"].items()],
+    )
 
 
 def get_all_tags():
     """모든 노드의 태그 목록 반환"""
-    all_tags = set()
-    for node in dm.nodes_data:
-        all_tags.update(node.get("tags", []))
-    return sorted(list(all_tags))
+    return dm.all_tags()
 
 
 def get_all_tenants():
     """모든 노드의 테넌트 목록 반환"""
-    all_tenants = set()
-    for node in dm.nodes_data:
-        tenant = node.get("tenant", "미지정")
-        if tenant:
-            all_tenants.add(tenant)
-    return sorted(list(all_tenants))
+    return dm.all_tenants()
 
 
 def refresh_nodes():
-    """노드 목록 새로고침"""
-    dm.load_nodes()
-    return get_nodes_dataframe(), get_all_tags(), get_all_tenants()
+    """노드 목록 새로고침 (태그/테넌트 선택지에는 노드 수 표시)"""
+    dm.reload_if_changed("nodes")
+    tenant_choices, tag_choices = get_filter_choices()
+    return get_nodes_dataframe(), tag_choices, tenant_choices
 
 
-def get_node_details_by_index(index):
-    """인덱스로 노드 상세 정보 가져오기"""
-    if 0 <= index < len(dm.nodes_data):
-        node = dm.nodes_data[index]
+def get_node_details_by_id(node_id):
+    """ID로 노드 상세 정보 가져오기"""
+    node = dm.get_node(node_id)
+    if node is not None:
         return (
             node.get("title", ""),
             node.get("description", ""),
@@ -197,7 +202,7 @@ def get_node_details_by_index(index):
     return ("노드를 선택해주세요.", "", "", "", "")
 
 
-def update_node(index, title, description, tenant, tags_str):
+def update_node(node_id, title, description, tenant, tags_str):
     """노드 정보 업데이트"""
     if not title or not description:
         return "❌ 노드 제목과 설명을 모두 입력해주세요.", get_nodes_dataframe()
@@ -213,26 +218,24 @@ def update_node(index, title, description, tenant, tags_str):
     if not tags_list:
         return "❌ 태그를 최소 1개 이상 입력해주세요.", get_nodes_dataframe()
 
-    if 0 <= index < len(dm.nodes_data):
-        dm.nodes_data[index].update(
-            {
-                "title": title,
-                "description": description,
-                "tenant": tenant.strip(),
-                "tags": tags_list,
-            }
-        )
-        dm.save_nodes()
+    if dm.edit_node(
+        node_id,
+        {
+            "title": title,
+            "description": description,
+            "tenant": tenant.strip(),
+            "tags": tags_list,
+        },
+    ):
         return "✅ 노드가 성공적으로 수정되었습니다.", get_nodes_dataframe()
 
     return "❌ 수정할 노드를 찾을 수 없습니다.", get_nodes_dataframe()
 
 
-def delete_node(index):
+def delete_node(node_id):
     """노드 삭제"""
-    if 0 <= index < len(dm.nodes_data):
-        deleted_node = dm.nodes_data.pop(index)
-        dm.save_nodes()
+    deleted_node = dm.remove_node(node_id)
+    if deleted_node is not None:
         return (
             f"노드 '{deleted_node.get('title', '알 수 없음')}'가 삭제되었습니다.",
             get_nodes_dataframe(),
@@ -0,0 +1,220 @@
+import json
+import os
+import threading
+from datetime import datetime
+
+import pytz
+
+# 노드별로 이 수만큼의 리비전마다 전체 사본(체크포인트)을 기록
+# (임의 리비전 복원 시 읽는 줄 수가 이 값 이하로 제한됨)
+CHECKPOINT_INTERVAL = 10
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+# 리비전 시각은 아이디어 created_at과 같은 한국 시간으로 기록 (서버 시간대와 무관)
+KST = pytz.timezone("Asia/Seoul")
+
+
+class NodeHistoryStore:
+    """
+    노드 리비전 이력 (추가 전용)
+
+    - data/node_history.jsonl: 리비전 하나당 한 줄
+      {"node_id", "rev", "at", "op": "created"/"updated"/"deleted",
+       "checkpoint": 전체 노드} 또는 {"delta": {"set": {...}, "unset": [...]}}
+    - 수정은 직전 리비전 대비 바뀐 필드만 기록하고, CHECKPOINT_INTERVAL마다 전체 사본 기록
+    - 메모리에는 노드별 (리비전, 시각, 파일 위치, 체크포인트 여부)만 두고 본문은 필요할 때 읽음
+    """
+
+    def __init__(self, data_dir):
+        self.path = os.path.join(data_dir, "node_history.jsonl")
+        self._lock = threading.Lock()
+        self._index = {}  # node_id → [(rev, at, offset, is_checkpoint), ...]
+        self._indexed_bytes = 0
+
+    # ------------------------------------------------------------------
+    # 기록
+    # ------------------------------------------------------------------
+    def record_created(self, node):
+        self._append(node["id"], "created", node, previous=None)
+
+    def record_updated(self, previous, node):
+        """수정 기록, 이력이 없던 기존 노드는 수정 전 내용을 첫 리비전으로 남김"""
+        with self._lock:
+            self._refresh()
+            has_history = previous["id"] in self._index
+        if not has_history:
+            self._append(
+                previous["id"],
+                "created",
+                previous,
+                previous=None,
+                at=previous.get("created_at"),
+            )
+        self._append(node["id"], "updated", node, previous=previous)
+
+    def record_deleted(self, node):
+        self._append(node["id"], "deleted", None, previous=node)
+
+    def _append(self, node_id, op, node, previous, at=None):
+        with self._lock:
+            self._refresh()
+            revisions = self._index.get(node_id, [])
+            rev = revisions[-1][0] + 1 if revisions else 1
+            entry = {
+                "node_id": node_id,
+                "rev": rev,
+                "at": at or datetime.now(KST).strftime(TIME_FORMAT),
+                "op": op,
+            }
+            if op == "deleted":
+                entry["delta"] = {"set": {}, "unset": []}
+            elif previous is None or (rev - 1) % CHECKPOINT_INTERVAL == 0:
+                entry["checkpoint"] = dict(node)
+            else:
+                entry["delta"] = field_delta(previous, node)
+
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            line = (json.dumps(entry, ensure_ascii=False) + "\n").encode("utf-8")
+            with open(self.path, "ab") as f:
+                offset = f.tell()
+                f.write(line)
+                f.flush()
+                os.fsync(f.fileno())
+            if offset == self._indexed_bytes:
+                self._index_entry(entry, offset)
+                self._indexed_bytes = offset + len(line)
+            else:
+                # 다른 프로세스가 그 사이에 추가한 줄이 있음: 이어서 읽어 반영
+                self._refresh()
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def revisions(self, node_id):
+        """노드의 리비전 목록 [{"rev", "at", "op", "fields"}] (fields: 바뀐 필드 이름)"""
+        with self._lock:
+            self._refresh()
+            result = []
+            for rev, at, offset, _ in self._index.get(node_id, []):
+                entry = self._read_entry(offset)
+                if "checkpoint" in entry:
+                    fields = sorted(entry["checkpoint"])
+                else:
+                    delta = entry["delta"]
+                    fields = sorted(list(delta["set"]) + delta["unset"])
+                result.append(
+                    {"rev": rev, "at": at, "op": entry["op"], "fields": fields}
+                )
+            return result
+
+    def node_at_revision(self, node_id, rev):
+        """rev 리비전 시점의 노드 (삭제된 리비전이거나 없으면 None)"""
+        with self._lock:
+            self._refresh()
+            revisions = self._index.get(node_id, [])
+            position = next((i for i, r in enumerate(revisions) if r[0] == rev), None)
+            if position is None:
+                return None
+            return self._rebuild(revisions, position)
+
+    def node_as_of(self, node_id, when):
+        """
+        when 시점의 노드 (그때 없었으면 None)
+
+        when은 datetime 또는 "%Y-%m-%d %H:%M:%S" 문자열 (시간대가 없으면 한국 시간)
+        """
+        if isinstance(when, datetime):
+            if when.tzinfo is not None:
+                when = when.astimezone(KST)
+            when = when.strftime(TIME_FORMAT)
+        with self._lock:
+            self._refresh()
+            revisions = self._index.get(node_id, [])
+            position = None
+            for i, (_, at, _, _) in enumerate(revisions):
+                if at > when:
+                    break
+                position = i
+            if position is None:
+                return None
+            return self._rebuild(revisions, position)
+
+    def diff(self, node_id, rev_a, rev_b):
+        """두 리비전 사이에 바뀐 필드 {필드: (rev_a 값, rev_b 값)} (없는 리비전은 빈 노드로 취급)"""
+        before = self.node_at_revision(node_id, rev_a) or {}
+        after = self.node_at_revision(node_id, rev_b) or {}
+        return {
+            field: (before.get(field), after.get(field))
+            for field in sorted(set(before) | set(after))
+            if before.get(field) != after.get(field)
+        }
+
+    # ------------------------------------------------------------------
+    # 내부
+    # ------------------------------------------------------------------
+    def _rebuild(self, revisions, position):
+        """가장 가까운 이전 체크포인트부터 delta를 적용해 position 리비전 복원"""
+        start = position
+        while start > 0 and not revisions[start][3]:
+            start -= 1
+
+        node = None
+        for _, _, offset, _ in revisions[start : position + 1]:
+            entry = self._read_entry(offset)
+            if entry["op"] == "deleted":
+                node = None
+            elif "checkpoint" in entry:
+                node = dict(entry["checkpoint"])
+            elif node is not None:
+                apply_delta(node, entry["delta"])
+        return node
+
+    def _refresh(self):
+        """마지막으로 읽은 위치 이후에 추가된 줄을 인덱스에 반영"""
+        try:
+            size = os.path.getsize(self.path)
+        except OSError:
+            return
+        if size <= self._indexed_bytes:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._indexed_bytes)
+            offset = self._indexed_bytes
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # 기록 중인 마지막 줄
+                try:
+                    entry = json.loads(raw)
+                except (json.JSONDecodeError, ValueError):
+                    print("[WARN] node_history.jsonl 손상된 줄을 건너뜁니다.")
+                else:
+                    self._index_entry(entry, offset)
+                offset += len(raw)
+        self._indexed_bytes = offset
+
+    def _index_entry(self, entry, offset):
+        self._index.setdefault(entry["node_id"], []).append(
+            (entry["rev"], entry["at"], offset, "checkpoint" in entry)
+        )
+
+    def _read_entry(self, offset):
+        with open(self.path, "rb") as f:
+            f.seek(offset)
+            return json.loads(f.readline())
+
+
+def field_delta(before, after):
+    """before → after로 바뀐 필드 {"set": {필드: 새 값}, "unset": [사라진 필드]}"""
+    return {
+        "set": {k: v for k, v in after.items() if before.get(k, _MISSING) != v},
+        "unset": sorted(k for k in before if k not in after),
+    }
+
+
+def apply_delta(node, delta):
+    node.update(delta["set"])
+    for field in delta["unset"]:
+        node.pop(field, None)
+
+
+_MISSING = object()
@@ -0,0 +1,210 @@
+class NodeFacetIndex:
+    """
+    태그 → 노드 비트맵, 테넌트 → 노드 비트맵 역색인 (노드 변경 시 해당 노드만 갱신)
+
+    - 노드마다 저장 순번(위치)을 부여하고, 태그/테넌트별로 해당 위치의 비트를 켠
+      정수(비트맵)를 유지
+    - 태그/테넌트 필터와 태그 쿼리(src.tag_query)는 비트맵의 &, |, ~ 연산으로,
+      facet 수는 비트 수(bit_count)로 계산
+    - 비트 순서가 저장 순서이므로 결과를 다시 정렬할 필요가 없음
+    """
+
+    def __init__(self):
+        self.rebuild([])
+
+    def rebuild(self, nodes):
+        self.by_tag = {}
+        self.by_tenant = {}
+        self.all_bits = 0
+        self._entries = {}  # node_id → (tenant, tags, 소문자 제목)
+        self._order = {}  # node_id → 저장 순번 (비트 위치)
+        self._ids = []  # 저장 순번 → node_id (삭제된 자리는 None)
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node):
+        node_id = node["id"]
+        tenant = node.get("tenant", "미지정")
+        tags = tuple(dict.fromkeys(node.get("tags", [])))
+        self._entries[node_id] = (tenant, tags, node.get("title", "").lower())
+
+        position = self._order.get(node_id)
+        if position is None:
+            position = self._order[node_id] = len(self._ids)
+            self._ids.append(node_id)
+        bit = 1 << position
+        self.all_bits |= bit
+        self.by_tenant[tenant] = self.by_tenant.get(tenant, 0) | bit
+        for tag in tags:
+            self.by_tag[tag] = self.by_tag.get(tag, 0) | bit
+
+    def update(self, node):
+        """수정된 노드 반영 (저장 순번은 유지)"""
+        self._discard(node["id"])
+        self.add(node)
+
+    def remove(self, node_id):
+        self._discard(node_id)
+        position = self._order.pop(node_id, None)
+        if position is not None:
+            self._ids[position] = None
+
+    def _discard(self, node_id):
+        entry = self._entries.pop(node_id, None)
+        if entry is None:
+            return
+        tenant, tags, _ = entry
+        bit = 1 << self._order[node_id]
+        self.all_bits &= ~bit
+        _clear_bit(self.by_tenant, tenant, bit)
+        for tag in tags:
+            _clear_bit(self.by_tag, tag, bit)
+
+    # ------------------------------------------------------------------
+    # 비트맵 조회 (태그 쿼리 평가용)
+    # ------------------------------------------------------------------
+    def tag_bits(self, tag):
+        """태그가 붙은 노드 비트맵 (정확히 같은 태그가 없으면 대소문자 무시)"""
+        if tag in self.by_tag:
+            return self.by_tag[tag]
+        return _casefold_union(self.by_tag, tag)
+
+    def tenant_bits(self, tenant):
+        if tenant in self.by_tenant:
+            return self.by_tenant[tenant]
+        return _casefold_union(self.by_tenant, tenant)
+
+    def title_bits(self, text):
+        """노드 이름에 text가 포함된 노드 비트맵 (제목은 색인하지 않으므로 전체 확인)"""
+        text = text.lower()
+        order = self._order
+        return self.bits_from_positions(
+            order[node_id]
+            for node_id, (_, _, title) in self._entries.items()
+            if text in title
+        )
+
+    def bits_from_ids(self, node_ids):
+        order = self._order
+        return self.bits_from_positions(
+            order[node_id] for node_id in node_ids if node_id in order
+        )
+
+    def bits_from_positions(self, positions):
+        # 비트를 하나씩 켜면 매번 큰 정수를 복사하므로 2진 문자열을 만든 뒤 한 번에 변환
+        size = len(self._ids)
+        digits = bytearray(b"0" * (size + 1))
+        for position in positions:
+            digits[size - position] = 0x31  # "1"
+        return int(digits, 2)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def tenants(self):
+        return sorted(t for t in self.by_tenant if t)
+
+    def position(self, node_id):
+        """노드의 저장 순번 (없는 노드면 None)"""
+        return self._order.get(node_id)
+
+    def positions(self, node_ids):
+        """노드 ID 목록의 저장 순번 목록 (순서 유지, 없는 노드는 제외)"""
+        positions = list(map(self._order.get, node_ids))
+        if None in positions:
+            positions = [position for position in positions if position is not None]
+        return positions
+
+    def tags_of(self, node_id):
+        """색인에 반영된 노드의 태그 (없는 노드면 빈 튜플)"""
+        entry = self._entries.get(node_id)
+        return entry[1] if entry is not None else ()
+
+    def tags(self):
+        return sorted(self.by_tag)
+
+    def match(self, selected_tenants=None, selected_tags=None):
+        """
+        테넌트 필터(선택 중 하나)와 태그 필터(선택 중 하나라도 포함)를 모두 만족하는
+        노드 비트맵 (필터가 없으면 None)
+        """
+        return intersect(
+            _union(self.by_tenant, selected_tenants), _union(self.by_tag, selected_tags)
+        )
+
+    def ordered(self, bits):
+        """비트맵의 노드 ID 목록 (저장 순서)"""
+        # 낮은 비트부터 보도록 뒤집은 2진 문자열에서 "1"의 위치를 찾음
+        digits = bin(bits)[:1:-1]
+        ids = self._ids
+        result = []
+        position = digits.find("1")
+        while position != -1:
+            result.append(ids[position])
+            position = digits.find("1", position + 1)
+        return result
+
+    def facet_counts(self, selected_tenants=None, selected_tags=None, within=None):
+        """
+        현재 필터에서의 {"tenants": {테넌트: 노드 수}, "tags": {태그: 노드 수}}
+
+        각 항목의 수는 자기 자신을 제외한 나머지 조건(다른 쪽 필터, within)을 적용한 값
+        (태그를 하나 더 고르면 몇 개가 나오는지 보여 주는 일반적인 facet 방식)
+        within은 검색어 등 추가 조건을 만족하는 노드 비트맵 (None이면 전체)
+        """
+        tenant_base = intersect(_union(self.by_tag, selected_tags), within)
+        tag_base = intersect(_union(self.by_tenant, selected_tenants), within)
+        return {
+            "tenants": {
+                tenant: _count(bits, tenant_base)
+                for tenant, bits in sorted(self.by_tenant.items())
+                if tenant
+            },
+            "tags": {
+                tag: _count(bits, tag_base) for tag, bits in sorted(self.by_tag.items())
+            },
+        }
+
+
+def intersect(a, b):
+    """두 비트맵의 교집합 (None은 조건 없음)"""
+    if a is None:
+        return b
+    if b is None:
+        return a
+    return a & b
+
+
+def _clear_bit(index, key, bit):
+    bits = index.get(key)
+    if bits is None:
+        return
+    bits &= ~bit
+    if bits:
+        index[key] = bits
+    else:
+        del index[key]
+
+
+def _union(index, keys):
+    if not keys:
+        return None
+    bits = 0
+    for key in keys:
+        bits |= index.get(key, 0)
+    return bits
+
+
+def _casefold_union(index, key):
+    key = key.casefold()
+    bits = 0
+    for name, name_bits in index.items():
+        if name.casefold() == key:
+            bits |= name_bits
+    return bits
+
+
+def _count(bits, base):
+    if base is None:
+        return bits.bit_count()
+    return (bits & base).bit_count()
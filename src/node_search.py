@@ -0,0 +1,366 @@
+import math
+import re
+import threading
+import unicodedata
+from array import array
+from collections import Counter
+
+import numpy as np
+
+# BM25 파라미터와 노드 필드 가중치 (제목/태그에 나온 단어를 설명보다 높게 평가)
+BM25_K1 = 1.2
+BM25_B = 0.75
+TITLE_WEIGHT = 3
+TAGS_WEIGHT = 2
+# 죽은 문서(수정/삭제된 이전 내용)가 이 수와 살아 있는 문서 수를 모두 넘으면 재구성
+COMPACT_MIN_DEAD = 1000
+# 정규화 텍스트에서 필드를 잇는 구분자 (\w가 아니고 str.split()이 공백으로 취급하므로
+# 검색어 단어에 들어갈 수 없음)
+FIELD_SEPARATOR = "\x1f"
+
+_WORD = re.compile(r"\w+")
+
+
+def normalize(text):
+    """NFKC 정규화 + 대소문자 통일 (전각/반각, 호환 자모 차이 제거)"""
+    return unicodedata.normalize("NFKC", text).casefold()
+
+
+def bigrams(text):
+    """정규화된 텍스트의 단어(\\w+)별 문자 2-gram 목록 (한 글자 단어는 만들지 않음)"""
+    grams = []
+    for word in _WORD.findall(text):
+        grams.extend(word[i : i + 2] for i in range(len(word) - 1))
+    return grams
+
+
+class TextIndex:
+    """
+    문서(필드 텍스트 목록)의 문자 2-gram 역색인과 BM25 순위
+
+    - 띄어쓰기 단위 토큰 대신 2-gram을 쓰므로 "데이터분석을"에서 "분석"도 찾음
+      (교착어인 한국어에서 조사/어미가 붙은 단어 검색)
+    - 필드마다 가중치를 두어 (예: 제목 3, 태그 2, 설명 1) 앞선 필드에 나온 단어를 높게 평가
+    - 게시 목록은 gram → 문서 위치 array("I")와 같은 순서의 가중 출현 수 array("H")
+      (위치는 추가 순으로 증가하므로 항상 정렬 상태)
+    - 수정/삭제는 이전 위치를 죽은 문서로 표시만 하고, 죽은 문서가 많아지면 재구성
+    - 검색은 게시 목록 교집합(numpy searchsorted)으로 후보를 만들고, 여러 gram으로
+      이루어진 단어는 실제로 이어져 포함되는지 확인 (결과 집합은 부분 문자열 검색과 같음)
+    - 점수 계산은 후보 전체에 대해 numpy 배열 연산으로 처리
+    - read_fields(문서 ID → 필드 텍스트 목록)를 주면 정규화 텍스트를 메모리에 두지 않고
+      게시 목록만 유지하며, 이어져 포함되는지 확인이 필요하면 점수 순으로 후보의 필드를
+      그때 읽어 필요한 결과 수만큼만 확인 (본문이 큰 아이디어용)
+    """
+
+    def __init__(self, weights, read_fields=None):
+        self._weights = tuple(weights)  # 필드별 가중치
+        self._read_fields = read_fields
+        self._lock = threading.Lock()
+        self._built = False
+        self._reset()
+
+    def _reset(self):
+        self._postings = {}  # gram → array("I") 문서 위치
+        self._frequencies = {}  # gram → array("H") 위치별 가중 출현 수
+        self._ids = []  # 위치 → 문서 ID (죽은 문서는 None)
+        # 위치 → 필드 구분자로 이은 정규화 텍스트 (죽은 문서는 "", read_fields가 있으면 비움)
+        self._texts = []
+        self._alive = bytearray()
+        self._lengths = array("I")  # 위치 → 가중치를 적용한 gram 수
+        self._positions = {}  # 문서 ID → 현재 위치
+        self._total_length = 0
+
+    @property
+    def built(self):
+        return self._built
+
+    def invalidate(self):
+        """전체 문서가 바뀜 (다음 검색 때 다시 만듦)"""
+        with self._lock:
+            self._built = False
+            self._reset()
+
+    def ensure_built(self, documents):
+        """documents: [(문서 ID, 필드 텍스트 목록)] (이미 만들었으면 읽지 않음)"""
+        with self._lock:
+            if self._built:
+                return
+            self._reset()
+            for doc_id, fields in documents:
+                self._add(doc_id, [normalize_field(text) for text in fields])
+            self._built = True
+
+    def add(self, doc_id, fields):
+        """추가/수정된 문서 반영 (아직 색인을 만들지 않았으면 무시)"""
+        with self._lock:
+            if not self._built:
+                return
+            self._discard(doc_id)
+            self._add(doc_id, [normalize_field(text) for text in fields])
+            self._maybe_compact()
+
+    def remove(self, doc_id):
+        with self._lock:
+            if not self._built:
+                return
+            self._discard(doc_id)
+            self._maybe_compact()
+
+    def _add(self, doc_id, fields):
+        # 필드는 \w가 아닌 구분자로 이어 붙이므로 필드 경계를 넘는 gram은 생기지 않음
+        haystack = FIELD_SEPARATOR.join(fields)
+
+        position = len(self._ids)
+        self._ids.append(doc_id)
+        if self._read_fields is None:
+            self._texts.append(haystack)
+        self._alive.append(1)
+        self._positions[doc_id] = position
+
+        # 가중 출현 수: 전체 텍스트 출현 수 + 가중치가 높은 필드에 나온 만큼 추가
+        counts = Counter(bigrams(haystack))
+        for text, weight in zip(fields, self._weights):
+            if weight > 1:
+                for gram in bigrams(text):
+                    counts[gram] += weight - 1
+        length = sum(counts.values())
+        self._lengths.append(length)
+        self._total_length += length
+
+        postings = self._postings
+        frequencies = self._frequencies
+        for gram, frequency in counts.items():
+            if frequency > 0xFFFF:
+                frequency = 0xFFFF
+            posting = postings.get(gram)
+            if posting is None:
+                postings[gram] = array("I", (position,))
+                frequencies[gram] = array("H", (frequency,))
+            else:
+                posting.append(position)
+                frequencies[gram].append(frequency)
+
+    def _discard(self, doc_id):
+        position = self._positions.pop(doc_id, None)
+        if position is None:
+            return
+        self._ids[position] = None
+        if self._read_fields is None:
+            self._texts[position] = ""
+        self._alive[position] = 0
+        self._total_length -= self._lengths[position]
+
+    def _maybe_compact(self):
+        live = len(self._positions)
+        if len(self._ids) - live <= max(live, COMPACT_MIN_DEAD):
+            return
+        # 텍스트를 다시 읽지 않고 살아 있는 위치만 남겨 위치를 당김
+        alive = np.frombuffer(self._alive, dtype=np.uint8).astype(bool)
+        moved = np.cumsum(alive, dtype=np.int64) - 1
+        postings, frequencies = {}, {}
+        for gram, posting in self._postings.items():
+            old = np.frombuffer(posting, dtype=np.uint32)
+            keep = alive[old]
+            if keep.any():
+                postings[gram] = _array("I", moved[old[keep]].astype(np.uint32))
+                frequencies[gram] = _array(
+                    "H", np.frombuffer(self._frequencies[gram], dtype=np.uint16)[keep]
+                )
+        self._postings, self._frequencies = postings, frequencies
+        self._ids = [doc_id for doc_id in self._ids if doc_id is not None]
+        if self._read_fields is None:
+            self._texts = [t for t, live in zip(self._texts, alive.tolist()) if live]
+        self._lengths = _array(
+            "I", np.frombuffer(self._lengths, dtype=np.uint32)[alive]
+        )
+        self._alive = bytearray(b"\x01" * len(self._ids))
+        self._positions = {doc_id: i for i, doc_id in enumerate(self._ids)}
+
+    # ------------------------------------------------------------------
+    # 검색
+    # ------------------------------------------------------------------
+    def search(self, text, limit=None, offset=0):
+        """
+        검색어의 모든 단어(공백 구분)를 필드 중 어딘가에 포함한 문서의
+        [(문서 ID, 점수)] 목록 (BM25 점수 내림차순, 같은 점수는 색인 순서)
+
+        limit/offset은 결과 페이지 (read_fields가 있으면 페이지까지만 후보를 읽어 확인)
+        """
+        with self._lock:
+            needed = None if limit is None else offset + limit
+            positions, scores = self._ranked(text, needed=needed)
+            positions, scores = positions[offset:needed], scores[offset:needed]
+            ids = self._ids
+            return [
+                (ids[position], score)
+                for position, score in zip(positions.tolist(), scores.tolist())
+            ]
+
+    def search_ids(self, text, within=None):
+        """
+        search와 같은 순서의 문서 ID 목록 (점수가 필요 없을 때)
+
+        within(문서 ID 목록)이 있으면 그 문서만 후보로 두고 점수를 계산
+        (다른 필터로 이미 좁혀진 경우 결과 전체를 만든 뒤 거르지 않음)
+        """
+        with self._lock:
+            positions, _ = self._ranked(text, within)
+            return list(map(self._ids.__getitem__, positions.tolist()))
+
+    def _ranked(self, text, within=None, needed=None):
+        """
+        검색 결과 (문서 위치, 점수) 배열 쌍, 점수 내림차순 (잠금 안에서 호출)
+
+        needed는 앞에서부터 필요한 결과 수 (텍스트를 읽어 확인할 때만 그 수에서 멈춤)
+        """
+        empty = np.empty(0, dtype=np.int64)
+        words = normalize(text).split()
+        if not words:
+            return empty, np.empty(0)
+        grams = list(dict.fromkeys(gram for word in words for gram in bigrams(word)))
+        # 2글자 단어는 gram 하나와 같으므로 확인이 필요 없음
+        verify = [word for word in words if len(word) != 2 or word not in grams]
+
+        candidates = self._candidates(grams)
+        if within is not None:
+            positions = self._positions
+            allowed = np.array(
+                [positions[doc_id] for doc_id in within if doc_id in positions],
+                dtype=np.int64,
+            )
+            candidates = candidates[np.isin(candidates, allowed, assume_unique=True)]
+        if self._read_fields is not None:
+            return self._ranked_lazily(candidates, grams, verify, needed)
+        if verify and len(candidates):
+            texts = self._texts
+            positions = candidates.tolist()
+            for word in verify:
+                positions = [p for p in positions if word in texts[p]]
+            candidates = np.array(positions, dtype=np.int64)
+        if not len(candidates):
+            return empty, np.empty(0)
+
+        if grams:
+            scores = self._bm25(candidates, grams)
+        else:
+            scores = self._bm25_scan(candidates, words)
+        order = np.argsort(-scores, kind="stable")
+        return candidates[order], scores[order]
+
+    def _ranked_lazily(self, candidates, grams, verify, needed):
+        """텍스트를 두지 않는 색인: 점수 순으로 후보의 필드를 읽어 needed개까지 확인"""
+        if not len(candidates):
+            return candidates, np.empty(0)
+        if grams:
+            scores = self._bm25(candidates, grams)
+        else:
+            # 한 글자 단어만 있으면 출현 수를 셀 텍스트가 없으므로 색인 순서
+            scores = np.zeros(len(candidates))
+        order = np.argsort(-scores, kind="stable")
+        if not verify:
+            order = order[:needed]
+            return candidates[order], scores[order]
+
+        kept = []
+        for i in order.tolist():
+            fields = self._read_fields(self._ids[candidates[i]])
+            haystack = FIELD_SEPARATOR.join(normalize_field(text) for text in fields)
+            if all(word in haystack for word in verify):
+                kept.append(i)
+                if needed is not None and len(kept) >= needed:
+                    break
+        kept = np.array(kept, dtype=np.int64)
+        return candidates[kept], scores[kept]
+
+    def _candidates(self, grams):
+        """모든 gram을 포함한 살아 있는 문서 위치 (gram이 없으면 전체)"""
+        if not grams:
+            candidates = np.arange(len(self._ids), dtype=np.int64)
+        else:
+            if any(gram not in self._postings for gram in grams):
+                return np.empty(0, dtype=np.int64)
+            # 가장 짧은 게시 목록부터 교집합
+            ordered = sorted(grams, key=lambda gram: len(self._postings[gram]))
+            candidates = self._posting(ordered[0]).astype(np.int64)
+            for gram in ordered[1:]:
+                if not len(candidates):
+                    break
+                posting = self._posting(gram)
+                found = np.searchsorted(posting, candidates)
+                found[found == len(posting)] = 0
+                candidates = candidates[posting[found] == candidates]
+        alive = np.frombuffer(self._alive, dtype=np.uint8)
+        return candidates[alive[candidates] == 1]
+
+    def _posting(self, gram):
+        return np.frombuffer(self._postings[gram], dtype=np.uint32)
+
+    def _norms(self, candidates):
+        live = max(len(self._positions), 1)
+        average_length = max(self._total_length / live, 1)
+        lengths = np.frombuffer(self._lengths, dtype=np.uint32)[candidates]
+        return BM25_K1 * (1 - BM25_B + BM25_B * lengths / average_length)
+
+    def _idf(self, df):
+        live = len(self._positions)
+        # 죽은 문서도 게시 목록에 남아 있으므로 문서 빈도는 근사값
+        df = min(df, live)
+        return math.log(1 + (live - df + 0.5) / (df + 0.5))
+
+    def _bm25(self, candidates, grams):
+        norms = self._norms(candidates)
+        scores = np.zeros(len(candidates))
+        for gram in grams:
+            posting = self._posting(gram)
+            frequencies = np.frombuffer(self._frequencies[gram], dtype=np.uint16)
+            # 후보는 모든 gram을 포함하므로 searchsorted 위치가 곧 해당 항목
+            tf = frequencies[np.searchsorted(posting, candidates)].astype(np.float64)
+            scores += self._idf(len(posting)) * tf * (BM25_K1 + 1) / (tf + norms)
+        return scores
+
+    def _bm25_scan(self, candidates, words):
+        """한 글자 단어만 있는 검색어: 색인된 gram이 없으므로 텍스트에서 직접 셈"""
+        texts = self._texts
+        norms = self._norms(candidates)
+        scores = np.zeros(len(candidates))
+        for word in words:
+            tf = np.array(
+                [texts[position].count(word) for position in candidates.tolist()],
+                dtype=np.float64,
+            )
+            idf = self._idf(int(np.count_nonzero(tf)))
+            scores += idf * tf * (BM25_K1 + 1) / (tf + norms)
+        return scores
+
+
+def _array(typecode, values):
+    """numpy 배열을 같은 크기 정수의 array로 변환"""
+    result = array(typecode)
+    result.frombytes(values.tobytes())
+    return result
+
+
+def normalize_field(text):
+    """필드 텍스트 정규화 (필드 구분자는 공백으로 바꿈)"""
+    return normalize(text).replace(FIELD_SEPARATOR, " ")
+
+
+class NodeTextIndex(TextIndex):
+    """노드 제목/태그/설명 전문 검색 색인 (제목/태그에 나온 단어를 설명보다 높게 평가)"""
+
+    def __init__(self):
+        super().__init__((TITLE_WEIGHT, TAGS_WEIGHT, 1))
+
+    def ensure_built(self, nodes):
+        super().ensure_built((node["id"], _node_fields(node)) for node in nodes)
+
+    def add(self, node):
+        super().add(node["id"], _node_fields(node))
+
+
+def _node_fields(node):
+    return (
+        node.get("title", ""),
+        " ".join(node.get("tags", [])),
+        node.get("description", ""),
+    )
@@ -0,0 +1,80 @@
+import hashlib
+import json
+import os
+import threading
+
+# 해시 문자열 길이 (sha256 16진수 앞부분)
+HASH_LENGTH = 16
+
+
+def node_hash(node):
+    """노드 필드 내용으로 계산한 콘텐츠 해시"""
+    canonical = json.dumps(node, ensure_ascii=False, sort_keys=True)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()[:HASH_LENGTH]
+
+
+class NodeSnapshotStore:
+    """
+    아이디어 생성에 사용된 노드 스냅샷을 해시 기준으로 한 번만 저장하는 테이블
+
+    - data/node_snapshots.jsonl: {"hash": ..., "node": {...}} 한 줄씩 추가 전용
+    - 아이디어에는 used_node_hashes(해시 목록)만 저장
+    """
+
+    def __init__(self, data_dir):
+        self.path = os.path.join(data_dir, "node_snapshots.jsonl")
+        self.snapshots = {}
+        self._lock = threading.Lock()
+
+    def exists(self):
+        return os.path.exists(self.path)
+
+    def load(self):
+        """저장된 스냅샷 불러오기 (잘린 줄은 건너뜀)"""
+        snapshots = {}
+        if os.path.exists(self.path):
+            with open(self.path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        entry = json.loads(line)
+                    except (json.JSONDecodeError, ValueError):
+                        print("[WARN] node_snapshots.jsonl 손상된 줄을 건너뜁니다.")
+                        continue
+                    snapshots[entry["hash"]] = entry["node"]
+        with self._lock:
+            self.snapshots = snapshots
+
+    def put_many(self, nodes):
+        """노드 목록을 저장하고 같은 순서의 해시 목록 반환 (이미 있는 해시는 재사용)"""
+        hashes = []
+        new_lines = []
+        with self._lock:
+            for node in nodes:
+                digest = node_hash(node)
+                hashes.append(digest)
+                if digest not in self.snapshots:
+                    self.snapshots[digest] = dict(node)
+                    new_lines.append(
+                        json.dumps({"hash": digest, "node": node}, ensure_ascii=False)
+                    )
+
+            if new_lines or not os.path.exists(self.path):
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                with open(self.path, "a", encoding="utf-8") as f:
+                    for line in new_lines:
+                        f.write(line + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+        return hashes
+
+    def resolve(self, hashes):
+        """해시 목록을 노드 목록으로 변환 (없는 해시는 표시용 대체 노드)"""
+        if any(digest not in self.snapshots for digest in hashes):
+            # 다른 워커 프로세스가 추가한 스냅샷일 수 있으므로 파일을 다시 읽음
+            self.load()
+        return [
+            self.snapshots.get(digest, {"title": "스냅샷 없음", "tenant": digest})
+            for digest in hashes
+        ]
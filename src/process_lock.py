@@ -0,0 +1,65 @@
+import os
+import threading
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows: 여러 워커 모드 미지원
+    fcntl = None
+
+
+class ProcessLock:
+    """
+    잠금 파일의 flock으로 여러 프로세스 사이에서 배타적으로 보유하는 잠금
+
+    - 같은 프로세스 안에서는 스레드 잠금(RLock)으로 먼저 직렬화하고 재진입 가능
+    - 프로세스가 죽으면 운영체제가 flock을 풀어 주므로 남은 잠금 파일은 무해함
+    """
+
+    def __init__(self, path):
+        if fcntl is None:
+            raise RuntimeError(
+                "이 운영체제에서는 프로세스 간 잠금(fcntl)을 쓸 수 없습니다."
+            )
+        self.path = path
+        self._rlock = threading.RLock()
+        self._depth = 0
+        self._file = None
+
+    @contextmanager
+    def hold(self):
+        with self._rlock:
+            if self._depth == 0:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._file = open(self.path, "a+")
+                fcntl.flock(self._file.fileno(), fcntl.LOCK_EX)
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    fcntl.flock(self._file.fileno(), fcntl.LOCK_UN)
+                    self._file.close()
+                    self._file = None
+
+    def claim(self):
+        """
+        기다리지 않고 잠금을 시도해, 잡으면 프로세스가 끝날 때까지 보유하고 True 반환
+
+        여러 프로세스 중 하나만 맡을 일(예약 백업 등)의 담당을 정할 때 사용하며,
+        담당 프로세스가 죽으면 운영체제가 잠금을 풀어 다른 프로세스가 이어받을 수 있음
+        """
+        with self._rlock:
+            if self._file is not None:
+                return True
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            f = open(self.path, "a+")
+            try:
+                fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                f.close()
+                return False
+            self._file = f
+            self._depth += 1
+            return True
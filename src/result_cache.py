@@ -0,0 +1,141 @@
+import functools
+import inspect
+import threading
+from collections import OrderedDict
+
+import src.data_manager as dm
+
+
+class ResultCache:
+    """
+    데이터 버전별 결과 LRU 캐시 (필터/표 조회 결과 재사용)
+
+    - 키는 (함수 이름, 정규화한 인자, 데이터 버전), 버전이 바뀐 뒤의 조회는 새 키이므로
+      변경 전 결과를 돌려주지 않음
+    - 컬렉션 버전이 바뀌면 그 컬렉션의 이전 버전 항목을 비워 메모리를 바로 돌려받음
+    - 항목 수가 maxsize를 넘으면 가장 오래 쓰지 않은 항목부터 제거
+    - 함수별 적중/실패/제거 수를 stats()로 제공 (캐시 크기 조정용)
+    """
+
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()  # (컬렉션, 버전, 함수 이름, 인자) → 결과
+        self._versions = {}  # 컬렉션 → 캐시에 들어 있는 항목의 버전
+        self._counters = {}  # 함수 이름 → {"hits", "misses", "evictions"}
+
+    def get_or_compute(self, collection, version, name, key, compute):
+        """캐시에 있으면 그 결과, 없으면 compute()를 실행해 저장 후 반환"""
+        entry_key = (collection, version, name, key)
+        with self._lock:
+            counters = self._counter(name)
+            if entry_key in self._entries:
+                self._entries.move_to_end(entry_key)
+                counters["hits"] += 1
+                return self._entries[entry_key]
+            counters["misses"] += 1
+
+        # 계산은 잠금 밖에서 (같은 키를 동시에 계산하면 나중 결과로 덮어씀)
+        result = compute()
+
+        with self._lock:
+            if self.maxsize <= 0:
+                return result
+            if self._versions.get(collection) != version:
+                if self._versions.get(collection, -1) > version:
+                    # 계산하는 동안 더 새 버전이 캐시됨: 이전 버전 결과는 저장하지 않음
+                    return result
+                self._drop_collection(collection)
+                self._versions[collection] = version
+            self._entries[entry_key] = result
+            self._entries.move_to_end(entry_key)
+            while len(self._entries) > self.maxsize:
+                (_, _, evicted, _), _ = self._entries.popitem(last=False)
+                self._counter(evicted)["evictions"] += 1
+        return result
+
+    def _drop_collection(self, collection):
+        for entry_key in [k for k in self._entries if k[0] == collection]:
+            del self._entries[entry_key]
+
+    def _counter(self, name):
+        counters = self._counters.get(name)
+        if counters is None:
+            counters = self._counters[name] = {"hits": 0, "misses": 0, "evictions": 0}
+        return counters
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._versions.clear()
+
+    def stats(self):
+        """{"size", "maxsize", "functions": {함수 이름: {"hits", "misses", "evictions", "hit_rate"}}}"""
+        with self._lock:
+            functions = {}
+            for name, counters in sorted(self._counters.items()):
+                lookups = counters["hits"] + counters["misses"]
+                functions[name] = dict(
+                    counters,
+                    hit_rate=round(counters["hits"] / lookups, 3) if lookups else 0.0,
+                )
+            return {
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "functions": functions,
+            }
+
+
+results = ResultCache(dm.RESULT_CACHE_SIZE)
+
+
+def cached(collection, copy=None):
+    """
+    collection("nodes"/"ideas") 데이터 버전별로 결과를 캐시하는 데코레이터
+
+    인자는 정규화한 값으로 키를 만들고 함수에도 그 값으로 전달
+    (검색어 앞뒤 공백 제거, 테넌트/태그 선택은 순서와 중복을 무시한 목록)
+    copy가 있으면 캐시된 결과 대신 copy(결과)를 반환 (호출한 쪽이 고쳐도 캐시는 그대로)
+    """
+
+    def decorator(func):
+        name = func.__name__
+        signature = inspect.signature(func)
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            # 기본값까지 채운 인자 목록으로 키를 만듦 (f()와 f("")가 같은 키)
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = {
+                key: _normalize(value) for key, value in bound.arguments.items()
+            }
+            key = tuple(_freeze(value) for value in arguments.values())
+            # 버전은 계산 전에 읽어야 계산 도중의 변경을 놓치지 않음
+            version = dm.get_version(collection)
+            result = results.get_or_compute(
+                collection, version, name, key, lambda: func(**arguments)
+            )
+            return copy(result) if copy is not None else result
+
+        return wrapper
+
+    return decorator
+
+
+def cache_stats():
+    """결과 캐시 크기와 함수별 적중/실패/제거 수"""
+    return results.stats()
+
+
+def _normalize(value):
+    if isinstance(value, str):
+        return value.strip()
+    if isinstance(value, (list, tuple, set)):
+        # 테넌트/태그 선택: 빈 선택은 None과 같음
+        return sorted(set(value)) or None
+    return value
+
+
+def _freeze(value):
+    return tuple(value) if isinstance(value, list) else value
@@ -0,0 +1,88 @@
+import threading
+from contextlib import contextmanager
+
+
+class RWLock:
+    """
+    읽기-쓰기 잠금
+
+    - 읽기는 여러 스레드가 동시에, 쓰기는 단독으로 보유
+    - 쓰기 대기자가 있으면 새 읽기는 대기 (쓰기 기아 방지)
+    - 같은 스레드 안에서는 재진입 가능 (쓰기 보유 중 읽기/쓰기, 읽기 보유 중 읽기)
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = None
+        self._write_depth = 0
+        self._waiting_writers = 0
+        self._local = threading.local()
+
+    def acquire_read(self):
+        me = threading.get_ident()
+        depth = getattr(self._local, "read_depth", 0)
+        with self._cond:
+            # 이미 잠금을 보유한 스레드는 대기 없이 진입
+            if self._writer != me and depth == 0:
+                while self._writer is not None or self._waiting_writers:
+                    self._cond.wait()
+            self._readers += 1
+        self._local.read_depth = depth + 1
+
+    def release_read(self):
+        self._local.read_depth -= 1
+        with self._cond:
+            self._readers -= 1
+            if self._readers == 0:
+                self._cond.notify_all()
+
+    def acquire_write(self):
+        me = threading.get_ident()
+        with self._cond:
+            if self._writer == me:
+                self._write_depth += 1
+                return
+            if getattr(self._local, "read_depth", 0):
+                raise RuntimeError(
+                    "읽기 잠금을 보유한 채 쓰기 잠금을 얻을 수 없습니다."
+                )
+
+            self._waiting_writers += 1
+            try:
+                while self._writer is not None or self._readers:
+                    self._cond.wait()
+            finally:
+                self._waiting_writers -= 1
+            self._writer = me
+            self._write_depth = 1
+
+    def release_write(self):
+        with self._cond:
+            self._write_depth -= 1
+            if self._write_depth == 0:
+                self._writer = None
+                self._cond.notify_all()
+
+    def held(self):
+        """현재 스레드가 읽기 또는 쓰기 잠금을 보유 중인지"""
+        with self._cond:
+            if self._writer == threading.get_ident():
+                return True
+        return getattr(self._local, "read_depth", 0) > 0
+
+    @contextmanager
+    def read(self):
+        self.acquire_read()
+        try:
+            yield
+        finally:
+            self.release_read()
+
+    @contextmanager
+    def write(self):
+        self.acquire_write()
+        try:
+            yield
+        finally:
+            self.release_write()
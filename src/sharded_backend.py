@@ -0,0 +1,296 @@
+import hashlib
+import json
+import os
+
+from src.json_stream import load_json_array, stream_json_array
+from src.storage import JsonBackend
+from src.write_behind import atomic_write_json
+
+SHARD_DIR = "nodes"
+MANIFEST_FILE = "manifest.json"
+# 샤드 쓰기 요청을 write-behind 큐에서 구분하기 위한 접두어
+SHARD_KEY_PREFIX = "nodes/"
+
+
+def shard_filename(tenant):
+    """테넌트 이름으로 샤드 파일명 생성 (한글/특수문자 대신 해시 사용)"""
+    digest = hashlib.sha1(tenant.encode("utf-8")).hexdigest()[:12]
+    return f"{digest}.json"
+
+
+def node_tenant(node):
+    return node.get("tenant", "미지정")
+
+
+class ShardedBackend(JsonBackend):
+    """
+    노드를 테넌트별 샤드 파일로 나눠 저장하는 백엔드 (아이디어는 JSON 그대로)
+
+    - data/nodes/manifest.json: {테넌트: {"file", "count", "tags", "tag_counts"}}
+    - data/nodes/<해시>.json: 해당 테넌트의 노드 목록
+    - 시작 시에는 manifest만 읽고, 샤드는 테넌트 필터가 요구할 때 불러옴
+    - 노드 수, 테넌트/태그 목록, 검색어·태그 필터가 없을 때의 facet 수, 태그 추천은
+      manifest로 답함 (샤드를 읽지 않음)
+    - 전체 노드 표(필터 없는 목록)나 검색어/태그 필터/태그 쿼리는 모든 샤드가 필요하므로
+      그때 남은 샤드를 모두 불러옴
+    - 변경 시에는 해당 테넌트의 샤드와 manifest만 다시 씀 (테넌트별 노드 목록을 따로
+      들고 있으므로 샤드 크기에 비례)
+    - 샤드는 data_manager의 load_more 경로로만 메모리에 올라오며 (ID 맵/색인 등록),
+      불러오지 않은 샤드를 바꾸려 하면 RuntimeError
+    """
+
+    def __init__(
+        self,
+        data_dir,
+        get_records,
+        write_behind_delay=0,
+        binary_snapshot=False,
+        records_lock=None,
+    ):
+        super().__init__(
+            data_dir, get_records, write_behind_delay, binary_snapshot, records_lock
+        )
+        self.shard_dir = os.path.join(data_dir, SHARD_DIR)
+        self.manifest_path = os.path.join(self.shard_dir, MANIFEST_FILE)
+        self.manifest = {}
+        self._loaded = set()
+        # 불러온 샤드의 {테넌트: 노드 목록} (get_records("nodes")와 같은 객체)
+        self._shards = {}
+
+    # ------------------------------------------------------------------
+    # 불러오기
+    # ------------------------------------------------------------------
+    def load(self, name):
+        if name != "nodes":
+            return super().load(name)
+
+        self.flush()
+        if not os.path.exists(self.manifest_path):
+            self._split_legacy_json()
+
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                self.manifest = json.load(f)
+        except (OSError, json.JSONDecodeError, ValueError):
+            self.manifest = {}
+        self._upgrade_manifest()
+        self.remember_files(name)
+
+        # 샤드는 필요할 때 load_more()로 불러옴
+        self._loaded = set()
+        self._shards = {}
+        return []
+
+    def data_files(self, name):
+        if name != "nodes":
+            return super().data_files(name)
+        # 샤드를 쓸 때마다 manifest도 다시 쓰므로 manifest만 보면 됨
+        return [self.manifest_path]
+
+    def has_unloaded(self, name, tenants=None):
+        if name != "nodes":
+            return False
+        return bool(self._missing_shards(tenants))
+
+    def load_more(self, name, tenants=None):
+        if name != "nodes":
+            return []
+
+        nodes = []
+        for tenant in self._missing_shards(tenants):
+            shard_nodes = self._read_shard(tenant)
+            nodes.extend(shard_nodes)
+            self._shards[tenant] = list(shard_nodes)
+            self._loaded.add(tenant)
+        return nodes
+
+    def _missing_shards(self, tenants):
+        wanted = tenants if tenants else self.manifest.keys()
+        return [t for t in wanted if t in self.manifest and t not in self._loaded]
+
+    def _read_shard(self, tenant):
+        path = os.path.join(self.shard_dir, self.manifest[tenant]["file"])
+        try:
+            return load_json_array(path, self._quarantine_path("nodes"), tenant)
+        except OSError as e:
+            print(f"[ERROR] '{tenant}' 샤드를 읽지 못했습니다: {e}")
+            return []
+
+    def _upgrade_manifest(self):
+        """태그별 노드 수(tag_counts)가 없는 예전 manifest는 샤드를 한 번 읽어 채움"""
+        outdated = [
+            t for t, entry in self.manifest.items() if "tag_counts" not in entry
+        ]
+        if not outdated:
+            return
+        for tenant in outdated:
+            self.manifest[tenant] = _manifest_entry(tenant, self._read_shard(tenant))
+        atomic_write_json(self.manifest_path, self.manifest, indent=2)
+        print(
+            f"[INFO] 샤드 manifest {len(outdated)}건에 태그별 노드 수를 추가했습니다."
+        )
+
+    def _split_legacy_json(self):
+        """기존 data/nodes_data.json을 테넌트별 샤드로 나눔 (최초 1회)"""
+        legacy_path = self._path("nodes")
+        by_tenant = {}
+        if os.path.exists(legacy_path):
+            for node in stream_json_array(legacy_path, self._quarantine_path("nodes")):
+                by_tenant.setdefault(node_tenant(node), []).append(node)
+
+        manifest = {}
+        for tenant, shard_nodes in by_tenant.items():
+            manifest[tenant] = _manifest_entry(tenant, shard_nodes)
+            atomic_write_json(
+                os.path.join(self.shard_dir, manifest[tenant]["file"]),
+                shard_nodes,
+                indent=2,
+            )
+        atomic_write_json(self.manifest_path, manifest, indent=2)
+        total = sum(len(shard_nodes) for shard_nodes in by_tenant.values())
+        if total:
+            print(f"[INFO] 노드 {total}건을 {len(manifest)}개 샤드로 나눴습니다.")
+
+    # ------------------------------------------------------------------
+    # 변경
+    # ------------------------------------------------------------------
+    def append(self, name, record):
+        if name != "nodes":
+            return super().append(name, record)
+        tenant = node_tenant(record)
+        self._require_loaded(tenant)
+        self._shards.setdefault(tenant, []).append(record)
+        self._touch(tenant)
+
+    def update(self, name, index, fields, previous=None):
+        if name != "nodes":
+            return super().update(name, index, fields, previous)
+        node = self.get_records(name)[index]
+        tenant = node_tenant(node)
+        if previous is not None and node_tenant(previous) != tenant:
+            # 테넌트가 바뀌면 이전 샤드에서 빼서 새 샤드로 옮김
+            self._require_loaded(tenant)
+            self._remove_from_shard(node_tenant(previous), node)
+            self._shards.setdefault(tenant, []).append(node)
+            self._touch(node_tenant(previous))
+        self._touch(tenant)
+
+    def delete(self, name, index, record=None):
+        if name != "nodes":
+            return super().delete(name, index, record)
+        if record is None:
+            return self.save(name)
+        self._remove_from_shard(node_tenant(record), record)
+        self._touch(node_tenant(record))
+
+    def mark_changed(self, name, records):
+        if name != "nodes":
+            return super().mark_changed(name, records)
+        for tenant in {node_tenant(r) for r in records}:
+            self._touch(tenant)
+
+    def save(self, name):
+        if name != "nodes":
+            return super().save(name)
+        # 전체 저장: 모든 샤드가 메모리에 있어야 하며 (data_manager가 먼저 불러옴)
+        # 메모리 목록으로 테넌트별 목록을 다시 만든 뒤 각각 다시 씀
+        self._require_loaded(*self.manifest)
+        self._shards = {}
+        for node in self.get_records(name):
+            self._shards.setdefault(node_tenant(node), []).append(node)
+        for tenant in set(self._shards) | set(self.manifest):
+            self._touch(tenant)
+
+    def _require_loaded(self, *tenants):
+        """디스크에만 있는 샤드를 바꾸면 그 샤드의 기존 노드를 잃으므로 막음"""
+        for tenant in tenants:
+            if tenant in self.manifest and tenant not in self._loaded:
+                raise RuntimeError(f"'{tenant}' 샤드를 먼저 불러와야 합니다.")
+
+    def _remove_from_shard(self, tenant, record):
+        shard_nodes = self._shards.get(tenant, [])
+        for i, node in enumerate(shard_nodes):
+            if node is record:
+                del shard_nodes[i]
+                return
+
+    def _touch(self, tenant):
+        """테넌트 샤드가 바뀌었음을 기록하고 저장 예약"""
+        self._require_loaded(tenant)
+        self._loaded.add(tenant)
+
+        shard_nodes = self._shards.get(tenant)
+        if shard_nodes:
+            self.manifest[tenant] = _manifest_entry(tenant, shard_nodes)
+        else:
+            self.manifest.pop(tenant, None)
+            self._shards.pop(tenant, None)
+
+        key = SHARD_KEY_PREFIX + tenant
+        if self._flusher:
+            self._flusher.mark_dirty(key)
+        else:
+            self._write(key)
+
+    def _snapshot(self, name):
+        if not name.startswith(SHARD_KEY_PREFIX):
+            return super()._snapshot(name)
+        tenant = name[len(SHARD_KEY_PREFIX) :]
+        shard_nodes = [dict(n) for n in self._shards.get(tenant, [])]
+        return shard_nodes, dict(self.manifest)
+
+    def _write_snapshot(self, name, snapshot):
+        if not name.startswith(SHARD_KEY_PREFIX):
+            return super()._write_snapshot(name, snapshot)
+
+        tenant = name[len(SHARD_KEY_PREFIX) :]
+        path = os.path.join(self.shard_dir, shard_filename(tenant))
+        shard_nodes, manifest = snapshot
+        if shard_nodes:
+            atomic_write_json(path, shard_nodes, indent=2)
+        elif os.path.exists(path):
+            os.remove(path)
+        atomic_write_json(self.manifest_path, manifest, indent=2)
+        self.remember_files("nodes")
+
+    # ------------------------------------------------------------------
+    # manifest 기반 조회 (샤드를 불러오지 않고 응답)
+    # ------------------------------------------------------------------
+    def count(self, name):
+        if name != "nodes":
+            return super().count(name)
+        return sum(entry["count"] for entry in self.manifest.values())
+
+    def tenants(self):
+        return sorted(t for t in self.manifest if t)
+
+    def tags(self):
+        all_tags = set()
+        for entry in self.manifest.values():
+            all_tags.update(entry["tags"])
+        return sorted(all_tags)
+
+    def tenant_counts(self):
+        return {tenant: entry["count"] for tenant, entry in self.manifest.items()}
+
+    def tag_counts(self, tenants=None):
+        counts = {}
+        for tenant, entry in self.manifest.items():
+            if tenants and tenant not in tenants:
+                continue
+            for tag, n in entry["tag_counts"].items():
+                counts[tag] = counts.get(tag, 0) + n
+        return counts
+
+
+def _manifest_entry(tenant, shard_nodes):
+    tag_counts = {}
+    for node in shard_nodes:
+        for tag in set(node.get("tags", [])):
+            tag_counts[tag] = tag_counts.get(tag, 0) + 1
+    return {
+        "file": shard_filename(tenant),
+        "count": len(shard_nodes),
+        "tags": sorted(tag_counts),
+        "tag_counts": dict(sorted(tag_counts.items())),
+    }
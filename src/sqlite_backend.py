@@ -0,0 +1,340 @@
+import json
+import os
+import sqlite3
+import threading
+
+from src.json_stream import stream_json_array
+from src.storage import (
+    DEFAULT_CREATED_AT,
+    StorageBackend,
+    idea_list_row,
+)
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS nodes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT NOT NULL DEFAULT '',
+    tenant TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_nodes_tenant ON nodes(tenant);
+CREATE INDEX IF NOT EXISTS idx_nodes_created_at ON nodes(created_at);
+
+CREATE TABLE IF NOT EXISTS node_tags (
+    node_id INTEGER NOT NULL REFERENCES nodes(id) ON DELETE CASCADE,
+    tag TEXT NOT NULL,
+    PRIMARY KEY (tag, node_id)
+);
+CREATE INDEX IF NOT EXISTS idx_node_tags_node_id ON node_tags(node_id);
+
+CREATE TABLE IF NOT EXISTS ideas (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    title TEXT,
+    overview TEXT,
+    ai_name TEXT,
+    contest_title TEXT,
+    created_at TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_ideas_created_at ON ideas(created_at);
+CREATE INDEX IF NOT EXISTS idx_ideas_contest_title ON ideas(contest_title);
+"""
+
+
+class SqliteBackend(StorageBackend):
+    """
+    표준 라이브러리 sqlite3(WAL 모드) 기반 백엔드
+
+    - 변경 1건 = 행 1개 쓰기 (전체 파일 재작성 없음), 다른 프로세스의 커밋은
+      PRAGMA data_version으로 감지
+    - 필터용 컬럼(tenant, created_at, contest_title)과 태그 조인 테이블에 인덱스
+    - 테넌트/태그/생성일 노드 필터와 아이디어 목록의 정렬, LIMIT/OFFSET은 SQL로 처리
+      (data_manager.query_nodes가 전문 검색/태그 쿼리가 없을 때 query_nodes로 넘김)
+    - 레코드 원본은 data 컬럼에 JSON으로 저장
+    - 메모리 목록의 위치(index)와 행 id의 대응은 self._row_ids로 유지
+    """
+
+    # data_manager가 테넌트/태그/생성일 필터를 메모리 색인 대신 이 백엔드에 맡김
+    filters_in_storage = True
+
+    def __init__(self, data_dir, get_records, filename="gggis.sqlite3"):
+        super().__init__(data_dir, get_records)
+        os.makedirs(data_dir, exist_ok=True)
+        self.db_path = os.path.join(data_dir, filename)
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("PRAGMA foreign_keys=ON")
+        # SQLite lower()는 ASCII만 처리하므로 파이썬 str.lower와 동일하게 맞춤
+        self._conn.create_function("py_lower", 1, _py_lower, deterministic=True)
+        had_tags = self._has_table("node_tags")
+        self._conn.executescript(SCHEMA)
+        if not had_tags:
+            # 태그 조인 테이블이 없던 DB: 노드 원본에서 한 번 채움
+            self._backfill_tags()
+        self._row_ids = {"nodes": [], "ideas": []}
+        self._data_versions = {}
+
+    # ------------------------------------------------------------------
+    # 불러오기 / 저장
+    # ------------------------------------------------------------------
+    def load(self, name):
+        with self._lock:
+            if self._count(name) == 0:
+                self._import_legacy_json(name)
+
+            rows = self._conn.execute(
+                f"SELECT id, data FROM {name} ORDER BY id"
+            ).fetchall()
+            self._data_versions[name] = self._data_version()
+        self._row_ids[name] = [row_id for row_id, _ in rows]
+        return [json.loads(data) for _, data in rows]
+
+    def save(self, name):
+        # 메모리 목록 전체로 테이블을 다시 채움
+        records = self.get_records(name)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {name}")
+            self._row_ids[name] = [self._insert(name, r) for r in records]
+
+    def append(self, name, record):
+        with self._lock, self._conn:
+            self._row_ids[name].append(self._insert(name, record))
+
+    def update(self, name, index, fields, previous=None):
+        record = self.get_records(name)[index]
+        row_id = self._row_ids[name][index]
+        with self._lock, self._conn:
+            if name == "nodes":
+                self._conn.execute(
+                    "UPDATE nodes SET title = ?, tenant = ?, created_at = ?, data = ? "
+                    "WHERE id = ?",
+                    (
+                        record.get("title", ""),
+                        record.get("tenant", "미지정"),
+                        record.get("created_at"),
+                        _dumps(record),
+                        row_id,
+                    ),
+                )
+                self._conn.execute("DELETE FROM node_tags WHERE node_id = ?", (row_id,))
+                self._insert_tags(row_id, record)
+            else:
+                row = idea_list_row(record)
+                self._conn.execute(
+                    "UPDATE ideas SET title = ?, overview = ?, ai_name = ?, "
+                    "contest_title = ?, created_at = ?, data = ? WHERE id = ?",
+                    (
+                        row["title"],
+                        row["overview"],
+                        row["ai_name"],
+                        row["contest_title"],
+                        row["created_at"],
+                        _dumps(record),
+                        row_id,
+                    ),
+                )
+
+    def delete(self, name, index, record=None):
+        row_id = self._row_ids[name].pop(index)
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {name} WHERE id = ?", (row_id,))
+
+    def clear(self, name):
+        with self._lock, self._conn:
+            self._conn.execute(f"DELETE FROM {name}")
+        self._row_ids[name] = []
+
+    def changed_on_disk(self, name):
+        # 파일 stat 대신 PRAGMA data_version 사용: 다른 연결(프로세스)이 커밋했을
+        # 때만 값이 바뀌고 이 연결의 쓰기로는 바뀌지 않음 (WAL 파일 크기와도 무관)
+        with self._lock:
+            return self._data_versions.get(name) != self._data_version()
+
+    def _data_version(self):
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+    # ------------------------------------------------------------------
+    # 조회 (필터, 정렬, LIMIT/OFFSET을 SQL로 처리)
+    # ------------------------------------------------------------------
+    def query_nodes(
+        self,
+        search_text="",
+        selected_tenants=None,
+        selected_tags=None,
+        limit=None,
+        offset=0,
+        candidates=None,
+        created_from=None,
+        created_to=None,
+    ):
+        if candidates is not None:
+            # 전문 검색/태그 쿼리를 메모리 색인으로 이미 적용한 결과
+            return super().query_nodes(
+                search_text,
+                limit=limit,
+                offset=offset,
+                candidates=candidates,
+                created_from=created_from,
+                created_to=created_to,
+            )
+
+        where, params = [], []
+
+        if search_text:
+            where.append("instr(py_lower(title), ?) > 0")
+            params.append(search_text.lower())
+
+        if selected_tenants:
+            where.append(f"tenant IN ({_placeholders(selected_tenants)})")
+            params.extend(selected_tenants)
+
+        if selected_tags:
+            where.append(
+                "id IN (SELECT node_id FROM node_tags "
+                f"WHERE tag IN ({_placeholders(selected_tags)}))"
+            )
+            params.extend(selected_tags)
+
+        if created_from:
+            where.append("created_at >= ?")
+            params.append(created_from)
+        if created_to:
+            where.append("created_at <= ?")
+            params.append(created_to)
+
+        sql = "SELECT data FROM nodes"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY id" + _limit_clause(limit, offset, params)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [json.loads(data) for (data,) in rows]
+
+    def query_ideas(self, search_text="", limit=None, offset=0):
+        params = []
+        sql = (
+            "SELECT json_extract(data, '$.id'), created_at, contest_title, title, "
+            "overview, ai_name FROM ideas"
+        )
+        if search_text:
+            sql += (
+                " WHERE instr(py_lower(title), ?) > 0"
+                " OR instr(py_lower(contest_title), ?) > 0"
+            )
+            params.extend([search_text.lower()] * 2)
+        sql += " ORDER BY COALESCE(created_at, ?) DESC, id"
+        params.append(DEFAULT_CREATED_AT)
+        sql += _limit_clause(limit, offset, params)
+
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {
+                "id": idea_id,
+                "created_at": created_at,
+                "contest_title": contest_title,
+                "title": title,
+                "overview": overview,
+                "ai_name": ai_name,
+            }
+            for idea_id, created_at, contest_title, title, overview, ai_name in rows
+        ]
+
+    # ------------------------------------------------------------------
+    # 내부 도우미
+    # ------------------------------------------------------------------
+    def _has_table(self, table):
+        row = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)
+        ).fetchone()
+        return row is not None
+
+    def _backfill_tags(self):
+        rows = self._conn.execute("SELECT id, data FROM nodes").fetchall()
+        if not rows:
+            return
+        with self._conn:
+            for row_id, data in rows:
+                self._insert_tags(row_id, json.loads(data))
+        print(f"[INFO] 노드 {len(rows)}건의 태그 색인을 만들었습니다.")
+
+    def _count(self, name):
+        return self._conn.execute(f"SELECT COUNT(*) FROM {name}").fetchone()[0]
+
+    def _insert(self, name, record):
+        """레코드 1건 삽입 후 행 id 반환 (lock/트랜잭션은 호출자가 관리)"""
+        if name == "nodes":
+            cursor = self._conn.execute(
+                "INSERT INTO nodes (title, tenant, created_at, data) VALUES (?, ?, ?, ?)",
+                (
+                    record.get("title", ""),
+                    record.get("tenant", "미지정"),
+                    record.get("created_at"),
+                    _dumps(record),
+                ),
+            )
+            self._insert_tags(cursor.lastrowid, record)
+        else:
+            row = idea_list_row(record)
+            cursor = self._conn.execute(
+                "INSERT INTO ideas (title, overview, ai_name, contest_title, created_at, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (
+                    row["title"],
+                    row["overview"],
+                    row["ai_name"],
+                    row["contest_title"],
+                    row["created_at"],
+                    _dumps(record),
+                ),
+            )
+        return cursor.lastrowid
+
+    def _insert_tags(self, node_id, record):
+        tags = set(record.get("tags", []))
+        self._conn.executemany(
+            "INSERT INTO node_tags (node_id, tag) VALUES (?, ?)",
+            [(node_id, tag) for tag in tags],
+        )
+
+    def _import_legacy_json(self, name):
+        """빈 DB 최초 사용 시 기존 data/{name}_data.json 가져오기"""
+        legacy_path = os.path.join(self.data_dir, f"{name}_data.json")
+        if not os.path.exists(legacy_path):
+            return
+
+        count = 0
+        with self._conn:
+            for record in stream_json_array(legacy_path, self._quarantine_path(name)):
+                self._insert(name, record)
+                count += 1
+        print(f"[INFO] {legacy_path}에서 {count}건을 SQLite로 가져왔습니다.")
+
+
+def _py_lower(value):
+    return value.lower() if value is not None else None
+
+
+def _dumps(record):
+    return json.dumps(record, ensure_ascii=False)
+
+
+def _placeholders(values):
+    return ", ".join("?" for _ in values)
+
+
+def _limit_clause(limit, offset, params):
+    """LIMIT/OFFSET 절 생성 (파라미터는 params에 추가)"""
+    if limit is None and not offset:
+        return ""
+    params.extend([-1 if limit is None else limit, offset or 0])
+    return " LIMIT ? OFFSET ?"
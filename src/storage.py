@@ -0,0 +1,487 @@
+import os
+
+from src.binary_snapshot import read_snapshot, snapshot_path, write_snapshot
+from src.journal import Journal
+from src.json_stream import load_json_array
+from src.write_behind import WriteBehindFlusher, atomic_write_json
+
+# 아이디어 목록에서 created_at이 없는 레코드의 정렬 기준값
+DEFAULT_CREATED_AT = "1900-01-01 00:00:00"
+
+
+class StorageBackend:
+    """
+    저장소 백엔드 기본 클래스
+
+    get_records(name)은 data_manager가 들고 있는 현재 레코드 목록을 반환하며,
+    기본 구현은 변경마다 컬렉션 전체를 save()로 다시 씀
+    """
+
+    # True이면 data_manager가 테넌트/태그/생성일 노드 필터를 query_nodes에 맡김
+    # (저장소 자체 인덱스로 처리하는 백엔드)
+    filters_in_storage = False
+
+    def __init__(self, data_dir, get_records):
+        self.data_dir = data_dir
+        self.get_records = get_records
+        # 마지막으로 읽거나 쓴 시점의 파일 지문 (외부 변경 감지용)
+        self._fingerprints = {}
+
+    def load(self, name):
+        """컬렉션 전체를 리스트로 불러오기"""
+        raise NotImplementedError
+
+    def save(self, name):
+        """컬렉션 전체 저장"""
+        raise NotImplementedError
+
+    def data_files(self, name):
+        """컬렉션을 저장하는 파일 경로 목록 (None이면 변경 여부를 알 수 없음)"""
+        return None
+
+    def fingerprint(self, name):
+        """data_files의 (mtime_ns, size, inode) 목록, 없는 파일은 None"""
+        paths = self.data_files(name)
+        if paths is None:
+            return None
+        return tuple(_stat_key(path) for path in paths)
+
+    def remember_files(self, name):
+        """현재 파일 지문을 "마지막으로 읽거나 쓴 상태"로 기록"""
+        self._fingerprints[name] = self.fingerprint(name)
+
+    def changed_on_disk(self, name):
+        """마지막으로 읽거나 쓴 뒤 다른 곳에서 파일이 바뀌었는지 (모르면 True)"""
+        current = self.fingerprint(name)
+        return current is None or self._fingerprints.get(name) != current
+
+    def _quarantine_path(self, name):
+        """손상된 레코드를 격리해 두는 파일 경로"""
+        return os.path.join(self.data_dir, f"{name}_quarantine.jsonl")
+
+    def read(self, name, record):
+        """메모리 목록의 레코드로 전체 레코드 반환 (본문을 따로 두는 백엔드는 재정의)"""
+        return record
+
+    # 변경 훅: 메모리 목록은 이미 변경된 상태로 호출됨
+    # (update의 previous는 변경 전 사본, delete의 record는 삭제된 레코드)
+    def append(self, name, record):
+        self.save(name)
+
+    def update(self, name, index, fields, previous=None):
+        self.save(name)
+
+    def delete(self, name, index, record=None):
+        self.save(name)
+
+    def clear(self, name):
+        self.save(name)
+
+    def mark_changed(self, name, records):
+        """메모리 목록의 레코드 일부가 제자리에서 바뀌었음을 기록 (ID 부여 등)"""
+        self.save(name)
+
+    def replace_records(self, name, replacements):
+        """{index: record} 형태로 여러 레코드를 통째로 교체 후 한 번에 저장"""
+        records = self.get_records(name)
+        for index, record in replacements.items():
+            records[index] = record
+        self.save(name)
+
+    def has_unloaded(self, name, tenants=None):
+        """필터에 필요한 레코드 중 아직 메모리에 올라오지 않은 것이 있는지"""
+        return False
+
+    def load_more(self, name, tenants=None):
+        """has_unloaded()가 참일 때 추가로 불러올 레코드 목록"""
+        return []
+
+    def count(self, name):
+        """저장된 전체 레코드 수 (메모리에 올라오지 않은 것 포함)"""
+        return len(self.get_records(name))
+
+    def tenants(self):
+        """모든 노드의 테넌트 목록"""
+        all_tenants = set()
+        for node in self.get_records("nodes"):
+            tenant = node.get("tenant", "미지정")
+            if tenant:
+                all_tenants.add(tenant)
+        return sorted(all_tenants)
+
+    def tags(self):
+        """모든 노드의 태그 목록"""
+        all_tags = set()
+        for node in self.get_records("nodes"):
+            all_tags.update(node.get("tags", []))
+        return sorted(all_tags)
+
+    def tenant_counts(self):
+        """{테넌트: 노드 수}"""
+        counts = {}
+        for node in self.get_records("nodes"):
+            tenant = node.get("tenant", "미지정")
+            counts[tenant] = counts.get(tenant, 0) + 1
+        return counts
+
+    def tag_counts(self, tenants=None):
+        """{태그: 노드 수}, tenants가 있으면 그 테넌트의 노드만 셈"""
+        counts = {}
+        for node in self.get_records("nodes"):
+            if tenants and node.get("tenant", "미지정") not in tenants:
+                continue
+            for tag in set(node.get("tags", [])):
+                counts[tag] = counts.get(tag, 0) + 1
+        return counts
+
+    def query_nodes(
+        self,
+        search_text="",
+        selected_tenants=None,
+        selected_tags=None,
+        limit=None,
+        offset=0,
+        candidates=None,
+        created_from=None,
+        created_to=None,
+    ):
+        """
+        필터에 맞는 노드 목록 (저장 순서)
+
+        candidates는 역색인으로 테넌트/태그 필터를 미리 적용한 노드 목록 (저장 순서),
+        주어지면 그 안에서 검색어와 생성일만 확인
+        """
+        if candidates is not None:
+            matched = [
+                node
+                for node in candidates
+                if node_matches_filters(
+                    node, search_text, created_from=created_from, created_to=created_to
+                )
+            ]
+        else:
+            matched = [
+                node
+                for node in self.get_records("nodes")
+                if node_matches_filters(
+                    node,
+                    search_text,
+                    selected_tenants,
+                    selected_tags,
+                    created_from,
+                    created_to,
+                )
+            ]
+        return paginate(matched, limit, offset)
+
+    def query_ideas(self, search_text="", limit=None, offset=0):
+        """검색어에 맞는 아이디어 목록 행 (최신순)"""
+        sorted_ideas = sorted(
+            self.get_records("ideas"),
+            key=lambda x: x.get("created_at", DEFAULT_CREATED_AT),
+            reverse=True,
+        )
+        rows = []
+        for idea in sorted_ideas:
+            row = idea_list_row(idea)
+            if search_text and not idea_row_matches(row, search_text):
+                continue
+            rows.append(row)
+        return paginate(rows, limit, offset)
+
+    def flush(self):
+        """대기 중인 쓰기가 있으면 모두 기록될 때까지 대기"""
+
+    def close(self):
+        """열린 자원 정리"""
+
+
+class JsonBackend(StorageBackend):
+    """
+    data/{name}_data.json 파일 하나에 컬렉션 전체를 저장하는 기본 백엔드
+
+    - write_behind_delay > 0이면 저장은 표시만 하고 백그라운드에서 병합 기록
+      (records_lock은 data_manager의 store_lock, 기록할 내용은 그 읽기 잠금 안에서 복사)
+    - binary_snapshot이면 JSON 옆에 바이너리 스냅샷(.bin)도 기록하고,
+      불러올 때 JSON보다 새로우면 스냅샷을 우선 사용 (src/binary_snapshot.py)
+    """
+
+    def __init__(
+        self,
+        data_dir,
+        get_records,
+        write_behind_delay=0,
+        binary_snapshot=False,
+        records_lock=None,
+    ):
+        super().__init__(data_dir, get_records)
+        self.binary_snapshot = binary_snapshot
+        self._flusher = None
+        if write_behind_delay > 0:
+            self._flusher = WriteBehindFlusher(
+                self._snapshot, self._write_snapshot, write_behind_delay, records_lock
+            )
+
+    def _path(self, name):
+        return os.path.join(self.data_dir, f"{name}_data.json")
+
+    def data_files(self, name):
+        return [self._path(name)]
+
+    def load(self, name):
+        # 아직 기록되지 않은 변경이 있으면 먼저 반영해야 디스크와 어긋나지 않음
+        self.flush()
+        # 읽기 전에 기록해야 읽는 도중의 외부 변경을 다음 확인 때 놓치지 않음
+        self.remember_files(name)
+
+        path = self._path(name)
+        if self.binary_snapshot:
+            records = self._load_snapshot(path)
+            if records is not None:
+                return records
+
+        if not os.path.exists(path):
+            return []
+        # 레코드 단위로 읽으므로 손상된 레코드가 있어도 나머지는 살림
+        records = load_json_array(path, self._quarantine_path(name))
+
+        if self.binary_snapshot:
+            # 스냅샷이 없거나 오래된 경우: 다음 시작부터 스냅샷을 쓰도록 지금 기록
+            write_snapshot(snapshot_path(path), records)
+        return records
+
+    def save(self, name):
+        if self._flusher:
+            self._flusher.mark_dirty(name)
+        else:
+            self._write(name)
+
+    def flush(self):
+        if self._flusher:
+            self._flusher.flush()
+
+    def _write(self, name):
+        """즉시 기록 (데이터를 바꾸는 쪽이 잠금을 보유한 상태에서 호출)"""
+        self._write_snapshot(name, self._snapshot(name))
+
+    def _snapshot(self, name):
+        """기록할 내용의 얕은 복사본 (records_lock 안에서 호출)"""
+        return [dict(r) for r in self.get_records(name)]
+
+    def _write_snapshot(self, name, records):
+        path = self._path(name)
+        atomic_write_json(path, records, indent=2)
+        if self.binary_snapshot:
+            # JSON 다음에 기록하므로 중간에 죽으면 스냅샷이 더 오래되어 JSON을 사용
+            write_snapshot(snapshot_path(path), records)
+        self.remember_files(name)
+
+    def _load_snapshot(self, path):
+        """JSON보다 오래되지 않은 바이너리 스냅샷이 있으면 불러옴 (없으면 None)"""
+        bin_path = snapshot_path(path)
+        try:
+            bin_mtime = os.stat(bin_path).st_mtime_ns
+        except OSError:
+            return None
+        try:
+            if os.stat(path).st_mtime_ns > bin_mtime:
+                # JSON을 직접 고친 경우 등: JSON이 기준
+                return None
+        except OSError:
+            pass
+        return read_snapshot(bin_path)
+
+
+class JournalBackend(StorageBackend):
+    """변경 1건을 저널 한 줄로 추가하는 백엔드 (src/journal.py 참고)"""
+
+    def __init__(
+        self, data_dir, get_records, compact_threshold, background_compaction=True
+    ):
+        super().__init__(data_dir, get_records)
+        self.compact_threshold = compact_threshold
+        self.background_compaction = background_compaction
+        self._journals = {}
+
+    def journal(self, name):
+        """컬렉션별 저널 객체 반환 (최초 호출 시 생성)"""
+        if name not in self._journals:
+            self._journals[name] = Journal(
+                name,
+                self.data_dir,
+                lambda: self.get_records(name),
+                self.compact_threshold,
+                self.background_compaction,
+            )
+            # 자체 기록(추가/백그라운드 압축) 후에는 파일 지문을 갱신
+            self._journals[name].on_write = lambda: self.remember_files(name)
+        return self._journals[name]
+
+    def data_files(self, name):
+        journal = self.journal(name)
+        return [journal.snapshot_path, journal.log_path, journal.compacting_path]
+
+    def load(self, name):
+        records = self.journal(name).load()
+        self.remember_files(name)
+        return records
+
+    def save(self, name):
+        # 전체 저장 요청은 스냅샷 압축으로 처리
+        journal = self.journal(name)
+        journal.compact_now()
+
+    def append(self, name, record):
+        self.journal(name).append("append", record=record)
+
+    def update(self, name, index, fields, previous=None):
+        record = previous or self.get_records(name)[index]
+        self.journal(name).append("update", **_target(index, record), fields=fields)
+
+    def delete(self, name, index, record=None):
+        self.journal(name).append("delete", **_target(index, record))
+
+    def clear(self, name):
+        self.journal(name).append("clear")
+
+    def flush(self):
+        for journal in self._journals.values():
+            journal.wait_for_compaction()
+
+
+def _target(index, record):
+    """저널의 수정/삭제 대상 (재생 시 위치가 어긋나도 같은 레코드를 찾도록 ID도 기록)"""
+    record_id = (record or {}).get("id")
+    return {"index": index} if record_id is None else {"index": index, "id": record_id}
+
+
+def create_backend(
+    mode,
+    data_dir,
+    get_records,
+    journal_compact_bytes=0,
+    write_behind_delay=0,
+    binary_snapshot=False,
+    idea_hot_days=0,
+    cold_codec="lzma",
+    records_lock=None,
+    journal_background_compaction=True,
+):
+    """
+    저장 방식 이름으로 백엔드 생성
+
+    records_lock은 get_records 목록을 보호하는 RWLock (백그라운드 기록이 복사할 때 사용)
+    journal_background_compaction이 거짓이면 저널 압축을 변경한 스레드에서 바로 처리
+    """
+    if mode == "json":
+        return JsonBackend(
+            data_dir, get_records, write_behind_delay, binary_snapshot, records_lock
+        )
+    if mode == "journal":
+        return JournalBackend(
+            data_dir, get_records, journal_compact_bytes, journal_background_compaction
+        )
+    if mode == "sqlite":
+        from src.sqlite_backend import SqliteBackend
+
+        return SqliteBackend(data_dir, get_records)
+    if mode == "sharded":
+        from src.sharded_backend import ShardedBackend
+
+        return ShardedBackend(
+            data_dir, get_records, write_behind_delay, binary_snapshot, records_lock
+        )
+    if mode == "archive":
+        from src.idea_archive import ArchiveBackend
+
+        return ArchiveBackend(
+            data_dir,
+            get_records,
+            write_behind_delay,
+            binary_snapshot,
+            idea_hot_days,
+            cold_codec,
+            records_lock,
+        )
+    raise ValueError(f"알 수 없는 저장 방식입니다: {mode}")
+
+
+def node_matches_filters(
+    node,
+    search_text="",
+    selected_tenants=None,
+    selected_tags=None,
+    created_from=None,
+    created_to=None,
+):
+    """노드가 검색어/테넌트/태그/생성일 필터를 모두 만족하는지 확인"""
+    # 텍스트 검색 필터 (노드 이름에서 검색)
+    if search_text and search_text.lower() not in node["title"].lower():
+        return False
+
+    # 테넌트 필터
+    if selected_tenants and node.get("tenant", "미지정") not in selected_tenants:
+        return False
+
+    # 태그 필터 (선택된 태그 중 하나라도 포함되어야 함)
+    if selected_tags:
+        node_tags = node.get("tags", [])
+        if not any(tag in node_tags for tag in selected_tags):
+            return False
+
+    # 생성일 필터 ("%Y-%m-%d %H:%M:%S" 문자열 비교, 양 끝 포함)
+    if created_from or created_to:
+        created_at = node.get("created_at")
+        if created_at is None:
+            return False
+        if created_from and created_at < created_from:
+            return False
+        if created_to and created_at > created_to:
+            return False
+
+    return True
+
+
+def idea_list_row(idea):
+    """아이디어 목록 화면에 필요한 컬럼만 추출"""
+    # 공모전 제목 추출 (contest_info 딕셔너리에서)
+    contest_title = "N/A"
+    if idea.get("contest_info") and isinstance(idea.get("contest_info"), dict):
+        contest_title = idea.get("contest_info", {}).get("title", "N/A")
+
+    return {
+        "id": idea.get("id"),
+        # created_at은 정렬 기준으로도 쓰이므로 기본값 없이 보관
+        "created_at": idea.get("created_at"),
+        "contest_title": contest_title,
+        "title": idea.get("title", "제목 없음"),
+        "overview": idea.get("overview", "개요 없음"),
+        "ai_name": idea.get("ai_name", "Unknown"),
+    }
+
+
+def idea_row_matches(row, search_text):
+    """공모전 제목 또는 아이디어 제목에 검색어가 포함되는지 확인"""
+    search_lower = search_text.lower()
+    return (
+        search_lower in row["title"].lower()
+        or search_lower in row["contest_title"].lower()
+    )
+
+
+def paginate(items, limit, offset):
+    """offset/limit 적용"""
+    if offset:
+        items = items[offset:]
+    if limit is not None:
+        items = items[:limit]
+    return items
+
+
+def _stat_key(path):
+    """파일 지문 (mtime_ns, size, inode), 파일이 없으면 None"""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size, st.st_ino)
@@ -0,0 +1,278 @@
+from functools import lru_cache
+
+# 노드 검색창에서 쓰는 태그 쿼리
+#
+#   (AI OR 데이터) AND NOT 하드웨어 AND tenant:국민대
+#
+# - 단어는 태그 이름 (대소문자 무시), tenant:/title:로 테넌트와 노드 이름 조건 지정
+#   (한글 접두어 테넌트:/태그:/제목:도 사용 가능)
+# - 연산자 우선순위: NOT > AND > OR, 괄호로 묶기, &/|/!는 AND/OR/NOT과 같음
+# - 나란히 쓴 두 조건은 AND로 취급, 공백이 있는 이름은 "따옴표"로 묶음
+# - 단어 안에 붙은 기호는 이름의 일부 (R&D, 설명!), &/|/!는 단어 앞이나 띄어 쓸 때만 연산자
+# - 연산자/괄호/접두어가 하나도 없거나 쿼리로 해석되지 않는 검색어(닫히지 않은 괄호/따옴표
+#   등)는 전문 검색(src.node_search)으로 처리
+
+OPERATORS = {"AND": "and", "&": "and", "OR": "or", "|": "or", "NOT": "not", "!": "not"}
+FIELDS = {
+    "tag": "tag",
+    "태그": "tag",
+    "tenant": "tenant",
+    "테넌트": "tenant",
+    "title": "title",
+    "제목": "title",
+}
+_SYMBOLS = "()&|!"
+
+
+class TagQueryError(ValueError):
+    """태그 쿼리 문법 오류"""
+
+
+class TagQuery:
+    """
+    컴파일된 태그 쿼리
+
+    evaluate(index)는 NodeFacetIndex의 노드 위치별 비트맵(정수)을 받아
+    AND/OR/NOT을 정수 비트 연산(&, |, 전체 & ~x)으로 계산한 결과 비트맵 반환
+    """
+
+    def __init__(self, tree):
+        self.tree = tree
+        self.text = format_tree(tree)
+        self._evaluate = _compile(tree)
+
+    def evaluate(self, index):
+        return self._evaluate(index)
+
+    def __repr__(self):
+        return f"TagQuery({self.text!r})"
+
+
+def is_tag_query(text):
+    """
+    검색어가 태그 쿼리인지
+
+    연산자/괄호/필드 접두어가 있고 쿼리로 문법 오류 없이 해석될 때만 쿼리이고,
+    그 밖에는 일반 검색어 (전문 검색으로 처리)
+    """
+    if not text or not text.strip():
+        return False
+    try:
+        tokens = _tokenize(text)
+        if all(kind == "term" and field is None for kind, field, _ in tokens):
+            return False
+        compile_query(text.strip())
+    except TagQueryError:
+        return False
+    return True
+
+
+@lru_cache(maxsize=256)
+def compile_query(text):
+    """쿼리 문자열을 TagQuery로 컴파일 (문법 오류는 TagQueryError)"""
+    parser = _Parser(_tokenize(text))
+    tree = parser.parse()
+    return TagQuery(tree)
+
+
+def format_tree(tree):
+    """구문 트리를 정규화된 쿼리 문자열로 변환 (used_filters 기록용)"""
+    kind = tree[0]
+    if kind == "term":
+        field, value = tree[1], tree[2]
+        value = _quote(value)
+        return value if field == "tag" else f"{field}:{value}"
+    if kind == "not":
+        return "NOT " + _format_operand(tree[1], "not")
+    operator = " AND " if kind == "and" else " OR "
+    return operator.join(_format_operand(child, kind) for child in tree[1:])
+
+
+def _format_operand(tree, parent):
+    text = format_tree(tree)
+    # 우선순위가 낮은 연산이 안쪽에 있으면 괄호로 감쌈
+    precedence = {"or": 0, "and": 1, "not": 2, "term": 3}
+    if precedence[tree[0]] < precedence[parent] or (
+        parent == "not" and tree[0] != "term"
+    ):
+        return f"({text})"
+    return text
+
+
+def _quote(value):
+    if any(c.isspace() or c in _SYMBOLS + '":' for c in value) or value in OPERATORS:
+        return '"' + value.replace('"', "") + '"'
+    return value
+
+
+# ----------------------------------------------------------------------
+# 토큰화 / 파싱
+# ----------------------------------------------------------------------
+def _tokenize(text):
+    """(종류, 필드, 값) 토큰 목록, 종류는 "(", ")", "and", "or", "not", "term" """
+    tokens = []
+    i, n = 0, len(text)
+    while i < n:
+        c = text[i]
+        if c.isspace():
+            i += 1
+            continue
+        if c in "()":
+            tokens.append((c, None, c))
+            i += 1
+            continue
+        if c in OPERATORS:
+            tokens.append((OPERATORS[c], None, c))
+            i += 1
+            continue
+
+        field = None
+        if c != '"':
+            word, i = _read_word(text, i)
+            prefix, colon, rest = word.partition(":")
+            if colon and prefix.lower() in FIELDS:
+                field = FIELDS[prefix.lower()]
+                if rest:
+                    tokens.append(("term", field, rest))
+                    continue
+                if i < n and text[i] == '"':
+                    value, i = _read_quoted(text, i)
+                    tokens.append(("term", field, value))
+                    continue
+                raise TagQueryError(f"'{prefix}:' 뒤에 값이 없습니다.")
+            if word in OPERATORS:
+                tokens.append((OPERATORS[word], None, word))
+            else:
+                tokens.append(("term", None, word))
+            continue
+
+        value, i = _read_quoted(text, i)
+        tokens.append(("term", None, value))
+    return tokens
+
+
+def _read_word(text, i):
+    """
+    공백/괄호/따옴표 전까지의 단어
+
+    단어 뒤에 붙은 !와, 앞뒤가 모두 글자인 &/|는 단어의 일부 (R&D, 설명!)
+    """
+    start = i
+    n = len(text)
+    while i < n:
+        c = text[i]
+        if c.isspace() or c in '()"':
+            break
+        if c in "&|" and (
+            i + 1 >= n or text[i + 1].isspace() or text[i + 1] in _SYMBOLS + '"'
+        ):
+            break
+        i += 1
+    return text[start:i], i
+
+
+def _read_quoted(text, i):
+    end = text.find('"', i + 1)
+    if end == -1:
+        raise TagQueryError("따옴표가 닫히지 않았습니다.")
+    return text[i + 1 : end], end + 1
+
+
+class _Parser:
+    """
+    재귀 하강 파서
+
+        or_expr  := and_expr (OR and_expr)*
+        and_expr := not_expr ([AND] not_expr)*
+        not_expr := NOT not_expr | "(" or_expr ")" | term
+    """
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+        self.pos = 0
+
+    def parse(self):
+        if not self.tokens:
+            raise TagQueryError("쿼리가 비어 있습니다.")
+        tree = self._or_expr()
+        if self.pos < len(self.tokens):
+            raise TagQueryError(f"'{self.tokens[self.pos][2]}' 앞에 연산자가 없습니다.")
+        return tree
+
+    def _peek(self):
+        return self.tokens[self.pos][0] if self.pos < len(self.tokens) else None
+
+    def _or_expr(self):
+        children = [self._and_expr()]
+        while self._peek() == "or":
+            self.pos += 1
+            children.append(self._and_expr())
+        return children[0] if len(children) == 1 else ("or", *children)
+
+    def _and_expr(self):
+        children = [self._not_expr()]
+        while self._peek() in ("and", "not", "(", "term"):
+            if self._peek() == "and":
+                self.pos += 1
+            children.append(self._not_expr())
+        return children[0] if len(children) == 1 else ("and", *children)
+
+    def _not_expr(self):
+        kind = self._peek()
+        if kind is None:
+            raise TagQueryError("쿼리가 연산자로 끝났습니다.")
+        token = self.tokens[self.pos]
+        self.pos += 1
+        if kind == "not":
+            return ("not", self._not_expr())
+        if kind == "(":
+            tree = self._or_expr()
+            if self._peek() != ")":
+                raise TagQueryError("괄호가 닫히지 않았습니다.")
+            self.pos += 1
+            return tree
+        if kind == "term":
+            _, field, value = token
+            if not value:
+                raise TagQueryError("빈 이름은 사용할 수 없습니다.")
+            return ("term", field or "tag", value)
+        raise TagQueryError(f"'{token[2]}' 위치가 올바르지 않습니다.")
+
+
+# ----------------------------------------------------------------------
+# 컴파일: 구문 트리 → 비트맵 연산 클로저
+# ----------------------------------------------------------------------
+def _compile(tree):
+    kind = tree[0]
+    if kind == "term":
+        field, value = tree[1], tree[2]
+        if field == "tag":
+            return lambda index: index.tag_bits(value)
+        if field == "tenant":
+            return lambda index: index.tenant_bits(value)
+        return lambda index: index.title_bits(value)
+
+    if kind == "not":
+        operand = _compile(tree[1])
+        return lambda index: index.all_bits & ~operand(index)
+
+    children = [_compile(child) for child in tree[1:]]
+    if kind == "and":
+
+        def evaluate_and(index):
+            bits = children[0](index)
+            for child in children[1:]:
+                if not bits:
+                    break
+                bits &= child(index)
+            return bits
+
+        return evaluate_and
+
+    def evaluate_or(index):
+        bits = 0
+        for child in children:
+            bits |= child(index)
+        return bits
+
+    return evaluate_or
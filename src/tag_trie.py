@@ -0,0 +1,314 @@
+import heapq
+import unicodedata
+
+from src.chosung import SYLLABLE_FIRST, SYLLABLE_LAST, chosung
+
+# 입력 길이별 허용 편집 거리 (짧은 입력에서 오타를 허용하면 관계없는 태그가 너무 많이 나옴)
+#   1~2글자: 0 (접두어 일치만), 3~5글자: 1, 6글자 이상: 2
+MAX_DISTANCE_STEPS = ((6, 2), (3, 1))
+# 오타를 허용하지 않는 앞 글자 수 (첫 글자 오타는 드물고, 허용하면 탐색할 트라이 노드가
+# 첫 글자 종류 수만큼 늘어남)
+NON_FUZZY_PREFIX = 1
+SUGGEST_LIMIT = 8
+
+_JONGSEONG_COUNT = 28
+
+
+def normalize(text):
+    """NFC 정규화 + 대소문자 통일 + 공백 정리 (NFKC는 입력 중인 호환 자모를 바꾸므로 사용하지 않음)"""
+    return " ".join(unicodedata.normalize("NFC", text).casefold().split())
+
+
+def max_distance_for(text):
+    """입력 길이에 따른 허용 편집 거리"""
+    for length, distance in MAX_DISTANCE_STEPS:
+        if len(text) >= length:
+            return distance
+    return 0
+
+
+class _Node:
+    __slots__ = ("children", "count", "best", "spellings")
+
+    def __init__(self):
+        self.children = None  # 글자 → _Node (자식이 없으면 None)
+        self.count = 0  # 이 노드에서 끝나는 태그를 사용한 노드 수
+        self.best = 0  # 하위 트리 전체에서 가장 큰 count (상위 k개 탐색의 가지치기용)
+        self.spellings = None  # 원래 표기 → 사용 수 ("Python"/"python"은 같은 키)
+
+
+class TagTrie:
+    """
+    태그 사전 (정규화한 태그의 문자 트라이 + 태그별 사용 노드 수)
+
+    - 노드의 태그가 바뀔 때 해당 태그의 수만 올리고 내림 (전체 재구성은 불러오기 때만)
+    - 트라이 노드마다 하위 트리의 최대 사용 수(best)를 두어 접두어 아래의 인기 태그
+      상위 k개를 우선순위 큐로 바로 꺼냄 (하위 트리 전체를 훑지 않음)
+    - 오타 허용 검색은 첫 글자가 같은 가지에서 트라이를 따라 내려가며 편집 거리 DP 행을
+      한 줄씩 계산하고, 행의 최솟값이 허용 거리를 넘으면 그 아래는 보지 않음
+    - 입력의 마지막 글자는 한글 입력 중일 수 있으므로 "ㅆ"/"써"가 "썬"과 같은 글자로 취급
+    """
+
+    def __init__(self):
+        self.rebuild([])
+
+    def rebuild(self, tag_lists):
+        """노드별 태그 목록으로 전체 다시 만들기"""
+        self._root = _Node()
+        self._size = 0
+        for tags in tag_lists:
+            self.add(tags)
+
+    def __len__(self):
+        """서로 다른 (정규화한) 태그 수"""
+        return self._size
+
+    def add(self, tags):
+        """노드 하나의 태그 추가 (태그마다 사용 수 1 증가, 같은 키의 태그는 한 번만)"""
+        for tag in _unique(tags):
+            self._adjust(tag, 1)
+
+    def remove(self, tags):
+        for tag in _unique(tags):
+            self._adjust(tag, -1)
+
+    def add_count(self, tag, count):
+        """태그 하나의 사용 수를 count만큼 증가 (노드 없이 태그별 수만 아는 경우)"""
+        if count > 0:
+            self._adjust(tag, count)
+
+    def _adjust(self, tag, delta):
+        key = normalize(tag)
+        if not key:
+            return
+        path = [self._root]
+        node = self._root
+        for char in key:
+            if node.children is None:
+                if delta < 0:
+                    return
+                node.children = {}
+            child = node.children.get(char)
+            if child is None:
+                if delta < 0:
+                    return
+                child = node.children[char] = _Node()
+            path.append(child)
+            node = child
+
+        if delta < 0 and not node.spellings:
+            return
+        spellings = node.spellings or {}
+        used = spellings.get(tag, 0) + delta
+        if used > 0:
+            spellings[tag] = used
+        elif tag in spellings:
+            del spellings[tag]
+        else:
+            return
+        if not node.count:
+            self._size += 1
+        node.count += delta
+        node.spellings = spellings or None
+        if not node.count:
+            self._size -= 1
+
+        if delta > 0:
+            for step in reversed(path):
+                if step.best >= node.count:
+                    break
+                step.best = node.count
+            return
+        # 사용 수가 줄면 아래에서부터 best를 다시 계산하고, 빈 가지는 잘라냄
+        for depth in range(len(key), -1, -1):
+            step = path[depth]
+            best = step.count
+            if step.children:
+                best = max(best, max(child.best for child in step.children.values()))
+            if depth and not best:
+                parent = path[depth - 1]
+                del parent.children[key[depth - 1]]
+                if not parent.children:
+                    parent.children = None
+            if step.best == best:
+                break
+            step.best = best
+
+    def _find(self, key):
+        node = self._root
+        for char in key:
+            if node.children is None or char not in node.children:
+                return None
+            node = node.children[char]
+        return node
+
+    def count(self, tag):
+        """태그(대소문자/공백 무시)를 사용한 노드 수"""
+        node = self._find(normalize(tag))
+        return node.count if node is not None else 0
+
+    def canonical(self, tag):
+        """같은 키로 가장 많이 쓰인 기존 표기 (없으면 None), 예: "python" → "Python" """
+        node = self._find(normalize(tag))
+        if node is None or not node.spellings:
+            return None
+        return _spelling(node)
+
+    def suggest(self, text, limit=SUGGEST_LIMIT, max_distance=None):
+        """
+        입력으로 시작하는(오타 허용) 태그 추천 [(태그, 사용 수, 편집 거리)]
+
+        편집 거리 오름차순, 같은 거리는 사용 수 내림차순
+        max_distance가 None이면 입력 길이에 따라 정함 (max_distance_for)
+        """
+        key = normalize(text)
+        if not key or limit <= 0:
+            return []
+        if max_distance is None:
+            max_distance = max_distance_for(key)
+        # 거리가 가까운 추천이 항상 앞이므로 허용 거리를 0부터 늘려 가며 limit개가 차면 중단
+        # (먼 거리 탐색은 방문할 트라이 노드가 훨씬 많음)
+        for distance in range(max_distance + 1):
+            results = self._top(self._prefix_matches(key, distance), limit)
+            if len(results) >= limit:
+                break
+        return results
+
+    def _prefix_matches(self, key, max_distance):
+        """
+        경로가 입력과 편집 거리 max_distance 이내로 맞는 트라이 노드 [(거리, 노드)]
+        (노드의 하위 트리 전체가 그 거리의 추천 후보)
+        """
+        if not max_distance:
+            node = self._find_composing(key)
+            return [(0, node)] if node is not None else []
+
+        start = self._find(key[:NON_FUZZY_PREFIX])
+        key = key[NON_FUZZY_PREFIX:]
+        if start is None or not key:
+            return []
+        size = len(key)
+        # max_distance를 넘는 값은 모두 cap으로 두고, 깊이 ± max_distance 범위의 칸만 계산
+        cap = max_distance + 1
+        first = [i if i <= max_distance else cap for i in range(size + 1)]
+        matches = []
+        stack = [(start, 0, first, cap)]
+        while stack:
+            node, depth, row, found = stack.pop()
+            if not node.children:
+                continue
+            depth += 1
+            low = max(1, depth - max_distance)
+            high = min(size, depth + max_distance)
+            for char, child in node.children.items():
+                current = [cap] * (size + 1)
+                if depth <= max_distance:
+                    current[0] = depth
+                left = current[low - 1]
+                lowest = left
+                for i in range(low, high + 1):
+                    if key[i - 1] == char or (
+                        i == size and _composing_match(key[-1], char)
+                    ):
+                        value = row[i - 1]
+                    else:
+                        value = row[i - 1] + 1
+                    if row[i] + 1 < value:
+                        value = row[i] + 1
+                    if left + 1 < value:
+                        value = left + 1
+                    if value > cap:
+                        value = cap
+                    current[i] = left = value
+                    if value < lowest:
+                        lowest = value
+                child_found = found
+                if current[size] < found:
+                    # 위쪽에서 이미 더 가까운 거리로 찾은 하위 트리면 기록하지 않음
+                    matches.append((current[size], child))
+                    child_found = current[size]
+                # 아래로 내려가도 찾은 거리보다 줄어들 수 없으면 중단
+                if lowest < child_found:
+                    stack.append((child, depth, current, child_found))
+        return matches
+
+    def _find_composing(self, key):
+        """입력과 접두어가 일치하는 노드 (마지막 글자는 입력 중인 글자와 맞는 글자 모두)"""
+        parent = self._find(key[:-1])
+        if parent is None or not parent.children:
+            return None
+        nodes = [
+            child
+            for char, child in parent.children.items()
+            if _composing_match(key[-1], char)
+        ]
+        if not nodes:
+            return None
+        if len(nodes) == 1:
+            return nodes[0]
+        # 여러 글자가 맞으면 부모 아래에서 해당 글자들만 자식으로 둔 가상 노드
+        merged = _Node()
+        merged.children = {
+            char: child
+            for char, child in parent.children.items()
+            if _composing_match(key[-1], char)
+        }
+        merged.best = max(child.best for child in nodes)
+        return merged
+
+    def _top(self, matches, limit):
+        """후보 하위 트리들에서 (거리, 사용 수) 순 상위 limit개 태그"""
+        heap = []
+        order = 0
+        for distance, node in matches:
+            heapq.heappush(heap, (distance, -node.best, order, node, False))
+            order += 1
+        results = []
+        seen = set()
+        while heap and len(results) < limit:
+            distance, _, _, node, is_tag = heapq.heappop(heap)
+            if is_tag:
+                # 거리가 가까운 후보에서 먼저 나오므로 이후 같은 태그는 건너뜀
+                if id(node) not in seen:
+                    seen.add(id(node))
+                    results.append((_spelling(node), node.count, distance))
+                continue
+            if node.count:
+                heapq.heappush(heap, (distance, -node.count, order, node, True))
+                order += 1
+            for child in (node.children or {}).values():
+                heapq.heappush(heap, (distance, -child.best, order, child, False))
+                order += 1
+        return results
+
+
+def _unique(tags):
+    # 한 노드에 "AI"와 "ai"가 함께 있어도 사용 수는 1 (처음 나온 표기 기준)
+    unique = {}
+    for tag in tags:
+        unique.setdefault(normalize(tag), tag)
+    return unique.values()
+
+
+def _spelling(node):
+    # 가장 많이 쓰인 표기, 같으면 가나다순으로 앞선 표기
+    return min(node.spellings.items(), key=lambda item: (-item[1], item[0]))[0]
+
+
+def _composing_match(typed, char):
+    """
+    입력 중인 마지막 글자가 트라이 글자와 맞는지
+    (초성만 입력: "ㅆ" ≈ "썬", 받침 전: "써" ≈ "썬")
+    """
+    if typed == char:
+        return True
+    if not SYLLABLE_FIRST <= ord(char) <= SYLLABLE_LAST:
+        return False
+    code = ord(typed)
+    if SYLLABLE_FIRST <= code <= SYLLABLE_LAST:
+        if (code - SYLLABLE_FIRST) % _JONGSEONG_COUNT:
+            return False
+        return (code - SYLLABLE_FIRST) // _JONGSEONG_COUNT == (
+            ord(char) - SYLLABLE_FIRST
+        ) // _JONGSEONG_COUNT
+    return chosung(char) == typed
@@ -1,17 +1,19 @@
 import gradio as gr
 import src.data_manager as dm
+from src.event_coalescer import filters
 from src.idea_functions import (
     get_ideas_dataframe,
-    get_idea_details_by_index,
+    get_idea_details_by_id,
     refresh_ideas,
     delete_idea,
 )
 from src.node_functions import (
     get_nodes_dataframe,
-    get_node_details_by_index,
+    get_node_details_by_id,
     update_node,
     delete_node,
     refresh_nodes,
+    filter_nodes_multi,
 )
 
 
@@ -37,10 +39,43 @@ def refresh_and_reset():
     )
 
 
-def filter_ideas(search_text):
-    """아이디어 검색 (공모전 제목 또는 아이디어 제목에서 검색)"""
-    df = get_ideas_dataframe(search_text)
-    return gr.update(value=df)
+def filter_ideas(search_text, request: gr.Request = None):
+    """아이디어 검색 (제목/공모전 제목/개요/본문 섹션 전문 검색 또는 초성 검색)"""
+    # 타이핑 중 연달아 오는 변경은 마지막 검색어만 계산
+    return filters.run(
+        (_session(request), "ideas"),
+        lambda: gr.update(value=get_ideas_dataframe(search_text)),
+        gr.skip(),
+    )
+
+
+def filter_view_nodes(
+    search_text, selected_tenants, selected_tags, request: gr.Request = None
+):
+    """내 노드 확인하기 탭의 필터 변경 (검색어/테넌트/태그 변경을 합쳐 한 번만 필터링)"""
+    return _filter_nodes("view", search_text, selected_tenants, selected_tags, request)
+
+
+def filter_idea_nodes(
+    search_text, selected_tenants, selected_tags, request: gr.Request = None
+):
+    """AI 아이디어 생성 탭의 노드 필터 변경 (내 노드 확인하기 탭과 별도 묶음)"""
+    return _filter_nodes("idea", search_text, selected_tenants, selected_tags, request)
+
+
+def _filter_nodes(group, search_text, selected_tenants, selected_tags, request):
+    # 탭 초기화로 세 필터가 한꺼번에 바뀌거나 검색어를 타이핑하면 변경 이벤트가 몰려 옴
+    # → 묶음 안에서는 마지막 값으로 한 번만 필터링하고 나머지는 화면을 그대로 둠
+    return filters.run(
+        (_session(request), group),
+        lambda: filter_nodes_multi(search_text, selected_tenants, selected_tags),
+        (gr.skip(), gr.skip(), gr.skip()),
+    )
+
+
+def _session(request):
+    # 브라우저 세션마다 따로 묶음 (직접 호출해 request가 없으면 하나의 묶음)
+    return getattr(request, "session_hash", None)
 
 
 def refresh_and_clear_status():
@@ -58,7 +93,7 @@ def refresh_and_clear_status():
         "",  # 노드 테넌트 초기화
         "",  # 노드 태그 초기화
         "",  # 노드 생성일시 초기화
-        -1,  # 노드 인덱스 초기화
+        "",  # 노드 ID 초기화
         gr.update(visible=False),  # 편집 버튼 숨기기
         gr.update(visible=False),  # 삭제 버튼 숨기기
         gr.update(visible=False, value=""),  # 액션 상태 숨기기
@@ -77,14 +112,36 @@ def refresh_idea_nodes():
     )
 
 
-def handle_idea_selection(evt: gr.SelectData):
+def _selected_record_id(rows, evt, columns):
+    """
+    표에서 선택한 행을 레코드 ID로 변환
+
+    rows는 화면과 같은 조건으로 다시 조회한 목록, columns는 선택한 행 값과 비교할
+    (열 위치, 키) 목록 (표가 조회 조건보다 오래된 경우 값이 같은 행을 다시 찾음)
+    """
+    display_index = evt.index[0]  # 화면에 표시된 인덱스
+    row_value = getattr(evt, "row_value", None)
+
+    def matches(row):
+        return all(str(row.get(key)) == str(row_value[pos]) for pos, key in columns)
+
+    if 0 <= display_index < len(rows):
+        if not row_value or matches(rows[display_index]):
+            return rows[display_index]["id"]
+    if row_value:
+        for row in rows:
+            if matches(row):
+                return row["id"]
+    return None
+
+
+def handle_idea_selection(search_text, evt: gr.SelectData):
     """아이디어 선택 이벤트 처리"""
 
     if evt.index is not None and len(evt.index) >= 1:
-        display_index = evt.index[0]  # 화면에 표시된 인덱스
-
-        # 정렬된 배열에서 원본 인덱스 찾기
-        if not dm.ideas_data:
+        # 화면과 같은 검색 조건/정렬(최신순)로 다시 조회해 선택한 행의 ID 확인
+        rows = dm.query_ideas(search_text)
+        if not rows:
             return (
                 "아이디어가 없습니다.",
                 "",
@@ -96,19 +153,13 @@ def handle_idea_selection(evt: gr.SelectData):
                 "",  # 사용된 노드
                 "",  # 사용된 필터
                 "",  # 근거
-                -1,
+                "",
                 gr.update(visible=False),
                 gr.update(visible=False, value=""),
             )
 
-        # 생성일시 기준으로 정렬된 아이디어 목록 생성
-        sorted_ideas = sorted(
-            dm.ideas_data,
-            key=lambda x: x.get("created_at", "1900-01-01 00:00:00"),
-            reverse=True,
-        )
-
-        if display_index >= len(sorted_ideas):
+        idea_id = _selected_record_id(rows, evt, [(1, "contest_title"), (2, "title")])
+        if idea_id is None:
             return (
                 "선택된 아이디어를 찾을 수 없습니다.",
                 "",
@@ -120,16 +171,12 @@ def handle_idea_selection(evt: gr.SelectData):
                 "",  # 사용된 노드
                 "",  # 사용된 필터
                 "",  # 근거
-                -1,
+                "",
                 gr.update(visible=False),
                 gr.update(visible=False, value=""),
             )
 
-        # 선택된 아이디어의 원본 인덱스 찾기
-        selected_idea = sorted_ideas[display_index]
-        original_index = dm.ideas_data.index(selected_idea)
-
-        idea_details = get_idea_details_by_index(original_index)
+        idea_details = get_idea_details_by_id(idea_id)
         # 아이디어 선택시 삭제 버튼 표시
         # idea_details는 (title, contest_details, problem, solution, implementation, expected_effect, created_at, nodes_info, filters_info, rationale) 순서
         return (
@@ -143,7 +190,7 @@ def handle_idea_selection(evt: gr.SelectData):
             idea_details[7],  # nodes_info -> used_nodes_display
             idea_details[8],  # filters_info -> used_filters_display
             idea_details[9],  # rationale -> rationale_display
-            original_index,  # selected_idea_index
+            idea_id,  # selected_idea_id
             gr.update(visible=True),  # delete_idea_btn
             gr.update(visible=False, value=""),  # delete_status
         )
@@ -159,15 +206,15 @@ def handle_idea_selection(evt: gr.SelectData):
         "",  # 사용된 노드
         "",  # 사용된 필터
         "",  # 근거
-        -1,
+        "",
         gr.update(visible=False),
         gr.update(visible=False, value=""),
     )
 
 
-def handle_delete_idea(selected_index):
+def handle_delete_idea(selected_id):
     """아이디어 삭제 이벤트 처리"""
-    if selected_index < 0:
+    if not selected_id:
         return (
             gr.update(visible=True, value="❌ 삭제할 아이디어를 선택해주세요."),
             get_ideas_dataframe(),
@@ -185,7 +232,7 @@ def handle_delete_idea(selected_index):
         )
 
     try:
-        result_message, updated_df = delete_idea(selected_index)
+        result_message, updated_df = delete_idea(selected_id)
         return (
             gr.update(visible=True, value=f"✅ {result_message}"),
             updated_df,
@@ -219,51 +266,42 @@ def handle_delete_idea(selected_index):
         )
 
 
-def handle_node_selection(evt: gr.SelectData):
+def handle_node_selection(
+    search_text, selected_tenants, selected_tags, evt: gr.SelectData
+):
     """노드 선택 이벤트 처리"""
 
     if evt.index is not None and len(evt.index) >= 1:
-        display_index = evt.index[0]  # 화면에 표시된 인덱스
-
-        # 정렬된 배열에서 원본 인덱스 찾기
-        if not dm.nodes_data:
+        # 화면과 같은 필터 조건으로 다시 조회해 선택한 행의 ID 확인
+        rows = dm.query_nodes(search_text, selected_tenants, selected_tags)
+        if not rows:
             return (
                 "노드를 선택해주세요.",
                 "",
                 "",
                 "",
                 "",
-                -1,
+                "",
                 gr.update(visible=False),
                 gr.update(visible=False),
                 gr.update(visible=False, value=""),
             )
 
-        # 생성일시 기준으로 정렬된 노드 목록 생성
-        sorted_nodes = sorted(
-            dm.nodes_data,
-            key=lambda x: x.get("created_at", "1900-01-01 00:00:00"),
-            reverse=True,
-        )
-
-        if display_index >= len(sorted_nodes):
+        node_id = _selected_record_id(rows, evt, [(0, "created_at"), (1, "title")])
+        if node_id is None:
             return (
                 "선택된 노드를 찾을 수 없습니다.",
                 "",
                 "",
                 "",
                 "",
-                -1,
+                "",
                 gr.update(visible=False),
                 gr.update(visible=False),
                 gr.update(visible=False, value=""),
             )
 
-        # 선택된 노드의 원본 인덱스 찾기
-        selected_node = sorted_nodes[display_index]
-        original_index = dm.nodes_data.index(selected_node)
-
-        node_details = get_node_details_by_index(original_index)
+        node_details = get_node_details_by_id(node_id)
         # 노드 선택시 편집/삭제 버튼 표시
         return (
             node_details[0],  # title -> selected_node_title
@@ -271,7 +309,7 @@ def handle_node_selection(evt: gr.SelectData):
             node_details[2],  # tenant -> selected_node_tenant
             node_details[3],  # tags -> selected_node_tags
             node_details[4],  # created_at -> selected_node_created_at
-            original_index,  # selected_node_index
+            node_id,  # selected_node_id
             gr.update(visible=True),  # edit_node_btn
             gr.update(visible=True),  # delete_node_btn
             gr.update(visible=False, value=""),  # node_action_status
@@ -283,16 +321,16 @@ def handle_node_selection(evt: gr.SelectData):
         "",
         "",
         "",
-        -1,
+        "",
         gr.update(visible=False),
         gr.update(visible=False),
         gr.update(visible=False, value=""),
     )
 
 
-def handle_edit_node(selected_index, title, description, tenant, tags):
+def handle_edit_node(selected_id, title, description, tenant, tags):
     """노드 편집 이벤트 처리"""
-    if selected_index < 0:
+    if not selected_id:
         return (
             gr.update(visible=True, value="❌ 편집할 노드를 선택해주세요."),
             get_nodes_dataframe(),
@@ -300,7 +338,7 @@ def handle_edit_node(selected_index, title, description, tenant, tags):
 
     try:
         result_message, updated_df = update_node(
-            selected_index, title, description, tenant, tags
+            selected_id, title, description, tenant, tags
         )
         return (
             gr.update(visible=True, value=result_message),
@@ -313,9 +351,9 @@ def handle_edit_node(selected_index, title, description, tenant, tags):
         )
 
 
-def handle_delete_node(selected_index):
+def handle_delete_node(selected_id):
     """노드 삭제 이벤트 처리"""
-    if selected_index < 0:
+    if not selected_id:
         return (
             gr.update(visible=True, value="❌ 삭제할 노드를 선택해주세요."),
             get_nodes_dataframe(),
@@ -329,7 +367,7 @@ def handle_delete_node(selected_index):
         )
 
     try:
-        result_message, updated_df = delete_node(selected_index)
+        result_message, updated_df = delete_node(selected_id)
         return (
             gr.update(visible=True, value=f"✅ {result_message}"),
             updated_df,
@@ -0,0 +1,155 @@
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import nullcontext
+
+
+def atomic_write_json(path, data, **dump_kwargs):
+    """임시 파일에 쓰고 fsync 후 원자적으로 교체 (중간에 죽어도 기존 파일 유지)"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, **dump_kwargs)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+
+class WriteBehindFlusher:
+    """
+    변경된 컬렉션을 표시만 해 두고 백그라운드 스레드에서 모아서 저장
+
+    - mark_dirty(name): 즉시 반환 (핸들러 지연이 파일 크기와 무관)
+    - delay초 동안 들어온 변경은 한 번의 쓰기로 병합
+    - 기록할 내용은 records_lock(RWLock)의 읽기 잠금 안에서 snapshot(name)으로 복사하고,
+      파일 쓰기 write(name, 복사본)는 잠금 밖에서 함 (쓰는 도중의 변경이 섞이지 않음)
+    - flush(): 지금까지 표시된 변경이 모두 기록될 때까지 대기 (종료/테스트용),
+      records_lock을 보유한 스레드가 부르면 백그라운드 스레드를 기다리는 대신 직접 기록
+    """
+
+    def __init__(self, snapshot, write, delay, records_lock=None):
+        self._snapshot = snapshot
+        self._write = write
+        self.delay = delay
+        self._records_lock = records_lock
+
+        self._cond = threading.Condition()
+        self._dirty = set()
+        self._requested = 0  # mark_dirty 호출 세대
+        self._completed = 0  # 기록이 끝난 세대
+        self._flush_now = False
+        self._error = None
+        self._thread = None
+        # 복사본 순번: 늦게 끝난 이전 복사본이 더 새 파일을 덮어쓰지 않게 함
+        self._batches = 0
+        self._written = {}  # 컬렉션 → 마지막으로 기록한 복사본 순번
+        self._in_flight = 0  # 복사했지만 아직 기록하지 않은 묶음 수
+        self._write_lock = threading.Lock()
+
+    def mark_dirty(self, name):
+        """컬렉션을 저장 대기 상태로 표시"""
+        with self._cond:
+            self._dirty.add(name)
+            self._requested += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, daemon=True)
+                self._thread.start()
+                atexit.register(self._flush_at_exit)
+            self._cond.notify_all()
+
+    def flush(self):
+        """대기 중인 변경을 즉시 기록하고 끝날 때까지 대기"""
+        with self._cond:
+            target = self._requested
+            if self._completed >= target:
+                return
+
+        if self._records_lock is not None and self._records_lock.held():
+            # 백그라운드 스레드는 이 스레드가 보유한 잠금을 기다리고 있을 수 있으므로
+            # 남은 변경을 직접 복사/기록 (이미 복사를 마친 묶음은 잠금 없이 끝남)
+            self._write_batch(*self._take_batch())
+        else:
+            with self._cond:
+                self._flush_now = True
+                self._cond.notify_all()
+
+        with self._cond:
+            while self._completed < target or self._in_flight:
+                self._cond.wait()
+            error, self._error = self._error, None
+
+        if error:
+            raise error
+
+    def _flush_at_exit(self):
+        try:
+            self.flush()
+        except Exception as e:
+            print(f"[ERROR] 종료 시 저장 실패: {e}")
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._dirty:
+                    self._cond.wait()
+
+                # 병합 구간: delay 동안 추가 변경을 모음 (flush 요청 시 즉시 진행)
+                deadline = time.monotonic() + self.delay
+                while not self._flush_now:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+            self._write_batch(*self._take_batch())
+
+    def _take_batch(self):
+        """표시된 컬렉션을 가져와 잠금 안에서 복사: (순번, 세대, {컬렉션: 복사본})"""
+        lock = self._records_lock.read() if self._records_lock else nullcontext()
+        with lock:
+            with self._cond:
+                names, self._dirty = self._dirty, set()
+                generation = self._requested
+                self._flush_now = False
+                self._batches += 1
+                batch = self._batches
+                self._in_flight += 1
+
+            snapshots, failed, error = {}, set(), None
+            for name in sorted(names):
+                try:
+                    snapshots[name] = self._snapshot(name)
+                except Exception as e:
+                    print(f"[ERROR] {name} 저장할 내용 복사 실패: {e}")
+                    failed.add(name)
+                    error = e
+        if failed:
+            with self._cond:
+                self._dirty.update(failed)
+                self._error = error
+        return batch, generation, snapshots
+
+    def _write_batch(self, batch, generation, snapshots):
+        failed, error = set(), None
+        with self._write_lock:
+            for name, data in snapshots.items():
+                if self._written.get(name, 0) > batch:
+                    continue  # 더 새 복사본이 이미 기록됨
+                try:
+                    self._write(name, data)
+                    self._written[name] = batch
+                except Exception as e:
+                    print(f"[ERROR] {name} 백그라운드 저장 실패: {e}")
+                    failed.add(name)
+                    error = e
+
+        with self._cond:
+            if failed:
+                # 다음 주기에 다시 시도
+                self._dirty.update(failed)
+                self._error = error
+            self._in_flight -= 1
+            self._completed = max(self._completed, generation)
+            self._cond.notify_all()
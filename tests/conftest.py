@@ -0,0 +1,36 @@
+import importlib
+
+import pytest
+
+
+@pytest.fixture
+def storage_mode():
+    """store가 사용할 저장 방식 (테스트에서 parametrize로 바꿈)"""
+    return "json"
+
+
+@pytest.fixture
+def write_behind_seconds():
+    """store의 백그라운드 기록 대기 시간 (기본은 즉시 기록)"""
+    return "0"
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch, storage_mode, write_behind_seconds):
+    """
+    빈 임시 디렉토리에서 새로 초기화한 src.data_manager
+
+    data_manager는 설정(GGGIS_*)을 import 시점에 읽고 모듈 전역에 상태를 두므로
+    환경 변수를 바꾼 뒤 모듈을 다시 불러옴
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("GGGIS_STORAGE_MODE", storage_mode)
+    monkeypatch.setenv("GGGIS_WRITE_BEHIND_SECONDS", write_behind_seconds)
+    import src.data_manager as dm
+    from src.result_cache import results
+
+    dm = importlib.reload(dm)
+    results.clear()
+    dm.initialize_data()
+    yield dm
+    dm.flush()
@@ -0,0 +1,145 @@
+import hashlib
+import json
+import os
+import subprocess
+import sys
+import threading
+
+import src.backup as backup
+
+
+def _tree(root):
+    digests = {}
+    for path, _, names in os.walk(root):
+        for name in names:
+            full = os.path.join(path, name)
+            with open(full, "rb") as f:
+                digests[os.path.relpath(full, root)] = hashlib.sha256(
+                    f.read()
+                ).hexdigest()
+    return digests
+
+
+def _fresh_store(monkeypatch):
+    monkeypatch.setattr(backup, "_store", None)
+    return backup.get_backup_store()
+
+
+def test_backup_and_restore_round_trip(store, monkeypatch):
+    backup_store = _fresh_store(monkeypatch)
+    store.add_node({"title": "A", "tenant": "T", "tags": ["x"]})
+    first = backup.create_backup()
+    snapshot = _tree(store.DATA_DIR)
+
+    assert backup.create_backup()["id"] is None  # 바뀐 것이 없음
+    store.add_node({"title": "B", "tenant": "T", "tags": ["y"]})
+    store.flush()
+    assert _tree(store.DATA_DIR) != snapshot
+
+    backup_store.restore(first["id"])
+    assert _tree(store.DATA_DIR) == snapshot
+    # 복사본을 두던 임시 디렉토리는 남지 않음
+    assert sorted(os.listdir(store.BACKUP_DIR)) == [
+        ".backup.lock",
+        "chunks",
+        "manifests",
+    ]
+
+
+def test_writes_are_not_blocked_while_chunks_are_stored(store, monkeypatch):
+    _fresh_store(monkeypatch)
+    store.add_node({"title": "A", "tenant": "T", "tags": ["x"]})
+
+    chunking = threading.Event()
+    release = threading.Event()
+    store_file = backup.BackupStore._store_file
+
+    def slow_store_file(self, path, stats):
+        chunking.set()
+        assert release.wait(10)
+        return store_file(self, path, stats)
+
+    monkeypatch.setattr(backup.BackupStore, "_store_file", slow_store_file)
+    result = {}
+    worker = threading.Thread(target=lambda: result.update(backup.create_backup()))
+    worker.start()
+    try:
+        assert chunking.wait(10)
+        # 청크를 저장하는 동안에도 쓰기가 잠금을 기다리지 않고 끝나야 함
+        writer = threading.Thread(
+            target=store.add_node, args=({"title": "B", "tenant": "T", "tags": []},)
+        )
+        writer.start()
+        writer.join(5)
+        assert not writer.is_alive()
+    finally:
+        release.set()
+        worker.join()
+
+    # 백업은 잠금을 잡았던 시점의 내용 (B는 다음 백업에 들어감)
+    assert result["id"]
+    assert backup.create_backup()["id"]
+
+
+WORKER = """
+import os, sys, time
+import src.backup as backup
+import src.data_manager as dm
+
+worker, rounds, workers = int(sys.argv[1]), int(sys.argv[2]), int(sys.argv[3])
+dm.initialize_data()
+owner = backup._is_scheduler_owner()
+open(os.path.join("ready", str(worker)), "w").close()
+for i in range(rounds):
+    dm.add_node({"title": f"w{worker}-{i}", "tenant": "T", "tags": []})
+    backup.create_backup()
+    backup.get_backup_store().prune(2)
+# 모든 워커가 담당 여부를 확인할 때까지 살아 있어야 잠금이 넘어가지 않음
+while len(os.listdir("ready")) < workers:
+    time.sleep(0.05)
+print(int(owner))
+"""
+
+
+def test_backups_from_multiple_workers_converge(store, tmp_path, monkeypatch):
+    workers, rounds = 4, 6
+    os.makedirs("ready")
+    env = dict(
+        os.environ,
+        GGGIS_MULTI_WORKER="1",
+        GGGIS_STORAGE_MODE="json",
+        PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    procs = [
+        subprocess.Popen(
+            [sys.executable, "-c", WORKER, str(n), str(rounds), str(workers)],
+            cwd=tmp_path,
+            env=env,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        for n in range(workers)
+    ]
+    outputs = [proc.communicate(timeout=120)[0] for proc in procs]
+    assert all(proc.returncode == 0 for proc in procs)
+    # 예약 백업 담당은 한 워커뿐
+    assert sum(int(out.split()[-1]) for out in outputs) == 1
+
+    backup_store = _fresh_store(monkeypatch)
+    backup.create_backup()
+    backup_ids = backup_store.list()
+    assert len(backup_ids) <= 3  # prune(2) 이후 마지막 백업 1개
+    # 남은 매니페스트가 가리키는 청크는 모두 있고 손상되지 않았으며 임시 파일이 없음
+    for backup_id in backup_ids:
+        for entry in backup_store.load_manifest(backup_id)["files"].values():
+            for digest in entry["chunks"]:
+                backup_store._read_chunk(digest)
+    for _, _, names in os.walk(backup_store.chunk_dir):
+        assert not [name for name in names if name.endswith(".tmp")]
+
+    target = str(tmp_path / "restored")
+    backup_store.restore(backup_ids[-1], target)
+    assert _tree(target) == _tree(store.DATA_DIR)
+    with open(os.path.join(target, "nodes_data.json"), encoding="utf-8") as f:
+        titles = {node["title"] for node in json.load(f)}
+    assert titles == {f"w{n}-{i}" for n in range(workers) for i in range(rounds)}
@@ -0,0 +1,83 @@
+from collections import deque
+
+
+def _add(dm, title):
+    return dm.add_node({"title": title, "tenant": "T", "tags": []})
+
+
+def test_changes_since_summarizes_the_feed(store):
+    start = store.get_version("nodes")
+    a = _add(store, "a")
+    b = _add(store, "b")
+    after_add = store.get_version("nodes")
+    store.edit_node(a, {"title": "a2"})
+    store.remove_node(b)
+    c = _add(store, "c")
+
+    # 구간 안에서 추가 후 삭제된 b는 나오지 않고, 추가 후 수정된 a는 추가로만 나옴
+    changes = store.changes_since("nodes", start)
+    assert changes == {
+        "version": start + 5,
+        "added": [a, c],
+        "updated": [],
+        "removed": [],
+    }
+    assert store.changes_since("nodes", after_add) == {
+        "version": start + 5,
+        "added": [c],
+        "updated": [a],
+        "removed": [b],
+    }
+    assert store.changes_since("nodes", start + 5)["added"] == []
+    assert store.changes_since("nodes", start + 6) is None
+    assert store.get_version("ideas") == 0
+
+
+def test_subscribers_see_each_change_until_unsubscribed(store):
+    seen = []
+    unsubscribe = store.subscribe(lambda *change: seen.append(change))
+    a = _add(store, "a")
+    store.edit_node(a, {"title": "a2"})
+    unsubscribe()
+    store.remove_node(a)
+
+    version = store.get_version("nodes")
+    assert seen == [
+        ("nodes", version - 2, "added", [a]),
+        ("nodes", version - 1, "updated", [a]),
+    ]
+
+
+def test_failing_subscriber_does_not_fail_the_change(store):
+    def broken(*change):
+        raise RuntimeError("boom")
+
+    unsubscribe = store.subscribe(broken)
+    try:
+        a = _add(store, "a")
+    finally:
+        unsubscribe()
+    assert store.get_node(a)["title"] == "a"
+
+
+def test_versions_pushed_out_of_the_feed_need_a_full_recompute(store, monkeypatch):
+    monkeypatch.setitem(store._change_feed, "nodes", deque(maxlen=3))
+    start = store.get_version("nodes")
+    ids = [_add(store, str(i)) for i in range(4)]
+
+    # start+1의 항목이 밀려났으므로 start 이후의 변경은 피드로 답할 수 없음
+    assert store.changes_since("nodes", start) is None
+    assert store.changes_since("nodes", start + 1)["added"] == ids[1:]
+
+
+def test_reload_from_disk_needs_a_full_recompute(store):
+    _add(store, "a")
+    before = store.get_version("nodes")
+    store.flush()
+    # 메모리와 디스크가 다른 상태에서 다시 불러오면 컬렉션 전체가 바뀐 것으로 기록
+    store.nodes_data.clear()
+    store.load_nodes()
+
+    assert store.get_version("nodes") == before + 1
+    assert store.changes_since("nodes", before) is None
+    assert store.changes_since("nodes", before + 1)["added"] == []
@@ -0,0 +1,115 @@
+import importlib
+import threading
+
+import pytest
+
+THREADS = 8
+NODES_PER_THREAD = 25
+
+
+def _worker(dm, worker, expected, errors, start):
+    """노드 생성/수정/삭제와 아이디어 생성(노드 스냅샷 + 저장)을 섞어 실행"""
+    try:
+        start.wait()
+        created = []
+        for i in range(NODES_PER_THREAD):
+            node_id = dm.add_node(
+                {
+                    "title": f"w{worker}-{i}",
+                    "tenant": f"T{worker % 3}",
+                    "tags": [f"w{worker}", f"t{i % 4}"],
+                    "created_at": "2024-01-01 00:00:00",
+                }
+            )
+            created.append(node_id)
+            if i % 3 == 0:
+                assert dm.edit_node(node_id, {"title": f"w{worker}-{i}-edited"})
+            if i % 5 == 4:
+                assert dm.remove_node(created[i - 1]) is not None
+            if i % 10 == 9:
+                nodes = dm.query_nodes("", None, [f"w{worker}"])
+                idea_id = dm.add_idea(
+                    {
+                        "title": f"idea w{worker}-{i}",
+                        "used_node_hashes": dm.store_node_snapshots(nodes),
+                        "created_at": "2024-01-01 00:00:00",
+                    }
+                )
+                expected["ideas"][idea_id] = f"idea w{worker}-{i}"
+
+        for i, node_id in enumerate(created):
+            if i % 5 == 3:
+                continue  # 위에서 삭제됨
+            title = f"w{worker}-{i}" + ("-edited" if i % 3 == 0 else "")
+            expected["nodes"][node_id] = title
+    except Exception as e:  # 메인 스레드에서 실패로 보고
+        errors.append(e)
+
+
+def _run_workers(dm):
+    expected = {"nodes": {}, "ideas": {}}
+    errors = []
+    start = threading.Barrier(THREADS)
+    threads = [
+        threading.Thread(target=_worker, args=(dm, w, expected, errors, start))
+        for w in range(THREADS)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert not errors, errors
+    return expected
+
+
+def _state(dm):
+    nodes = {node["id"]: node["title"] for node in dm.query_nodes()}
+    ideas = {row["id"]: row["title"] for row in dm.query_ideas()}
+    return nodes, ideas
+
+
+@pytest.mark.parametrize(
+    "storage_mode", ["json", "journal", "sqlite", "archive", "sharded"]
+)
+def test_concurrent_writes_are_not_lost(store):
+    expected = _run_workers(store)
+
+    deleted = NODES_PER_THREAD // 5
+    assert len(expected["nodes"]) == THREADS * (NODES_PER_THREAD - deleted)
+    assert len(expected["ideas"]) == THREADS * (NODES_PER_THREAD // 10)
+
+    nodes, ideas = _state(store)
+    assert nodes == expected["nodes"]
+    assert ideas == expected["ideas"]
+    assert store.count_nodes() == len(expected["nodes"])
+    # 아이디어가 참조한 노드 스냅샷이 모두 남아 있어야 함
+    for idea_id in ideas:
+        idea = store.get_idea(idea_id)
+        assert len(store.resolve_used_nodes(idea)) == len(idea["used_node_hashes"])
+
+    # 디스크에 기록된 내용으로 다시 불러와도 같아야 함
+    store.flush()
+    store.get_backend().close()
+    reloaded = importlib.reload(store)
+    reloaded.initialize_data()
+    assert _state(reloaded) == (expected["nodes"], expected["ideas"])
+
+
+def test_readers_see_consistent_lists_during_writes(store):
+    """쓰기 도중 읽은 목록에도 모든 노드의 필드가 온전해야 함"""
+    done = threading.Event()
+    seen = []
+
+    def read():
+        while not done.is_set():
+            for node in store.query_nodes():
+                seen.append(node["title"].startswith("w"))
+
+    reader = threading.Thread(target=read)
+    reader.start()
+    try:
+        _run_workers(store)
+    finally:
+        done.set()
+        reader.join()
+    assert seen and all(seen)
@@ -0,0 +1,27 @@
+import importlib
+
+import pytest
+
+
+@pytest.mark.parametrize("storage_mode", ["json", "journal", "sqlite"])
+def test_positions_follow_removals_and_appends(store):
+    ids = [
+        store.add_node({"title": f"n{i}", "tenant": "T", "tags": []}) for i in range(8)
+    ]
+
+    store.edit_node(ids[6], {"title": "n6-edited"})
+    assert store.remove_node(ids[2])["title"] == "n2"
+    # 삭제 위치 뒤의 노드와 새로 추가한 노드의 위치도 맞아야 같은 행이 바뀜
+    store.edit_node(ids[7], {"title": "n7-edited"})
+    ids.append(store.add_node({"title": "n8", "tenant": "T", "tags": []}))
+    assert store.remove_node(ids[0])["title"] == "n0"
+    store.edit_node(ids[8], {"title": "n8-edited"})
+    store.edit_node(ids[3], {"title": "n3-edited"})
+
+    expected = ["n1", "n3-edited", "n4", "n5", "n6-edited", "n7-edited", "n8-edited"]
+    assert [n["title"] for n in store.get_nodes_data()] == expected
+
+    store.flush()
+    dm = importlib.reload(store)
+    dm.initialize_data()
+    assert [n["title"] for n in dm.get_nodes_data()] == expected
@@ -0,0 +1,101 @@
+import threading
+import time
+
+from src.event_coalescer import EventCoalescer
+
+
+def test_lone_event_computes_without_waiting():
+    coalescer = EventCoalescer(10)
+    start = time.perf_counter()
+    assert coalescer.run("k", lambda: "value", "skip") == "value"
+    assert time.perf_counter() - start < 1
+    assert coalescer.stats() == {
+        "computed": 1,
+        "coalesced": 0,
+        "dropped": 0,
+        "pending": 0,
+    }
+
+
+def test_events_during_a_compute_rerun_once_with_the_latest_value():
+    coalescer = EventCoalescer(0.05)
+    release = threading.Event()
+    computed = []
+    results = {}
+
+    def compute(value):
+        computed.append(value)
+        if value == 0:
+            assert release.wait(10)
+        return value
+
+    def call(value):
+        results[value] = coalescer.run("k", lambda: compute(value), "skip")
+
+    threads = [threading.Thread(target=call, args=(value,)) for value in range(4)]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.05)  # 0이 먼저 계산을 시작하고 1, 2, 3이 차례로 들어옴
+    release.set()
+    for thread in threads:
+        thread.join(10)
+
+    # 0은 단독 이벤트로 바로 계산했지만 더 새 값이 있어 버리고, 계산 중에 몰린
+    # 1, 2, 3은 3만 한 번 계산
+    assert computed == [0, 3]
+    assert results == {0: "skip", 1: "skip", 2: "skip", 3: 3}
+    assert coalescer.stats() == {
+        "computed": 1,
+        "coalesced": 2,
+        "dropped": 1,
+        "pending": 0,
+    }
+
+
+def test_burst_right_after_a_compute_is_merged():
+    coalescer = EventCoalescer(0.3)
+    computed = []
+    results = {}
+
+    def call(value):
+        results[value] = coalescer.run(
+            "k", lambda: computed.append(value) or value, "skip"
+        )
+
+    call("a")
+    # 계산이 끝난 직후 window 안에 몰린 변경도 마지막 값 한 번만 계산
+    threads = [threading.Thread(target=call, args=(value,)) for value in "bcd"]
+    for thread in threads:
+        thread.start()
+        time.sleep(0.03)
+    for thread in threads:
+        thread.join(10)
+
+    assert computed == ["a", "d"]
+    assert results == {"a": "a", "b": "skip", "c": "skip", "d": "d"}
+    assert coalescer.stats()["pending"] == 0
+
+
+def test_idle_keys_are_cleaned_up():
+    coalescer = EventCoalescer(0.01)
+    for session in range(5):
+        coalescer.run(session, lambda: None)
+    time.sleep(0.05)
+    coalescer.run("new", lambda: None)
+    assert list(coalescer._keys) == ["new"]
+
+
+def test_keys_are_independent():
+    coalescer = EventCoalescer(0.05)
+    release = threading.Event()
+    blocked = threading.Thread(
+        target=coalescer.run, args=("a", lambda: release.wait(10))
+    )
+    blocked.start()
+    time.sleep(0.05)
+    try:
+        # 다른 묶음은 "a"의 계산을 기다리지 않음
+        assert coalescer.run("b", lambda: "b") == "b"
+    finally:
+        release.set()
+        blocked.join()
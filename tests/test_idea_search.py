@@ -0,0 +1,93 @@
+import time
+
+import pytest
+
+import src.node_search as node_search
+from src.node_search import TextIndex
+
+IDEAS = [
+    ("스마트 팜", "센서 네트워크로 온실을 관리"),
+    ("교통 분석", "버스 승하차 데이터 분석"),
+    ("해양 감시", "IoT 센서 네트워크와 드론"),
+    ("센서 교육", "학생용 센서 키트"),
+]
+
+
+def _add_ideas(dm):
+    return [
+        dm.add_idea(
+            {
+                "title": title,
+                "contest_info": {"title": "공모전"},
+                "solution": solution,
+                "created_at": f"2024-01-0{i + 1} 00:00:00",
+            }
+        )
+        for i, (title, solution) in enumerate(IDEAS)
+    ]
+
+
+@pytest.mark.parametrize("storage_mode", ["json", "archive"])
+def test_idea_index_reads_bodies_only_for_the_result_page(store, monkeypatch):
+    ids = _add_ideas(store)
+    store.query_ideas("센서")  # 색인 생성
+    assert store._idea_text_index._texts == []
+
+    backend = store.get_backend()
+    reads = []
+    read = backend.read
+    monkeypatch.setattr(
+        backend, "read", lambda name, idea: reads.append(idea["id"]) or read(name, idea)
+    )
+    rows = store.query_ideas("센서 네트워크", limit=1)
+    # 후보 2건 중 첫 페이지 1건만 확인 (+ 발췌)
+    assert [row["id"] for row in rows] in ([ids[0]], [ids[2]])
+    assert len(set(reads)) == 1
+    assert "【센서】" in rows[0]["snippet"]
+
+    assert [row["id"] for row in store.query_ideas("센서 키트")] == [ids[3]]
+
+
+@pytest.mark.parametrize("storage_mode", ["archive"])
+def test_archive_mode_skips_the_eager_idea_warmup(store):
+    _add_ideas(store)
+    store.start_search_index_warmup()
+    deadline = time.monotonic() + 5
+    while not store._node_text_index.built and time.monotonic() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.1)
+    assert store._node_text_index.built
+    assert not store._idea_text_index.built
+    assert len(store.query_ideas("센서")) == 3
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_compaction_keeps_search_results(monkeypatch, lazy):
+    monkeypatch.setattr(node_search, "COMPACT_MIN_DEAD", 2)
+    docs = {f"d{i}": [f"제목{i}", f"센서 {i % 3} 네트워크"] for i in range(6)}
+    read_fields = docs.__getitem__ if lazy else None
+    index = TextIndex((2, 1), read_fields=read_fields)
+    index.ensure_built(docs.items())
+    for i in range(6):
+        docs[f"d{i}"] = [f"제목{i}", f"센서 {i % 2} 네트워크"]
+        index.add(f"d{i}", docs[f"d{i}"])
+    index.remove("d5")
+    del docs["d5"]
+
+    fresh = TextIndex((2, 1))
+    fresh.ensure_built(docs.items())
+    assert len(index._ids) == len(docs)  # 재구성됨
+    for text in ("센서 네트워크", "제목3", "네트"):
+        assert index.search(text) == fresh.search(text)
+    # 한 글자 검색어는 텍스트 없이 점수를 매기지 않으므로 결과 집합만 같음
+    assert sorted(doc_id for doc_id, _ in index.search("1")) == ["d1", "d3"]
+
+
+def test_lazy_index_verifies_that_words_are_contiguous():
+    docs = {"a": ["데이터 터데"], "b": ["터데이터"]}
+    index = TextIndex((1,), read_fields=docs.__getitem__)
+    index.ensure_built(docs.items())
+
+    # "a"에도 "터데", "데이" gram이 모두 있지만 이어져 있지 않음
+    assert [doc_id for doc_id, _ in index.search("터데이")] == ["b"]
+    assert index._texts == []
@@ -0,0 +1,91 @@
+import json
+
+import pytest
+
+from src.journal import Journal
+
+
+def _journal(tmp_path, records):
+    return Journal("nodes", str(tmp_path), lambda: records, 1 << 30)
+
+
+def _write_log(journal, lines):
+    with open(journal.log_path, "w", encoding="utf-8") as f:
+        for line in lines:
+            f.write(line if isinstance(line, str) else json.dumps(line))
+            f.write("\n")
+
+
+def _quarantined(journal):
+    with open(journal.quarantine_path, encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_replay_after_corrupt_line_addresses_records_by_id(tmp_path):
+    journal = _journal(tmp_path, [])
+    _write_log(
+        journal,
+        [
+            {"seq": 1, "op": "append", "record": {"id": "a", "title": "A"}},
+            '{"seq": 2, "op": "append", "record": {"id": "b", "ti',
+            {"seq": 3, "op": "append", "record": {"id": "c", "title": "C"}},
+            # b가 빠졌으므로 위치 2는 없음: ID로 c를 찾아야 함
+            {"seq": 4, "op": "update", "index": 2, "id": "c", "fields": {"x": 1}},
+            {"seq": 5, "op": "delete", "index": 0, "id": "a"},
+        ],
+    )
+
+    records = journal.load()
+
+    assert records == [{"id": "c", "title": "C", "x": 1}]
+    assert journal.seq == 5
+    assert [entry["offset"] for entry in _quarantined(journal)] == [
+        len(json.dumps({"seq": 1, "op": "append", "record": {"id": "a", "title": "A"}}))
+        + 1
+    ]
+
+
+def test_replay_stops_at_positional_ops_after_corrupt_line(tmp_path):
+    journal = _journal(tmp_path, [])
+    _write_log(
+        journal,
+        [
+            {"seq": 1, "op": "append", "record": {"title": "A"}},
+            "{broken",
+            {"seq": 3, "op": "append", "record": {"title": "C"}},
+            {"seq": 4, "op": "update", "index": 1, "fields": {"x": 1}},
+            {"seq": 5, "op": "append", "record": {"title": "D"}},
+        ],
+    )
+
+    records = journal.load()
+
+    # 위치 기반 수정부터는 적용하지 않고 격리
+    assert records == [{"title": "A"}, {"title": "C"}]
+    assert [entry["error"] for entry in _quarantined(journal)][1:] == [
+        "재생 중단 이후",
+        "재생 중단 이후",
+    ]
+    # 현재 상태를 스냅샷으로 쓰고 저널을 비워 다음 재생이 같은 결과가 되도록 함
+    with open(journal.log_path, encoding="utf-8") as f:
+        assert f.read() == ""
+    assert _journal(tmp_path, []).load() == records
+
+
+@pytest.mark.parametrize("storage_mode", ["journal"])
+def test_update_and_delete_entries_carry_record_ids(store):
+    node_id = store.add_node({"title": "A", "tenant": "T", "tags": []})
+    other_id = store.add_node({"title": "B", "tenant": "T", "tags": []})
+    store.edit_node(other_id, {"title": "B2"})
+    store.remove_node(node_id)
+
+    journal = store.get_backend().journal("nodes")
+    with open(journal.log_path, encoding="utf-8") as f:
+        entries = [json.loads(line) for line in f]
+
+    assert [(e["op"], e.get("id")) for e in entries] == [
+        ("append", None),
+        ("append", None),
+        ("update", other_id),
+        ("delete", node_id),
+    ]
@@ -0,0 +1,124 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+WORKERS = 3
+ROUNDS = 30
+
+WORKER = """
+import json, sys
+import src.data_manager as dm
+
+def view():
+    # 샤드 방식은 아직 불러오지 않은 샤드까지 모두 메모리에 올림
+    dm._ensure_nodes_loaded()
+    nodes = sorted(
+        (n["id"], n["title"], n["tenant"]) for n in dm.get_nodes_data()
+    )
+    ideas = sorted((i["id"], i["title"]) for i in dm.get_ideas_data())
+    return {"nodes": nodes, "ideas": ideas}
+
+worker, rounds = int(sys.argv[1]), int(sys.argv[2])
+dm.initialize_data()
+nodes, ideas = [], []
+for i in range(rounds):
+    nodes.append(
+        dm.add_node({"title": f"w{worker}-{i}", "tenant": f"T{i % 3}", "tags": []})
+    )
+    ideas.append(
+        dm.add_idea(
+            {
+                "title": f"w{worker}-{i}",
+                "contest_info": {"title": "C"},
+                "created_at": "2024-01-01 00:00:00",
+            }
+        )
+    )
+    if i % 3 == 1:
+        edited = {"title": f"w{worker}-{i - 1}-edited", "tenant": "T9"}
+        assert dm.edit_node(nodes[i - 1], edited)
+    if i % 3 == 2:
+        assert dm.remove_node(nodes[i]) is not None
+        assert dm.remove_idea(ideas[i - 1]) is not None
+dm.flush()
+if worker < 0:
+    print(json.dumps(view()))
+    sys.exit()
+print("done", flush=True)
+sys.stdin.readline()  # 모든 워커가 변경을 마칠 때까지 대기
+dm.reload_if_changed("nodes")
+dm.reload_if_changed("ideas")
+print(json.dumps(view()), flush=True)
+"""
+
+
+def _spawn(tmp_path, env, worker, rounds):
+    return subprocess.Popen(
+        [sys.executable, "-c", WORKER, str(worker), str(rounds)],
+        cwd=tmp_path,
+        env=env,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+
+
+def _titles(view):
+    return (
+        sorted((title, tenant) for _, title, tenant in view["nodes"]),
+        sorted(title for _, title in view["ideas"]),
+    )
+
+
+@pytest.mark.parametrize("mode", ["json", "journal", "sqlite", "archive", "sharded"])
+def test_workers_converge_on_the_same_view(tmp_path, mode):
+    env = dict(
+        os.environ,
+        GGGIS_MULTI_WORKER="1",
+        GGGIS_STORAGE_MODE=mode,
+        # 저널 압축도 워커들이 변경하는 도중에 일어나도록 작게 설정
+        GGGIS_JOURNAL_COMPACT_BYTES="4000",
+        PYTHONPATH=os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    )
+    procs = [_spawn(tmp_path, env, n, ROUNDS) for n in range(WORKERS)]
+    try:
+        for proc in procs:
+            # [INFO] 등 앞선 출력은 건너뜀
+            for line in proc.stdout:
+                if line.strip() == "done":
+                    break
+            else:
+                pytest.fail(f"워커가 변경 도중 종료됨 (종료 코드 {proc.wait()})")
+        views = [proc.communicate("\n", timeout=120)[0] for proc in procs]
+    finally:
+        for proc in procs:
+            proc.kill()
+    assert all(proc.returncode == 0 for proc in procs)
+    views = [json.loads(out.strip().splitlines()[-1]) for out in views]
+
+    # 디스크 상태: 변경 없이 새로 불러온 프로세스의 내용
+    fresh = subprocess.run(
+        [sys.executable, "-c", WORKER, "-1", "0"],
+        cwd=tmp_path,
+        env=env,
+        capture_output=True,
+        text=True,
+        timeout=120,
+    )
+    assert fresh.returncode == 0, fresh.stderr
+    on_disk = json.loads(fresh.stdout.strip().splitlines()[-1])
+
+    assert all(view == on_disk for view in views)
+    expected_nodes = sorted(
+        (f"w{w}-{i}-edited", "T9") if i % 3 == 0 else (f"w{w}-{i}", f"T{i % 3}")
+        for w in range(WORKERS)
+        for i in range(ROUNDS)
+        if i % 3 != 2
+    )
+    expected_ideas = sorted(
+        f"w{w}-{i}" for w in range(WORKERS) for i in range(ROUNDS) if i % 3 != 1
+    )
+    assert _titles(on_disk) == (expected_nodes, expected_ideas)
@@ -0,0 +1,100 @@
+import time
+from datetime import datetime
+
+import pytest
+import pytz
+
+from src.node_history import NodeHistoryStore
+
+KST = pytz.timezone("Asia/Seoul")
+
+
+@pytest.fixture
+def utc_host(monkeypatch):
+    """서버 시간대가 한국이 아닌 환경 (TZ=UTC)"""
+    monkeypatch.setenv("TZ", "UTC")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
+
+
+def test_node_as_of_idea_created_at_on_utc_host(utc_host, store):
+    node_id = store.add_node({"title": "처음", "tenant": "T", "tags": []})
+    time.sleep(1.1)  # 리비전 시각은 초 단위
+    idea_created_at = datetime.now(KST).strftime("%Y-%m-%d %H:%M:%S")
+    time.sleep(1.1)
+    store.edit_node(node_id, {"title": "수정"})
+
+    assert store.node_as_of(node_id, idea_created_at)["title"] == "처음"
+    assert store.node_as_of(node_id, datetime.now(pytz.utc))["title"] == "수정"
+    # 리비전 시각도 아이디어와 같은 한국 시간으로 기록됨
+    revisions = store.node_revisions(node_id)
+    assert revisions[0]["at"] <= idea_created_at < revisions[1]["at"]
+
+
+def _write_revisions(history, count=25):
+    """리비전 1(생성)~count(수정)을 기록하고 리비전별 노드 사본 반환"""
+    node = {"id": "n1", "title": "r1", "tenant": "T", "tags": ["a"]}
+    history.record_created(node)
+    snapshots = {1: dict(node)}
+    for rev in range(2, count + 1):
+        previous = node
+        node = dict(node, title=f"r{rev}", tags=["a", f"t{rev % 3}"])
+        # memo는 4의 배수 리비전에 생기고 바로 다음 리비전에 사라짐 (delta의 unset)
+        if rev % 4 == 0:
+            node["memo"] = f"m{rev}"
+        else:
+            node.pop("memo", None)
+        history.record_updated(previous, node)
+        snapshots[rev] = dict(node)
+    return snapshots
+
+
+def test_revisions_rebuild_from_checkpoints_and_deltas(tmp_path):
+    history = NodeHistoryStore(str(tmp_path))
+    snapshots = _write_revisions(history)
+
+    checkpoints = [rev for rev, _, _, checkpoint in history._index["n1"] if checkpoint]
+    assert checkpoints == [1, 11, 21]
+    for rev in (1, 9, 10, 11, 25):
+        assert history.node_at_revision("n1", rev) == snapshots[rev], rev
+
+    # 새로 연 저장소도 파일만으로 같은 리비전을 복원
+    reopened = NodeHistoryStore(str(tmp_path))
+    for rev in (1, 9, 10, 11, 25):
+        assert reopened.node_at_revision("n1", rev) == snapshots[rev], rev
+    assert reopened.node_at_revision("n1", 26) is None
+
+
+def test_deleted_revision_rebuilds_as_none(tmp_path):
+    history = NodeHistoryStore(str(tmp_path))
+    snapshots = _write_revisions(history)
+    history.record_deleted(snapshots[25])
+
+    assert [r["op"] for r in history.revisions("n1")[-2:]] == ["updated", "deleted"]
+    assert history.node_at_revision("n1", 26) is None
+    assert history.node_at_revision("n1", 25) == snapshots[25]
+
+
+def test_diff_between_revisions(tmp_path):
+    history = NodeHistoryStore(str(tmp_path))
+    _write_revisions(history)
+
+    # 체크포인트(11)를 사이에 둔 두 리비전, 태그는 같은 값이라 빠짐
+    assert history.diff("n1", 9, 12) == {
+        "memo": (None, "m12"),
+        "title": ("r9", "r12"),
+    }
+    assert history.diff("n1", 12, 13) == {
+        "memo": ("m12", None),
+        "tags": (["a", "t0"], ["a", "t1"]),
+        "title": ("r12", "r13"),
+    }
+    # 없는 리비전은 빈 노드로 취급
+    assert history.diff("n1", 0, 1) == {
+        "id": (None, "n1"),
+        "tags": (None, ["a"]),
+        "tenant": (None, "T"),
+        "title": (None, "r1"),
+    }
@@ -0,0 +1,54 @@
+from src.result_cache import ResultCache
+
+
+def test_version_change_drops_that_collections_entries():
+    cache = ResultCache(8)
+    cache.get_or_compute("nodes", 1, "f", ("a",), lambda: "nodes v1")
+    cache.get_or_compute("ideas", 1, "g", (), lambda: "ideas v1")
+    assert cache.stats()["size"] == 2
+
+    assert (
+        cache.get_or_compute("nodes", 2, "f", ("a",), lambda: "nodes v2") == "nodes v2"
+    )
+    # nodes의 이전 버전 항목만 비우고 ideas 항목은 유지
+    assert cache.stats()["size"] == 2
+    assert cache.get_or_compute("ideas", 1, "g", (), lambda: "again") == "ideas v1"
+    assert cache.get_or_compute("nodes", 1, "f", ("a",), lambda: "recomputed") == (
+        "recomputed"
+    )
+
+
+def test_results_computed_for_an_older_version_are_not_stored():
+    cache = ResultCache(8)
+    cache.get_or_compute("nodes", 3, "f", (), lambda: "v3")
+    cache.get_or_compute("nodes", 2, "f", (), lambda: "v2")
+
+    assert cache.stats()["size"] == 1
+    assert cache.get_or_compute("nodes", 3, "f", (), lambda: "again") == "v3"
+
+
+def test_least_recently_used_entries_are_evicted_and_counted():
+    cache = ResultCache(2)
+    for key in ("a", "b"):
+        cache.get_or_compute("nodes", 1, "f", (key,), lambda: key)
+    cache.get_or_compute("nodes", 1, "f", ("a",), lambda: "again")
+    cache.get_or_compute("nodes", 1, "f", ("c",), lambda: "c")
+
+    assert cache.get_or_compute("nodes", 1, "f", ("a",), lambda: "again") == "a"
+    assert cache.get_or_compute("nodes", 1, "f", ("b",), lambda: "b2") == "b2"
+    stats = cache.stats()["functions"]["f"]
+    assert stats == {"hits": 2, "misses": 4, "evictions": 2, "hit_rate": 0.333}
+
+
+def test_cached_tables_follow_store_changes(store):
+    from src.idea_functions import get_filtered_nodes
+    from src.result_cache import cache_stats
+
+    store.add_node({"title": "a", "tenant": "T", "tags": ["x"]})
+    first = get_filtered_nodes("", ["T"], None)
+    # 같은 필터는 정규화한 키로 재사용 (빈 검색어/공백, 선택 순서)
+    assert get_filtered_nodes(" ", ["T", "T"]) == first
+    assert cache_stats()["functions"]["get_filtered_nodes"]["hits"] == 1
+
+    store.add_node({"title": "b", "tenant": "T", "tags": []})
+    assert sorted(n["title"] for n in get_filtered_nodes("", ["T"])) == ["a", "b"]
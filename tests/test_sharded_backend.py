@@ -0,0 +1,129 @@
+import importlib
+import json
+
+import pytest
+
+NODES = [
+    ("A", "국민대", ["AI", "데이터"]),
+    ("B", "국민대", ["AI"]),
+    ("C", "서울시", ["데이터", "교통"]),
+    ("D", "서울시", ["AI", "교통"]),
+    ("E", "부산시", ["해양"]),
+]
+
+
+def _reopen(dm):
+    """같은 data 디렉토리로 새로 시작 (샤드는 아직 하나도 불러오지 않은 상태)"""
+    dm.flush()
+    dm = importlib.reload(dm)
+    dm.initialize_data()
+    return dm
+
+
+@pytest.fixture
+def sharded(store):
+    for title, tenant, tags in NODES:
+        store.add_node({"title": title, "tenant": tenant, "tags": tags})
+    return _reopen(store)
+
+
+def _manifest_answers(dm):
+    return (
+        dm.count_nodes(),
+        dm.all_tenants(),
+        dm.all_tags(),
+        dm.node_facet_counts(),
+        dm.node_facet_counts("", ["서울시", "부산시"]),
+        dm.suggest_tags("교"),
+        dm.suggest_tags("데이타"),
+        dm.canonical_tag("ai"),
+    )
+
+
+@pytest.mark.parametrize("storage_mode", ["sharded"])
+def test_counts_and_suggestions_come_from_the_manifest(sharded):
+    backend = sharded.get_backend()
+
+    from_manifest = _manifest_answers(sharded)
+    assert backend.has_unloaded("nodes")
+    assert not sharded.get_nodes_data()
+
+    # 모든 샤드를 불러온 뒤 메모리 색인으로 계산한 값과 같아야 함
+    assert len(sharded.query_nodes()) == len(NODES)
+    assert not backend.has_unloaded("nodes")
+    assert _manifest_answers(sharded) == from_manifest
+
+    assert from_manifest[3]["tenants"] == {"국민대": 2, "부산시": 1, "서울시": 2}
+    assert from_manifest[4]["tags"] == {
+        "AI": 1,
+        "교통": 2,
+        "데이터": 1,
+        "해양": 1,
+    }
+    assert from_manifest[5] == [("교통", 2)]
+    assert from_manifest[6][0] == ("데이터", 2)
+
+
+@pytest.mark.parametrize("storage_mode", ["sharded"])
+def test_manifest_counts_follow_writes_without_loading_other_shards(sharded):
+    sharded.add_node({"title": "F", "tenant": "부산시", "tags": ["해양", "AI"]})
+
+    backend = sharded.get_backend()
+    assert backend.has_unloaded("nodes", ["국민대"])
+    assert sharded.node_facet_counts()["tags"]["AI"] == 4
+    assert sharded.suggest_tags("해")[0] == ("해양", 2)
+
+
+@pytest.mark.parametrize("storage_mode", ["sharded"])
+def test_old_manifest_without_tag_counts_is_upgraded(sharded):
+    manifest_path = sharded.get_backend().manifest_path
+    with open(manifest_path, encoding="utf-8") as f:
+        manifest = json.load(f)
+    for entry in manifest.values():
+        del entry["tag_counts"]
+    with open(manifest_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f)
+
+    dm = _reopen(sharded)
+
+    assert dm.node_facet_counts()["tags"]["AI"] == 3
+    with open(manifest_path, encoding="utf-8") as f:
+        assert all("tag_counts" in entry for entry in json.load(f).values())
+
+
+@pytest.mark.parametrize("storage_mode", ["sharded"])
+def test_writes_to_an_unloaded_shard_load_it_through_the_store(sharded):
+    backend = sharded.get_backend()
+    new_id = sharded.add_node({"title": "F", "tenant": "부산시", "tags": []})
+
+    # 기존 부산시 노드도 ID 맵/색인에 등록된 상태로 올라옴
+    assert backend.has_unloaded("nodes", ["국민대"])
+    titles = sorted(n["title"] for n in sharded.query_nodes("", ["부산시"]))
+    assert titles == ["E", "F"]
+    existing = next(n for n in sharded.get_nodes_data() if n["title"] == "E")
+    assert sharded.get_node(existing["id"])["title"] == "E"
+
+    sharded.edit_node(new_id, {"tenant": "국민대"})
+    dm = _reopen(sharded)
+    assert dm.get_backend().tenant_counts() == {"국민대": 3, "서울시": 2, "부산시": 1}
+
+
+@pytest.mark.parametrize("storage_mode", ["sharded"])
+def test_changing_an_unloaded_shard_directly_is_refused(sharded):
+    backend = sharded.get_backend()
+    with pytest.raises(RuntimeError):
+        backend.append("nodes", {"title": "F", "tenant": "국민대", "tags": []})
+    assert backend.tenant_counts()["국민대"] == 2
+
+
+@pytest.mark.parametrize("storage_mode", ["sharded"])
+def test_shard_writes_only_visit_their_own_tenant(sharded, monkeypatch):
+    sharded.query_nodes()
+
+    def no_full_scan(name):
+        raise AssertionError("샤드 쓰기가 전체 노드를 훑었습니다.")
+
+    monkeypatch.setattr(sharded.get_backend(), "get_records", no_full_scan)
+    sharded.add_node({"title": "F", "tenant": "부산시", "tags": ["해양"]})
+    sharded.flush()
+    assert sharded.get_backend().tenant_counts()["부산시"] == 2
@@ -0,0 +1,119 @@
+import sqlite3
+
+import pytest
+
+from src.sqlite_backend import SqliteBackend
+from src.storage import StorageBackend
+
+
+@pytest.mark.parametrize("storage_mode", ["sqlite"])
+def test_changes_survive_reopen(store):
+    first = store.add_node({"title": "A", "tenant": "T1", "tags": ["x"]})
+    second = store.add_node({"title": "B", "tenant": "T2", "tags": ["y"]})
+    store.edit_node(second, {"title": "B2", "tags": ["y", "z"]})
+    store.remove_node(first)
+    store.get_backend().close()
+
+    backend = SqliteBackend(store.DATA_DIR, lambda name: [])
+    nodes = backend.load("nodes")
+
+    assert [(n["id"], n["title"], n["tags"]) for n in nodes] == [
+        (second, "B2", ["y", "z"])
+    ]
+
+
+def test_backfills_tag_table_for_databases_without_it(tmp_path):
+    path = tmp_path / "gggis.sqlite3"
+    conn = sqlite3.connect(path)
+    conn.executescript("""
+        CREATE TABLE nodes (id INTEGER PRIMARY KEY AUTOINCREMENT, title TEXT NOT NULL
+            DEFAULT '', tenant TEXT, created_at TEXT, data TEXT NOT NULL);
+        INSERT INTO nodes (title, tenant, data) VALUES
+            ('A', 'T', '{"id": "a", "title": "A", "tenant": "T", "tags": ["x"]}');
+        """)
+    conn.commit()
+    conn.close()
+
+    backend = SqliteBackend(str(tmp_path), lambda name: [])
+
+    assert backend.query_nodes(selected_tags=["x"]) == [
+        {"id": "a", "title": "A", "tenant": "T", "tags": ["x"]}
+    ]
+
+
+def _make_nodes(store):
+    ids = []
+    for k in range(60):
+        ids.append(
+            store.add_node(
+                {
+                    "title": f"노드 {k} {'Data' if k % 4 == 0 else '분석'}",
+                    "description": "",
+                    "tenant": f"T{k % 5}",
+                    "tags": [f"태그{k % 7}", f"태그{k % 3}"],
+                    "created_at": f"2026-01-{k % 28 + 1:02d} 10:00:00",
+                }
+            )
+        )
+    for node_id in ids[::6]:
+        store.edit_node(node_id, {"tenant": "T9", "tags": ["태그1", "새 태그"]})
+    for node_id in ids[1::9]:
+        store.remove_node(node_id)
+
+
+FILTERS = [
+    {},
+    {"selected_tenants": ["T1", "T9"]},
+    {"selected_tags": ["태그1"]},
+    {"selected_tenants": ["T2"], "selected_tags": ["태그0", "새 태그"]},
+    {"created_from": "2026-01-05 00:00:00", "created_to": "2026-01-12 23:59:59"},
+    {"selected_tags": ["태그2"], "created_from": "2026-01-20 00:00:00"},
+    {"selected_tenants": ["T0", "T1", "T9"], "limit": 7, "offset": 5},
+    {"selected_tenants": ["없는 테넌트"]},
+]
+
+
+@pytest.mark.parametrize("storage_mode", ["sqlite"])
+@pytest.mark.parametrize("filters", FILTERS)
+def test_sql_filters_match_the_in_memory_path(store, monkeypatch, filters):
+    _make_nodes(store)
+    backend = store.get_backend()
+    calls = []
+    query_nodes = backend.query_nodes
+
+    def spy(*args, **kwargs):
+        calls.append(len(args) > 5 and args[5] is not None)
+        return query_nodes(*args, **kwargs)
+
+    monkeypatch.setattr(backend, "query_nodes", spy)
+    pushed_down = store.query_nodes(**filters)
+    # 검색어가 없으면 메모리 후보 목록 없이 SQL에 맡김
+    assert calls == [False]
+
+    # 같은 조건을 메모리 역색인 경로(다른 저장 방식과 같은 처리)로 계산
+    monkeypatch.setattr(backend, "filters_in_storage", False)
+    in_memory = store.query_nodes(**filters)
+    assert pushed_down == in_memory
+    assert pushed_down == StorageBackend.query_nodes(backend, **filters)
+
+
+@pytest.mark.parametrize("storage_mode", ["sqlite"])
+def test_node_filters_use_indexes(store):
+    backend = store.get_backend()
+    plans = {}
+    for name, sql, params in [
+        ("tenant", "SELECT data FROM nodes WHERE tenant IN (?)", ["T1"]),
+        (
+            "tag",
+            "SELECT data FROM nodes WHERE id IN "
+            "(SELECT node_id FROM node_tags WHERE tag IN (?))",
+            ["x"],
+        ),
+        ("created_at", "SELECT data FROM nodes WHERE created_at >= ?", ["2026"]),
+    ]:
+        rows = backend._conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+        plans[name] = " ".join(row[-1] for row in rows)
+
+    assert "idx_nodes_tenant" in plans["tenant"]
+    assert "node_tags" in plans["tag"] and "USING" in plans["tag"]
+    assert "idx_nodes_created_at" in plans["created_at"]
@@ -0,0 +1,48 @@
+import pytest
+
+from src.tag_query import compile_query, is_tag_query
+
+
+@pytest.mark.parametrize(
+    "text",
+    ["R&D", "설명!", '"닫히지 않은 따옴표', "(AI OR", "AI &", "머신러닝 데이터"],
+)
+def test_plain_text_is_not_a_query(text):
+    assert not is_tag_query(text)
+
+
+@pytest.mark.parametrize(
+    "text, normalized",
+    [
+        ("(AI OR 데이터) AND NOT 하드웨어", "(AI OR 데이터) AND NOT 하드웨어"),
+        ("AI & !하드웨어", "AI AND NOT 하드웨어"),
+        ("tenant:국민대 R&D", 'tenant:국민대 AND "R&D"'),
+        ('제목:"스마트 팜"', 'title:"스마트 팜"'),
+    ],
+)
+def test_queries(text, normalized):
+    assert is_tag_query(text)
+    assert compile_query(text).text == normalized
+
+
+def test_symbols_inside_words_search_text(store):
+    from src.node_functions import filter_nodes_multi, get_nodes_dataframe
+
+    store.add_node({"title": "R&D 센터", "description": "설명!", "tenant": "T"})
+    store.add_node({"title": "다른 노드", "description": "", "tenant": "T"})
+
+    assert list(get_nodes_dataframe("R&D")["노드 이름"]) == ["R&D 센터"]
+    df, _, _ = filter_nodes_multi("설명!", [], [])
+    assert list(df["value"]["노드 이름"]) == ["R&D 센터"]
+
+
+def test_text_that_is_not_a_query_is_searched_as_text(store):
+    from src.node_functions import filter_nodes_multi
+
+    store.add_node({"title": "AI (베타", "tags": ["AI"], "tenant": "T"})
+    store.add_node({"title": "다른 노드", "tags": ["AI"], "tenant": "T"})
+
+    # 닫히지 않은 괄호는 쿼리 오류 대신 전문 검색으로 처리
+    assert store.normalized_tag_query("AI (베타") == ""
+    df, _, _ = filter_nodes_multi("AI (베타", [], [])
+    assert list(df["value"]["노드 이름"]) == ["AI (베타"]
@@ -0,0 +1,90 @@
+import json
+import os
+import threading
+
+import pytest
+
+from src.rwlock import RWLock
+from src.write_behind import WriteBehindFlusher
+
+
+def test_snapshot_under_lock_and_write_outside():
+    lock = RWLock()
+    records = [1, 2, 3]
+    seen = []
+
+    def snapshot(name):
+        seen.append(("snapshot", lock.held()))
+        return list(records)
+
+    def write(name, data):
+        seen.append(("write", lock.held()))
+        written.append(data)
+
+    written = []
+    flusher = WriteBehindFlusher(snapshot, write, 0.01, lock)
+    flusher.mark_dirty("nodes")
+    flusher.flush()
+
+    assert seen == [("snapshot", True), ("write", False)]
+    assert written == [[1, 2, 3]]
+
+
+def test_flush_while_holding_the_lock_writes_directly():
+    lock = RWLock()
+    records = []
+    written = []
+    flusher = WriteBehindFlusher(
+        lambda name: list(records), lambda name, data: written.append(data), 5, lock
+    )
+
+    def mutate_and_flush():
+        with lock.write():
+            records.append("a")
+            flusher.mark_dirty("nodes")
+            # 백그라운드 스레드는 이 잠금을 기다리므로 직접 기록해야 끝남
+            flusher.flush()
+
+    worker = threading.Thread(target=mutate_and_flush)
+    worker.start()
+    worker.join(5)
+    assert not worker.is_alive()
+    assert written[-1] == ["a"]
+
+
+@pytest.mark.parametrize("storage_mode", ["json", "sharded"])
+@pytest.mark.parametrize("write_behind_seconds", ["0.01"])
+def test_background_writes_match_memory_after_concurrent_changes(store):
+    def churn(worker):
+        ids = []
+        for k in range(60):
+            ids.append(
+                store.add_node(
+                    {"title": f"{worker}-{k}", "tenant": f"T{k % 3}", "tags": []}
+                )
+            )
+            if k % 3 == 2:
+                store.remove_node(ids.pop(0))
+
+    threads = [threading.Thread(target=churn, args=(w,)) for w in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    store.flush()
+
+    expected = sorted(node["title"] for node in store.nodes_data)
+    assert len(expected) == 4 * 40
+    if store.STORAGE_MODE == "json":
+        with open(
+            os.path.join(store.DATA_DIR, "nodes_data.json"), encoding="utf-8"
+        ) as f:
+            on_disk = [node["title"] for node in json.load(f)]
+    else:
+        backend = store.get_backend()
+        on_disk = [
+            node["title"]
+            for tenant in backend.manifest
+            for node in backend._read_shard(tenant)
+        ]
+    assert sorted(on_disk) == expected